@@ -1,25 +1,32 @@
-from dataclasses import dataclass
+# Maximum unsigned value for every bit size from 0 to 32, indexed by size
+_MAX_FOR_SIZE = tuple((1 << size) - 1 for size in range(33))
+
+
+def max_for_size(size: int) -> int:
+    """
+    Calculates or retrieves the maximum value based on a given bit size using a lookup.
+    """
+    return _MAX_FOR_SIZE[size] if 0 <= size < 33 else (1 << size) - 1
 
 
-@dataclass
 class BitValue:
-    size: int  # The number of bits
-
-    @property
-    def max(self):
-        return self.max_for_size(self.size)
-
-    @staticmethod
-    def max_for_size(size: int) -> int:
-        """
-        Calculates or retrieves the maximum value based on a given bit size using a lookup.
-        """
-        size_map = {
-            4: 0x0F,  # 15, 4-bit max
-            7: 0x7F,  # 127, 7-bit max
-            8: 0xFF,  # 255, 8-bit max
-            14: 0x3FFF,  # 16383, 14-bit max
-            16: 0xFFFF,  # 65535, 16-bit max
-            32: 0xFFFFFFFF,  # 4294967295, 32-bit max
-        }
-        return size_map.get(size, (1 << size) - 1)  # Default to dynamic calc if not in map
+    """Unsigned bit-width value with its maximum precomputed."""
+
+    __slots__ = ("size", "max")
+
+    def __init__(self, size: int):
+        self.size = size  # The number of bits
+        self.max = max_for_size(size)
+
+    def __repr__(self) -> str:
+        return f"BitValue(size={self.size})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.size == other.size
+
+    def __hash__(self) -> int:
+        return hash(self.size)
+
+    max_for_size = staticmethod(max_for_size)
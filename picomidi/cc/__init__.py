@@ -18,6 +18,8 @@ def __getattr__(name):
         )
         from picomidi.messages.control_change import ControlChange
 
+        # Cache on the module so later lookups (and the warning) bypass __getattr__
+        globals()[name] = ControlChange
         return ControlChange
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
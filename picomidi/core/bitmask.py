@@ -13,3 +13,12 @@ class BitMask:
     FULL_BYTE = 0xFF  # Full 8 bits — masks a whole byte
     HIGH_4_BITS = 0xF0  # High nibble mask
     WORD = 0xFFFF  # Word mask (16 bits, 2 bytes)
+
+
+# The masks as plain module-level ints, for hot paths: a module global is
+# read faster than a class attribute
+LOW_4_BITS = BitMask.LOW_4_BITS
+LOW_7_BITS = BitMask.LOW_7_BITS
+FULL_BYTE = BitMask.FULL_BYTE
+HIGH_4_BITS = BitMask.HIGH_4_BITS
+WORD = BitMask.WORD
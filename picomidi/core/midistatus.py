@@ -5,7 +5,14 @@ This module defines constants and utilities for MIDI status bytes,
 which identify the type of MIDI message.
 """
 
-from picomidi.core.bitmask import BitMask
+import struct
+
+from picomidi.core.bitmask import HIGH_4_BITS, LOW_4_BITS
+
+# Bit n is set when status byte n is a system common message (0xF0-0xF3, 0xF6, 0xF7)
+_SYSTEM_COMMON_MASK = (
+    (1 << 0xF0) | (1 << 0xF1) | (1 << 0xF2) | (1 << 0xF3) | (1 << 0xF6) | (1 << 0xF7)
+)
 
 
 class MidiStatus:
@@ -60,7 +67,7 @@ class MidiStatus:
         :param status: Status byte value
         :return: True if system common message (0xF0-0xF7, excluding 0xF4, 0xF5)
         """
-        return status in (0xF0, 0xF1, 0xF2, 0xF3, 0xF6, 0xF7)
+        return 0 <= status <= 0xFF and (_SYSTEM_COMMON_MASK >> status) & 1 == 1
 
     @staticmethod
     def is_system_realtime(status: int) -> bool:
@@ -80,7 +87,7 @@ class MidiStatus:
         :param status: Status byte value
         :return: Message type (high 4 bits)
         """
-        return status & BitMask.HIGH_4_BITS
+        return status & HIGH_4_BITS
 
     @staticmethod
     def get_channel(status: int) -> int:
@@ -90,8 +97,8 @@ class MidiStatus:
         :param status: Status byte value
         :return: Channel number (0-15), or None if not a channel message
         """
-        if MidiStatus.is_channel_voice(status):
-            return status & BitMask.LOW_4_BITS
+        if 0x80 <= status <= 0xEF:
+            return status & LOW_4_BITS
         return None
 
     @staticmethod
@@ -105,4 +112,23 @@ class MidiStatus:
         """
         if not 0 <= channel <= 15:
             raise ValueError(f"Channel must be 0-15, got {channel}")
-        return status_base | (channel & BitMask.LOW_4_BITS)
+        return status_base | (channel & LOW_4_BITS)
+
+
+def _channel_status_table(status_base: int) -> bytes:
+    """Build the 16 complete status bytes for a channel voice message type."""
+    return bytes(status_base | channel for channel in range(16))
+
+
+# Precomputed status bytes indexed by channel number (0-15)
+NOTE_OFF_STATUS = _channel_status_table(MidiStatus.NOTE_OFF)
+NOTE_ON_STATUS = _channel_status_table(MidiStatus.NOTE_ON)
+POLY_AFTERTOUCH_STATUS = _channel_status_table(MidiStatus.POLY_AFTERTOUCH)
+CONTROL_CHANGE_STATUS = _channel_status_table(MidiStatus.CONTROL_CHANGE)
+PROGRAM_CHANGE_STATUS = _channel_status_table(MidiStatus.PROGRAM_CHANGE)
+CHANNEL_AFTERTOUCH_STATUS = _channel_status_table(MidiStatus.CHANNEL_AFTERTOUCH)
+PITCH_BEND_STATUS = _channel_status_table(MidiStatus.PITCH_BEND)
+
+# Pack a status byte and its data bytes into a 2- or 3-byte message in one C-level call
+PACK_2_BYTES = struct.Struct("BB").pack
+PACK_3_BYTES = struct.Struct("BBB").pack
@@ -9,14 +9,18 @@ from picomidi.core.parameter.byte_group import ByteGroup
 
 @dataclass(frozen=True)
 class ParameterAddress(ByteGroup):
-    msb: str = "00"
-    umb: str = "00"
-    lmb: str = "00"
-    lsb: str = "00"
+    msb: int = 0x00
+    umb: int = 0x00
+    lmb: int = 0x00
+    lsb: int = 0x00
 
     def __post_init__(self):
-        # Set length field using object.__setattr__ since this is a frozen dataclass
-        # and length is overridden as a property
+        # Accept legacy hex strings (e.g. "18") and store them as ints; object.__setattr__
+        # is needed since this is a frozen dataclass
+        for name in ("msb", "umb", "lmb", "lsb"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, int(value, 16))
         # Call parent's __post_init__ for validation
         super().__post_init__()
 
@@ -25,7 +29,7 @@ class ParameterAddress(ByteGroup):
 
     @property
     def bytes_string(self):
-        return f"f{self.msb}{self.umb}{self.lmb}{self.lsb}"
+        return f"f{self.msb:02X}{self.umb:02X}{self.lmb:02X}{self.lsb:02X}"
 
     @classmethod
     def from_str(cls, raw_data: str) -> "ParameterAddress":
@@ -34,10 +38,10 @@ class ParameterAddress(ByteGroup):
             raise ValueError("Raw address must contain exactly 4 bytes")
 
         return cls(
-            msb=parts[0].upper(),
-            umb=parts[1].upper(),
-            lmb=parts[2].upper(),
-            lsb=parts[3].upper(),
+            msb=int(parts[0], 16),
+            umb=int(parts[1], 16),
+            lmb=int(parts[2], 16),
+            lsb=int(parts[3], 16),
         )
 
     @classmethod
@@ -45,10 +49,10 @@ class ParameterAddress(ByteGroup):
         if len(raw_data) != 4:
             raise ValueError("Raw address must be 4 bytes.")
         return cls(
-            msb=f"{raw_data[0]:02X}",
-            umb=f"{raw_data[1]:02X}",
-            lmb=f"{raw_data[2]:02X}",
-            lsb=f"{raw_data[3]:02X}",
+            msb=raw_data[0],
+            umb=raw_data[1],
+            lmb=raw_data[2],
+            lsb=raw_data[3],
         )
 
     @property
@@ -57,4 +61,4 @@ class ParameterAddress(ByteGroup):
 
     @property
     def bytes(self) -> tuple[int, int, int, int]:
-        return int(self.msb), int(self.umb), int(self.lmb), int(self.lsb)
+        return self.msb, self.umb, self.lmb, self.lsb
@@ -6,11 +6,12 @@ from picomidi.core.parameter.address import ParameterAddress
 from picomidi.core.parameter.offset import ParameterOffset
 
 
-def _parse_hex_string(raw: str) -> tuple[str, ...]:
-    parts = raw.strip().split()
-    for p in parts:
-        int(p, 16)  # validates hex
-    return tuple(p.upper() for p in parts)
+def _parse_hex_bytes(raw: str) -> tuple[int, ...]:
+    """Parse a whitespace-separated 3 or 4 byte hex string into ints in one pass."""
+    parts = raw.split()
+    if len(parts) not in (3, 4):
+        raise ValueError("Address string must be 3 or 4 bytes")
+    return tuple(int(p, 16) for p in parts)  # int() also validates hex
 
 
 class AddressFactory:
@@ -18,7 +19,7 @@ class AddressFactory:
 
     @staticmethod
     def from_str(raw: str):
-        parts = _parse_hex_string(raw)
+        parts = _parse_hex_bytes(raw)
 
         if len(parts) == 4:
             return ParameterAddress(
@@ -28,30 +29,27 @@ class AddressFactory:
                 lsb=parts[3],
             )
 
-        if len(parts) == 3:
-            return ParameterOffset(
-                msb=parts[0],
-                mb=parts[1],
-                lsb=parts[2],
-            )
-
-        raise ValueError("Address string must be 3 or 4 bytes")
+        return ParameterOffset(
+            msb=parts[0],
+            mb=parts[1],
+            lsb=parts[2],
+        )
 
     @staticmethod
     def from_bytes(raw: bytes):
         if len(raw) == 4:
             return ParameterAddress(
-                msb=f"{raw[0]:02X}",
-                umb=f"{raw[1]:02X}",
-                lmb=f"{raw[2]:02X}",
-                lsb=f"{raw[3]:02X}",
+                msb=raw[0],
+                umb=raw[1],
+                lmb=raw[2],
+                lsb=raw[3],
             )
 
         if len(raw) == 3:
             return ParameterOffset(
-                msb=f"{raw[0]:02X}",
-                mb=f"{raw[1]:02X}",
-                lsb=f"{raw[2]:02X}",
+                msb=raw[0],
+                mb=raw[1],
+                lsb=raw[2],
             )
 
         raise ValueError("Byte address must be 3 or 4 bytes")
@@ -60,5 +58,7 @@ class AddressFactory:
     def key(addr) -> str:
         """Canonical dictionary key."""
         return " ".join(
-            getattr(addr, field) for field in ("msb", "umb", "lmb", "lsb") if hasattr(addr, field)
+            f"{getattr(addr, field):02X}"
+            for field in ("msb", "umb", "mb", "lmb", "lsb")
+            if hasattr(addr, field)
         )
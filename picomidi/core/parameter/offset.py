@@ -5,13 +5,17 @@ from picomidi.core.parameter.byte_group import ByteGroup
 
 @dataclass(frozen=True)
 class ParameterOffset(ByteGroup):
-    msb: str = "00"
-    mb: str = "00"
-    lsb: str = "00"
+    msb: int = 0x00
+    mb: int = 0x00
+    lsb: int = 0x00
 
     def __post_init__(self):
-        # Set length field using object.__setattr__ since this is a frozen dataclass
-        # and length is overridden as a property
+        # Accept legacy hex strings (e.g. "18") and store them as ints; object.__setattr__
+        # is needed since this is a frozen dataclass
+        for name in ("msb", "mb", "lsb"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, int(value, 16))
         # Call parent's __post_init__ for validation
         super().__post_init__()
 
@@ -25,9 +29,9 @@ class ParameterOffset(ByteGroup):
             raise ValueError("Raw address must contain exactly 3 bytes")
 
         return cls(
-            msb=parts[0].upper(),
-            mb=parts[1].upper(),
-            lsb=parts[2].upper(),
+            msb=int(parts[0], 16),
+            mb=int(parts[1], 16),
+            lsb=int(parts[2], 16),
         )
 
     @classmethod
@@ -35,14 +39,14 @@ class ParameterOffset(ByteGroup):
         if len(raw_data) != 3:
             raise ValueError("Raw address must be 3 bytes.")
         return cls(
-            msb=f"{raw_data[0]:02X}",
-            mb=f"{raw_data[1]:02X}",
-            lsb=f"{raw_data[2]:02X}",
+            msb=raw_data[0],
+            mb=raw_data[1],
+            lsb=raw_data[2],
         )
 
     @property
     def bytes_string(self):
-        return f"f{self.msb}{self.mb}{self.lsb}"
+        return f"f{self.msb:02X}{self.mb:02X}{self.lsb:02X}"
 
     @property
     def length(self) -> int:
@@ -50,4 +54,4 @@ class ParameterOffset(ByteGroup):
 
     @property
     def bytes(self) -> tuple[int, int, int]:
-        return int(self.msb), int(self.mb), int(self.lsb)
+        return self.msb, self.mb, self.lsb
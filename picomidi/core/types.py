@@ -6,11 +6,54 @@ like notes, velocities, control values, etc.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Tuple
+
+_PITCH_CLASSES_SHARP = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_PITCH_CLASSES_FLAT = ("C", "Db", "D", "Eb", "E", "F", "Gb", "G", "Ab", "A", "Bb", "B")
+
+
+def _compute_note_name(value: int, use_sharps: bool) -> str:
+    """Compute the name ('C4', 'A#3', 'Bb5') of MIDI note number `value`."""
+    pitch_classes = _PITCH_CLASSES_SHARP if use_sharps else _PITCH_CLASSES_FLAT
+    octave = (value // 12) - 1
+    return f"{pitch_classes[value % 12]}{octave}"
+
+
+# Names of all 128 MIDI notes, indexed by note number
+_NOTE_NAMES_SHARP = tuple(_compute_note_name(value, True) for value in range(128))
+_NOTE_NAMES_FLAT = tuple(_compute_note_name(value, False) for value in range(128))
+
+
+def _linear_ramp(start: int, end: int, steps: int) -> List[int]:
+    """Return `steps` evenly spaced integers from `start` to `end` using integer math only."""
+    if steps <= 0:
+        return []
+    if steps == 1:
+        return [start]
+    last = steps - 1
+    delta = end - start
+    return [start + (delta * i) // last for i in range(steps)]
+
+
+class _FrozenValue:
+    """
+    Base of the frozen, slotted value types below.
+
+    Without an instance __dict__, copy and pickle restore the state through
+    __setstate__, which must bypass the frozen __setattr__.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> int:
+        return self.value
+
+    def __setstate__(self, state: int) -> None:
+        object.__setattr__(self, "value", state)
 
 
 @dataclass(frozen=True)
-class Note:
+class Note(_FrozenValue):
     """
     MIDI Note (0-127).
 
@@ -20,6 +63,8 @@ class Note:
     - 127 = G9 (highest)
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -37,6 +82,23 @@ class Note:
         # Remove whitespace and convert to uppercase
         name = name.strip().upper()
 
+        # Fast path: every standard sharp/flat spelling is precomputed
+        midi_note = _NAME_TO_MIDI.get(name)
+        if midi_note is not None:
+            return cls(midi_note)
+
+        return cls(cls._parse_name(name))
+
+    @staticmethod
+    def _parse_name(name: str) -> int:
+        """
+        Parse a normalized (stripped, uppercase) note name into a MIDI note number.
+
+        Handles the spellings not in the lookup table (e.g. 'E#4', 'C04').
+
+        :param name: Normalized note name
+        :return: MIDI note number (0-127)
+        """
         # Parse note letter
         note_map = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
 
@@ -69,7 +131,7 @@ class Note:
         if not 0 <= midi_note <= 127:
             raise ValueError(f"Note {name} is out of MIDI range (0-127)")
 
-        return cls(midi_note)
+        return midi_note
 
     def to_name(self, use_sharps: bool = True) -> str:
         """
@@ -78,49 +140,22 @@ class Note:
         :param use_sharps: If True, use sharps (#), else use flats (b)
         :return: Note name string
         """
-        note_names_sharp = [
-            "C",
-            "C#",
-            "D",
-            "D#",
-            "E",
-            "F",
-            "F#",
-            "G",
-            "G#",
-            "A",
-            "A#",
-            "B",
-        ]
-        note_names_flat = [
-            "C",
-            "Db",
-            "D",
-            "Eb",
-            "E",
-            "F",
-            "Gb",
-            "G",
-            "Ab",
-            "A",
-            "Bb",
-            "B",
-        ]
-
-        note_names = note_names_sharp if use_sharps else note_names_flat
-
-        octave = (self.value // 12) - 1
-        note_index = self.value % 12
-        note_name = note_names[note_index]
-
-        return f"{note_name}{octave}"
+        return (_NOTE_NAMES_SHARP if use_sharps else _NOTE_NAMES_FLAT)[self.value]
 
     def __str__(self) -> str:
         return f"Note({self.to_name()})"
 
 
+# Note name (as normalized by Note.from_name) to MIDI note number, both spellings
+_NAME_TO_MIDI = {
+    name.upper(): value
+    for names in (_NOTE_NAMES_SHARP, _NOTE_NAMES_FLAT)
+    for value, name in enumerate(names)
+}
+
+
 @dataclass(frozen=True)
-class Velocity:
+class Velocity(_FrozenValue):
     """
     MIDI Velocity (0-127).
 
@@ -129,6 +164,8 @@ class Velocity:
     - 127 = maximum (full volume for notes)
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -147,6 +184,25 @@ class Velocity:
             raise ValueError(f"Percent must be 0.0-1.0, got {percent}")
         return cls(int(percent * 127))
 
+    @staticmethod
+    def ramp(start_percent: float, end_percent: float, steps: int) -> List[int]:
+        """
+        Create a linear ramp of raw velocity values (e.g. for a fade).
+
+        The end points match `from_percent()`; the values in between are
+        interpolated with integer math. Wrap values in `Velocity` only when
+        they are emitted.
+
+        :param start_percent: Start percentage (0.0-1.0)
+        :param end_percent: End percentage (0.0-1.0)
+        :param steps: Number of values to generate
+        :return: List of velocity values (0-127)
+        """
+        for percent in (start_percent, end_percent):
+            if not 0.0 <= percent <= 1.0:
+                raise ValueError(f"Percent must be 0.0-1.0, got {percent}")
+        return _linear_ramp(int(start_percent * 127), int(end_percent * 127), steps)
+
     def to_percent(self) -> float:
         """Convert velocity to percentage (0.0-1.0)."""
         return self.value / 127.0
@@ -156,13 +212,15 @@ class Velocity:
 
 
 @dataclass(frozen=True)
-class ControlValue:
+class ControlValue(_FrozenValue):
     """
     MIDI Control Change value (0-127).
 
     Represents a control change parameter value.
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -174,13 +232,15 @@ class ControlValue:
 
 
 @dataclass(frozen=True)
-class ProgramNumber:
+class ProgramNumber(_FrozenValue):
     """
     MIDI Program Number (0-127).
 
     Represents a program/patch number for Program Change messages.
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -192,7 +252,7 @@ class ProgramNumber:
 
 
 @dataclass(frozen=True)
-class PitchBendValue:
+class PitchBendValue(_FrozenValue):
     """
     MIDI Pitch Bend value (-8192 to 8191, center = 0).
 
@@ -202,6 +262,8 @@ class PitchBendValue:
     - 8191 = maximum upward bend
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -222,10 +284,30 @@ class PitchBendValue:
         signed_value = value - 8192
         return cls(signed_value)
 
+    @classmethod
+    def from_msb_lsb(cls, msb: int, lsb: int) -> "PitchBendValue":
+        """
+        Create from the two 7-bit data bytes of a Pitch Bend message.
+
+        :param msb: Most significant 7 bits (0-127)
+        :param lsb: Least significant 7 bits (0-127)
+        :return: PitchBendValue instance
+        """
+        return cls((((msb & 0x7F) << 7) | (lsb & 0x7F)) - 0x2000)
+
     def to_14bit(self) -> int:
         """Convert to 14-bit unsigned value (0-16383)."""
         return self.value + 8192
 
+    def to_msb_lsb(self) -> Tuple[int, int]:
+        """
+        Convert to the two 7-bit data bytes of a Pitch Bend message.
+
+        :return: Tuple of (msb, lsb) where each is 0-127
+        """
+        unsigned_14bit = self.value + 0x2000
+        return unsigned_14bit >> 7, unsigned_14bit & 0x7F
+
     def to_percent(self) -> float:
         """Convert to percentage (-1.0 to 1.0)."""
         return self.value / 8192.0
@@ -240,7 +322,27 @@ class PitchBendValue:
         """
         if not -1.0 <= percent <= 1.0:
             raise ValueError(f"Percent must be -1.0 to 1.0, got {percent}")
-        return cls(int(percent * 8192))
+        return cls(min(int(percent * 8192), 8191))
+
+    @staticmethod
+    def ramp(start_percent: float, end_percent: float, steps: int) -> List[int]:
+        """
+        Create a linear ramp of raw signed pitch bend values (e.g. for a glide).
+
+        The end points match `from_percent()`; the values in between are
+        interpolated with integer math.
+
+        :param start_percent: Start percentage (-1.0 to 1.0)
+        :param end_percent: End percentage (-1.0 to 1.0)
+        :param steps: Number of values to generate
+        :return: List of pitch bend values (-8192 to 8191)
+        """
+        for percent in (start_percent, end_percent):
+            if not -1.0 <= percent <= 1.0:
+                raise ValueError(f"Percent must be -1.0 to 1.0, got {percent}")
+        return _linear_ramp(
+            min(int(start_percent * 8192), 8191), min(int(end_percent * 8192), 8191), steps
+        )
 
     def __str__(self) -> str:
         return f"PitchBendValue({self.value})"
@@ -2,6 +2,8 @@
 MIDI value constants and validation utilities.
 """
 
+from typing import List, Sequence
+
 from picomidi.values import MaxValues, MinValues
 
 
@@ -46,3 +48,49 @@ class MidiValue:
         if signed:
             return MidiValue.SignedSixteenBit.MIN <= value <= MidiValue.SignedSixteenBit.MAX
         return 0 <= value <= MidiValue.max.SIXTEEN_BIT
+
+    # ------------------------------------------------------------------------
+    # Batch Utility Methods
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def all_within_seven_bit_range(values: Sequence[int]) -> bool:
+        """
+        Check if every value in a sequence falls within the 7-bit unsigned range.
+
+        Uses the builtin min()/max() so the scan runs in C rather than one
+        Python-level comparison per value; bytes and bytearray are checked with
+        isascii(), which tests a machine word of bytes at a time. Scalar
+        callers should keep using `is_within_seven_bit_range()`.
+        :param values: Sequence of values to validate (list, tuple, bytes, ...)
+        :return: True if all values are within range (or the sequence is empty)
+        """
+        if isinstance(values, (bytes, bytearray)):
+            return values.isascii()
+        return not values or (min(values) >= 0 and max(values) <= MidiValue.max.SEVEN_BIT)
+
+    @staticmethod
+    def all_within_sixteen_bit_range(values: Sequence[int], signed=False) -> bool:
+        """
+        Check if every value in a sequence falls within the 16-bit range.
+        :param values: Sequence of values to validate
+        :param signed: If True, treat as signed range, otherwise unsigned.
+        :return: True if all values are within range (or the sequence is empty)
+        """
+        if not values:
+            return True
+        if signed:
+            return (
+                min(values) >= MidiValue.SignedSixteenBit.MIN
+                and max(values) <= MidiValue.SignedSixteenBit.MAX
+            )
+        return min(values) >= 0 and max(values) <= MidiValue.max.SIXTEEN_BIT
+
+    @staticmethod
+    def clip_to_seven_bit(values: Sequence[int]) -> List[int]:
+        """
+        Clip every value in a sequence to the 7-bit unsigned range.
+        :param values: Sequence of values to clip
+        :return: New list with each value clipped to 0-127
+        """
+        seven_bit = MidiValue.max.SEVEN_BIT
+        return [0 if v < 0 else seven_bit if v > seven_bit else v for v in values]
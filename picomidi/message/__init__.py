@@ -2,12 +2,13 @@
 MIDI Message Classes
 """
 
-from picomidi.message.base import Message
+from picomidi.message.base import FrozenMessage, Message
 from picomidi.message.channel_voice import ControlChange, NoteOff, NoteOn, PitchBend, ProgramChange
 from picomidi.message.sysex import RolandSysExMessage
 
 __all__ = [
     "Message",
+    "FrozenMessage",
     "NoteOn",
     "NoteOff",
     "ControlChange",
@@ -5,6 +5,7 @@ This module provides the base class for all MIDI messages.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import FrozenInstanceError
 from typing import List
 
 
@@ -16,6 +17,8 @@ class Message(ABC):
     and to a list of integers for transmission.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_bytes(self) -> bytes:
         """
@@ -41,8 +44,31 @@ class Message(ABC):
         :param separator: String to separate hex bytes
         :return: Hexadecimal string (e.g., "90 3C 7F")
         """
-        return separator.join(f"{b:02X}" for b in self.to_list())
+        data = self.to_bytes()
+        if not separator:
+            return data.hex().upper()
+        if len(separator) == 1 and separator.isascii():
+            # bytes.hex() only accepts a single ASCII character separator
+            return data.hex(separator).upper()
+        return separator.join(f"{b:02X}" for b in data)
 
     def __repr__(self) -> str:
         """String representation of the message."""
         return f"{self.__class__.__name__}({self.to_hex_string()})"
+
+
+class FrozenMessage(Message):
+    """
+    Base class for immutable MIDI messages.
+
+    Assigning or deleting an attribute raises FrozenInstanceError, so
+    subclasses set their slots in __init__ with object.__setattr__.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
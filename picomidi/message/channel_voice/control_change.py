@@ -8,12 +8,12 @@ like volume, pan, modulation, etc.
 from typing import List
 
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import CONTROL_CHANGE_STATUS, PACK_3_BYTES
 from picomidi.core.types import ControlValue
-from picomidi.message.base import Message
+from picomidi.message.base import FrozenMessage
 
 
-class ControlChange(Message):
+class ControlChange(FrozenMessage):
 
     """
     MIDI Control Change message.
@@ -30,6 +30,8 @@ class ControlChange(Message):
     - 123 = All notes off
     """
 
+    __slots__ = ("channel", "controller", "control_value", "_bytes")
+
     # Common CC numbers
     MODULATION_WHEEL = 1
     VOLUME = 7
@@ -50,18 +52,24 @@ class ControlChange(Message):
         """
         if not 0 <= controller <= 127:
             raise ValueError(f"Controller number must be 0-127, got {controller}")
-        self.channel = channel
-        self.controller = controller
-        self.control_value = control_value
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "controller", controller)
+        object.__setattr__(self, "control_value", control_value)
+        object.__setattr__(self, "_bytes", None)  # Encoded lazily by to_bytes()
 
     def to_list(self) -> List[int]:
         """Convert to list of integers."""
-        status = MidiStatus.make_channel_voice(MidiStatus.CONTROL_CHANGE, self.channel.value)
-        return [status, self.controller, self.control_value.value]
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
-        """Convert to bytes."""
-        return bytes(self.to_list())
+        """Convert to bytes (encoded on first call, then cached)."""
+        data = self._bytes
+        if data is None:
+            data = PACK_3_BYTES(
+                CONTROL_CHANGE_STATUS[self.channel], self.controller, self.control_value.value
+            )
+            object.__setattr__(self, "_bytes", data)
+        return data
 
     def __repr__(self) -> str:
-        return f"ControlChange(channel={self.channel.to_display()}, controller={self.controller}, value={self.value})"
+        return f"ControlChange(channel={self.channel.to_display()}, controller={self.controller}, value={self.control_value.value})"
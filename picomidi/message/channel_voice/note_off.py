@@ -7,12 +7,15 @@ A Note Off message indicates that a note should stop playing.
 from typing import List
 
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import NOTE_OFF_STATUS, PACK_3_BYTES
 from picomidi.core.types import Note, Velocity
-from picomidi.message.base import Message
+from picomidi.message.base import FrozenMessage
 
+# Default release velocity, built once instead of per message
+_DEFAULT_RELEASE_VELOCITY = Velocity(64)
 
-class NoteOff(Message):
+
+class NoteOff(FrozenMessage):
     """
     MIDI Note Off message.
 
@@ -20,6 +23,8 @@ class NoteOff(Message):
     Velocity is often ignored but can be used for release velocity.
     """
 
+    __slots__ = ("channel", "note", "velocity", "_bytes")
+
     def __init__(self, channel: Channel, note: Note, velocity: Velocity = None):
         """
         Create a Note Off message.
@@ -28,18 +33,24 @@ class NoteOff(Message):
         :param note: Note to stop (0-127, use Note class)
         :param velocity: Release velocity (0-127, optional, defaults to 64)
         """
-        self.channel = channel
-        self.note = note
-        self.velocity = velocity or Velocity(64)  # Default release velocity
+        if velocity is None:
+            velocity = _DEFAULT_RELEASE_VELOCITY
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "note", note)
+        object.__setattr__(self, "velocity", velocity)
+        object.__setattr__(self, "_bytes", None)  # Encoded lazily by to_bytes()
 
     def to_list(self) -> List[int]:
         """Convert to list of integers."""
-        status = MidiStatus.make_channel_voice(MidiStatus.NOTE_OFF, self.channel.value)
-        return [status, self.note.value, self.velocity.value]
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
-        """Convert to bytes."""
-        return bytes(self.to_list())
+        """Convert to bytes (encoded on first call, then cached)."""
+        data = self._bytes
+        if data is None:
+            data = PACK_3_BYTES(NOTE_OFF_STATUS[self.channel], self.note.value, self.velocity.value)
+            object.__setattr__(self, "_bytes", data)
+        return data
 
     def __repr__(self) -> str:
         return f"NoteOff(channel={self.channel.to_display()}, note={self.note.to_name()}, velocity={self.velocity.value})"
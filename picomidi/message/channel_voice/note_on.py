@@ -5,15 +5,20 @@ A Note On message indicates that a note should start playing.
 Velocity 0 is treated as Note Off by many devices.
 """
 
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import NOTE_ON_STATUS, PACK_3_BYTES
 from picomidi.core.types import Note, Velocity
-from picomidi.message.base import Message
+from picomidi.core.value import MidiValue
+from picomidi.message.base import FrozenMessage
 
+# Shared instances handed out by NoteOn.get(), keyed by (channel, note, velocity)
+_SHARED: Dict[Tuple[int, int, int], "NoteOn"] = {}
+_SHARED_MAX_SIZE = 4096
 
-class NoteOn(Message):
+
+class NoteOn(FrozenMessage):
     """
     MIDI Note On message.
 
@@ -21,6 +26,8 @@ class NoteOn(Message):
     with a given velocity.
     """
 
+    __slots__ = ("channel", "note", "velocity", "_bytes")
+
     def __init__(self, channel: Channel, note: Note, velocity: Velocity):
         """
         Create a Note On message.
@@ -29,18 +36,74 @@ class NoteOn(Message):
         :param note: Note to play (0-127, use Note class)
         :param velocity: Velocity/strength (0-127, use Velocity class)
         """
-        self.channel = channel
-        self.note = note
-        self.velocity = velocity
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "note", note)
+        object.__setattr__(self, "velocity", velocity)
+        object.__setattr__(self, "_bytes", None)  # Encoded lazily by to_bytes()
 
     def to_list(self) -> List[int]:
         """Convert to list of integers."""
-        status = MidiStatus.make_channel_voice(MidiStatus.NOTE_ON, self.channel.value)
-        return [status, self.note.value, self.velocity.value]
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
-        """Convert to bytes."""
-        return bytes(self.to_list())
+        """Convert to bytes (encoded on first call, then cached)."""
+        data = self._bytes
+        if data is None:
+            data = PACK_3_BYTES(NOTE_ON_STATUS[self.channel], self.note.value, self.velocity.value)
+            object.__setattr__(self, "_bytes", data)
+        return data
+
+    @classmethod
+    def get(cls, channel: Channel, note: Note, velocity: Velocity) -> "NoteOn":
+        """
+        Return a shared Note On message, with its bytes already encoded.
+
+        Repeated (channel, note, velocity) combinations reuse one instance,
+        which is safe because messages are immutable. Up to 4096
+        combinations are kept; others get a fresh instance each call.
+
+        :param channel: MIDI channel (0-15, use Channel enum)
+        :param note: Note to play (0-127, use Note class)
+        :param velocity: Velocity/strength (0-127, use Velocity class)
+        :return: NoteOn message
+        """
+        key = (channel, note.value, velocity.value)
+        message = _SHARED.get(key)
+        if message is None:
+            message = cls(channel, note, velocity)
+            message.to_bytes()
+            if len(_SHARED) < _SHARED_MAX_SIZE:
+                _SHARED[key] = message
+        return message
+
+    @classmethod
+    def many_to_bytes(
+        cls, channel: Channel, notes: Sequence[int], velocities: Sequence[int]
+    ) -> bytes:
+        """
+        Encode a batch of Note On messages on one channel without creating message objects.
+
+        :param channel: MIDI channel (0-15, use Channel enum)
+        :param notes: Note numbers (0-127) as a list, tuple or bytes
+        :param velocities: Velocities (0-127), one per note
+        :return: Concatenated 3-byte Note On messages
+        :raises ValueError: If the sequences differ in length or hold non 7-bit values
+        """
+        count = len(notes)
+        if len(velocities) != count:
+            raise ValueError(
+                f"notes and velocities must have the same length, got {count} and {len(velocities)}"
+            )
+        if not (
+            MidiValue.all_within_seven_bit_range(notes)
+            and MidiValue.all_within_seven_bit_range(velocities)
+        ):
+            raise ValueError("Note and velocity values must be 0-127")
+        buf = bytearray(3 * count)
+        buf[0::3] = NOTE_ON_STATUS[channel : channel + 1] * count
+        buf[1::3] = notes
+        buf[2::3] = velocities
+        return bytes(buf)
 
     def __repr__(self) -> str:
         return f"NoteOn(channel={self.channel.to_display()}, note={self.note.to_name()}, velocity={self.velocity.value})"
@@ -8,13 +8,12 @@ typically controlled by a pitch wheel or lever.
 from typing import List
 
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import PACK_3_BYTES, PITCH_BEND_STATUS
 from picomidi.core.types import PitchBendValue
-from picomidi.message.base import Message
-from picomidi.utils.conversion import split_14bit_to_7bit
+from picomidi.message.base import FrozenMessage
 
 
-class PitchBend(Message):
+class PitchBend(FrozenMessage):
     """
     MIDI Pitch Bend message.
 
@@ -22,6 +21,8 @@ class PitchBend(Message):
     (0-16383) where 8192 (0x2000) is center (no bend).
     """
 
+    __slots__ = ("channel", "value", "_bytes")
+
     def __init__(self, channel: Channel, value: PitchBendValue):
         """
         Create a Pitch Bend message.
@@ -29,21 +30,23 @@ class PitchBend(Message):
         :param channel: MIDI channel (0-15, use Channel enum)
         :param value: Pitch bend value (-8192 to 8191, use PitchBendValue class)
         """
-        self.channel = channel
-        self.value = value
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "_bytes", None)  # Encoded lazily by to_bytes()
 
     def to_list(self) -> List[int]:
         """Convert to list of integers."""
-        status = MidiStatus.make_channel_voice(MidiStatus.PITCH_BEND, self.channel.value)
-        # Convert signed value to 14-bit unsigned
-        unsigned_14bit = self.value.to_14bit()
-        msb, lsb = split_14bit_to_7bit(unsigned_14bit)
-        # MIDI sends LSB first, then MSB
-        return [status, lsb, msb]
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
-        """Convert to bytes."""
-        return bytes(self.to_list())
+        """Convert to bytes (encoded on first call, then cached)."""
+        data = self._bytes
+        if data is None:
+            msb, lsb = self.value.to_msb_lsb()
+            # MIDI sends LSB first, then MSB
+            data = PACK_3_BYTES(PITCH_BEND_STATUS[self.channel], lsb, msb)
+            object.__setattr__(self, "_bytes", data)
+        return data
 
     def __repr__(self) -> str:
         return f"PitchBend(channel={self.channel.to_display()}, value={self.value})"
@@ -8,12 +8,12 @@ on a MIDI channel.
 from typing import List
 
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import PACK_2_BYTES, PROGRAM_CHANGE_STATUS
 from picomidi.core.types import ProgramNumber
-from picomidi.message.base import Message
+from picomidi.message.base import FrozenMessage
 
 
-class ProgramChange(Message):
+class ProgramChange(FrozenMessage):
     """
     MIDI Program Change message.
 
@@ -22,6 +22,8 @@ class ProgramChange(Message):
     access more than 128 programs.
     """
 
+    __slots__ = ("channel", "program", "_bytes")
+
     def __init__(self, channel: Channel, program: ProgramNumber):
         """
         Create a Program Change message.
@@ -29,17 +31,21 @@ class ProgramChange(Message):
         :param channel: MIDI channel (0-15, use Channel enum)
         :param program: Program number (0-127, use ProgramNumber class)
         """
-        self.channel = channel
-        self.program = program
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "program", program)
+        object.__setattr__(self, "_bytes", None)  # Encoded lazily by to_bytes()
 
     def to_list(self) -> List[int]:
         """Convert to list of integers."""
-        status = MidiStatus.make_channel_voice(MidiStatus.PROGRAM_CHANGE, self.channel.value)
-        return [status, self.program.value]
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
-        """Convert to bytes."""
-        return bytes(self.to_list())
+        """Convert to bytes (encoded on first call, then cached)."""
+        data = self._bytes
+        if data is None:
+            data = PACK_2_BYTES(PROGRAM_CHANGE_STATUS[self.channel], self.program.value)
+            object.__setattr__(self, "_bytes", data)
+        return data
 
     def __repr__(self) -> str:
         return f"ProgramChange(channel={self.channel.to_display()}, program={self.program.value})"
@@ -9,19 +9,34 @@ RPN messages are sequences of Control Change messages used to set
 4. CC#38 (Data Entry LSB) - value LSB (optional for 7-bit values)
 """
 
-from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
-from picomidi.core.bitmask import BitMask
+from picomidi.core.bitmask import LOW_7_BITS
 from picomidi.core.channel import Channel
-from picomidi.core.midistatus import MidiStatus
+from picomidi.core.midistatus import CONTROL_CHANGE_STATUS
 from picomidi.core.value import MidiValue
-from picomidi.message.base import Message
+from picomidi.message.base import FrozenMessage
 from picomidi.utils.validation import validate_14bit_value
 
-
-@dataclass(frozen=True)
-class RPN(Message):
+# Controller/value layout of each RPN sequence, keyed by use_14bit.
+# Status bytes (every third byte) are placeholders; see _TEMPLATES.
+_LAYOUTS = {
+    True: bytes((0, 101, 0, 0, 100, 0, 0, 6, 0, 0, 38, 0)),
+    False: bytes((0, 101, 0, 0, 100, 0, 0, 6, 0)),
+}
+
+# Layouts with the status byte of each channel (0-15) filled in, indexed [use_14bit][channel];
+# only the parameter/value bytes are written per message.
+_TEMPLATES = {
+    key: tuple(
+        bytes(status if i % 3 == 0 else byte for i, byte in enumerate(layout))
+        for status in CONTROL_CHANGE_STATUS
+    )
+    for key, layout in _LAYOUTS.items()
+}
+
+
+class RPN(FrozenMessage):
     """
     Registered Parameter Number (RPN) message.
 
@@ -37,27 +52,63 @@ class RPN(Message):
     :param use_14bit: If True, send 14-bit value (MSB + LSB). If False, send only MSB (7-bit)
     """
 
-    channel: Channel
-    parameter: int  # 0-16383
-    value: int  # 0-16383 for 14-bit, 0-127 for 7-bit
-    use_14bit: bool = True
-
-    def __post_init__(self):
-        """Validate RPN parameter and value ranges."""
-        if not validate_14bit_value(self.parameter):
-            raise ValueError(f"RPN parameter must be between 0 and 16383, got {self.parameter}")
-        if self.use_14bit:
-            if not validate_14bit_value(self.value):
-                raise ValueError(f"RPN value must be between 0 and 16383, got {self.value}")
+    __slots__ = ("channel", "parameter", "value", "use_14bit", "_bytes", "_repr")
+
+    def __init__(
+        self,
+        channel: Channel,
+        parameter: int,
+        value: int,
+        use_14bit: bool = True,
+    ):
+        """
+        Create an RPN message, validating the parameter and value ranges.
+
+        :raises ValueError: If the parameter or value is out of range
+        """
+        if not validate_14bit_value(parameter):
+            raise ValueError(f"RPN parameter must be between 0 and 16383, got {parameter}")
+        if use_14bit:
+            if not validate_14bit_value(value):
+                raise ValueError(f"RPN value must be between 0 and 16383, got {value}")
         else:
-            if not 0 <= self.value <= MidiValue.max.SEVEN_BIT:
+            if not 0 <= value <= MidiValue.max.SEVEN_BIT:
                 raise ValueError(
-                    f"RPN value must be between 0 and {MidiValue.max.SEVEN_BIT}, got {self.value}"
+                    f"RPN value must be between 0 and {MidiValue.max.SEVEN_BIT}, got {value}"
                 )
+        object.__setattr__(self, "channel", channel)
+        object.__setattr__(self, "parameter", parameter)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "use_14bit", use_14bit)
+        object.__setattr__(self, "_bytes", None)  # Encoded on first to_bytes()
+        object.__setattr__(self, "_repr", None)  # Built on first repr()
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        return (self.channel, self.parameter, self.value, self.use_14bit)
 
     def to_bytes(self) -> bytes:
         """Convert RPN to bytes (sequence of Control Change messages)."""
-        return bytes(self.to_list())
+        data = self._bytes
+        if data is None:
+            buf = bytearray(_TEMPLATES[self.use_14bit][self.channel])
+            buf[2] = (self.parameter >> 7) & LOW_7_BITS
+            buf[5] = self.parameter & LOW_7_BITS
+            if self.use_14bit:
+                buf[8] = (self.value >> 7) & LOW_7_BITS
+                buf[11] = self.value & LOW_7_BITS
+            else:
+                buf[8] = self.value & LOW_7_BITS
+            data = bytes(buf)
+            object.__setattr__(self, "_bytes", data)
+        return data
 
     def to_list(self) -> List[int]:
         """
@@ -66,41 +117,7 @@ class RPN(Message):
         Returns a flat list of bytes representing the sequence of CC messages.
         Note: This returns all bytes in sequence. For separate messages, use to_messages().
         """
-        # Split parameter into MSB/LSB
-        param_msb = (self.parameter >> 7) & BitMask.LOW_7_BITS
-        param_lsb = self.parameter & BitMask.LOW_7_BITS
-
-        # Split value into MSB/LSB
-        if self.use_14bit:
-            value_msb = (self.value >> 7) & BitMask.LOW_7_BITS
-            value_lsb = self.value & BitMask.LOW_7_BITS
-        else:
-            value_msb = self.value & BitMask.LOW_7_BITS
-            value_lsb = 0
-
-        # Build sequence of Control Change messages
-        status = MidiStatus.make_channel_voice(MidiStatus.CONTROL_CHANGE, self.channel.value)
-
-        messages = [
-            # RPN MSB
-            status,
-            101,
-            param_msb,
-            # RPN LSB
-            status,
-            100,
-            param_lsb,
-            # Data Entry MSB
-            status,
-            6,
-            value_msb,
-        ]
-
-        # Data Entry LSB (only for 14-bit values)
-        if self.use_14bit:
-            messages.extend([status, 38, value_lsb])
-
-        return messages
+        return list(self.to_bytes())
 
     def to_messages(self) -> List[List[int]]:
         """
@@ -108,29 +125,25 @@ class RPN(Message):
 
         :return: List of Control Change messages, each as [status, controller, value]
         """
-        param_msb = (self.parameter >> 7) & BitMask.LOW_7_BITS
-        param_lsb = self.parameter & BitMask.LOW_7_BITS
-
-        if self.use_14bit:
-            value_msb = (self.value >> 7) & BitMask.LOW_7_BITS
-            value_lsb = self.value & BitMask.LOW_7_BITS
-        else:
-            value_msb = self.value & BitMask.LOW_7_BITS
-            value_lsb = 0
+        data = self.to_bytes()
+        return [list(data[i : i + 3]) for i in range(0, len(data), 3)]
 
-        status = MidiStatus.make_channel_voice(MidiStatus.CONTROL_CHANGE, self.channel.value)
-
-        messages = [
-            [status, 101, param_msb],  # RPN MSB
-            [status, 100, param_lsb],  # RPN LSB
-            [status, 6, value_msb],  # Data Entry MSB
-        ]
+    def to_message_bytes(self) -> Tuple[bytes, ...]:
+        """
+        Convert RPN to separate Control Change messages as bytes.
 
-        if self.use_14bit:
-            messages.append([status, 38, value_lsb])  # Data Entry LSB
+        Like to_messages(), but each message is a 3-byte bytes object that can be
+        passed straight to a MIDI output.
 
-        return messages
+        :return: Tuple of Control Change messages, each as bytes([status, controller, value])
+        """
+        data = self.to_bytes()
+        return tuple(data[i : i + 3] for i in range(0, len(data), 3))
 
     def __repr__(self) -> str:
-        bit_mode = "14-bit" if self.use_14bit else "7-bit"
-        return f"RPN(channel={self.channel.to_display()}, parameter={self.parameter}, value={self.value}, {bit_mode})"
+        text = self._repr
+        if text is None:
+            bit_mode = "14-bit" if self.use_14bit else "7-bit"
+            text = f"RPN(channel={self.channel.to_display()}, parameter={self.parameter}, value={self.value}, {bit_mode})"
+            object.__setattr__(self, "_repr", text)
+        return text
@@ -19,14 +19,112 @@ Where:
 - F7: End of SysEx
 """
 
+import struct
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from typing import Final, List, Optional
 
+from picomidi.core.bitmask import LOW_7_BITS
 from picomidi.message.base import Message
-from picomidi.sysex.conversion import calculate_checksum
+from picomidi.messages.sysex import MidiSysExByte
+from picomidi.utils.conversion import safe_int
 
+# SysEx framing bytes as plain ints
+_SYSEX_START: Final[int] = MidiSysExByte.START
+_SYSEX_END: Final[int] = MidiSysExByte.END
 
-@dataclass
+# Offset of the data payload: F0 + 41 + device_id + model_id(4) + command + address(4)
+_DATA_OFFSET = 12
+
+# Fixed header layout: F0, 41, device_id, model_id(4), command, address(4)
+_HEADER = struct.Struct(">BBB4sB4s")
+
+# dataclass(slots=True) is only available from Python 3.10; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Valid device IDs: 0x10-0x1F, or 0x7F for all devices
+_VALID_DEVICE_IDS = frozenset(range(0x10, 0x20)) | {0x7F}
+
+
+def _to_7bit_bytes(values, label: str) -> bytes:
+    """
+    Validate a byte sequence as 7-bit safe and return it as bytes.
+
+    Integer sequences (list, tuple, bytes, memoryview) are converted in one
+    C-level pass; floats and numeric strings fall back to per-byte coercion.
+
+    :param values: Sequence of byte values
+    :param label: Field name used in the error message
+    :return: Bytes (each 0-127)
+    :raises ValueError: If any value is not convertible or outside 0-127
+    """
+    if isinstance(values, int):
+        # bytes(n) would silently build n zero bytes
+        raise TypeError(f"{label} must be a sequence of bytes, got int")
+    try:
+        raw = bytes(values)
+    except (TypeError, ValueError):
+        try:
+            raw = bytes(b if isinstance(b, int) else int(float(b)) for b in values)
+        except (TypeError, ValueError):
+            raise ValueError(f"{label} bytes must be 0-127 (7-bit safe)") from None
+    if not raw.isascii():  # C-level check that every byte is below 0x80
+        raise ValueError(f"{label} bytes must be 0-127 (7-bit safe)")
+    return raw
+
+
+def _split_roland_sysex(data: bytes) -> tuple:
+    """
+    Check the framing of a raw Roland SysEx message and split it into its fields.
+
+    Only the framing is checked here; field values are validated when the
+    message is constructed.
+
+    :param data: Raw SysEx message bytes
+    :return: Tuple of (manufacturer_id, device_id, model_id, command, address, data, checksum)
+    :raises ValueError: If the message is too short, mis-framed or not a Roland message
+    """
+    if len(data) < 13:  # Minimum: F0 + 41 + dev + model(4) + cmd + addr(4) + chk + F7
+        raise ValueError(f"Message too short: expected at least 13 bytes, got {len(data)}")
+
+    if data[0] != _SYSEX_START:
+        raise ValueError(f"Invalid start byte: expected 0xF0, got 0x{data[0]:02X}")
+
+    if data[-1] != _SYSEX_END:
+        raise ValueError(f"Invalid end byte: expected 0xF7, got 0x{data[-1]:02X}")
+
+    # All fixed-position fields in one C-level call; model_id and address come out as bytes
+    _, manufacturer_id, device_id, model_id, command, address = _HEADER.unpack_from(data)
+    if manufacturer_id != 0x41:
+        raise ValueError(f"Not a Roland message: manufacturer ID 0x{manufacturer_id:02X}")
+
+    return (
+        manufacturer_id,
+        device_id,
+        model_id,
+        command,
+        address,
+        data[_DATA_OFFSET:-2],  # data, everything between address and checksum
+        data[-2],  # checksum, second-to-last byte
+    )
+
+
+def _plain_bytes(values) -> Optional[bytes]:
+    """
+    Convert a sequence of ints 0-255 to bytes, or return None if it is anything else.
+
+    :param values: Sequence of byte values
+    :return: Bytes, or None if values is an int or not a sequence of ints 0-255
+    """
+    if isinstance(values, int):
+        return None  # bytes(n) would silently build n zero bytes
+    try:
+        return bytes(values)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RolandSysExMessage(Message):
     """
     Generic Roland System Exclusive message.
@@ -36,6 +134,13 @@ class RolandSysExMessage(Message):
     should inherit from this and provide default values for model_id,
     device_id, etc.
 
+    model_id and address may be given as lists of ints and are stored as
+    4-byte bytes objects; data is stored as a list of ints.
+
+    to_bytes() caches the packed header; assigning any field clears it.
+    The data payload and checksum are encoded on every call, so in-place
+    edits to data are always reflected.
+
     Example:
         >>> msg = RolandSysExMessage(
         ...     device_id=0x10,
@@ -51,99 +156,79 @@ class RolandSysExMessage(Message):
 
     manufacturer_id: int = 0x41  # Roland manufacturer ID
     device_id: int = 0x10  # Default device ID (can be overridden)
-    model_id: List[int] = field(default_factory=lambda: [0x00, 0x00, 0x00, 0x00])
+    model_id: bytes = bytes(4)  # 4 bytes; a list of ints is accepted and converted
     command: int = 0x12  # DT1 command (data set)
-    address: List[int] = field(default_factory=lambda: [0x00, 0x00, 0x00, 0x00])
+    address: bytes = bytes(4)  # 4 bytes; a list of ints is accepted and converted
     data: List[int] = field(default_factory=list)
+    _header: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Packed header, built by to_bytes()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_header":
+            object.__setattr__(self, "_header", None)  # The header may have changed
 
     def __post_init__(self):
         """
         Validate and normalize message components.
 
+        Well-formed integer fields, the common case, are checked as one combined
+        condition. Anything else goes through _validate_fields(), which raises
+        the specific error or coerces floats and numeric strings.
+
         :raises ValueError: If message structure is invalid
         """
+        model_id = _plain_bytes(self.model_id)
+        address = _plain_bytes(self.address)
+        data = _plain_bytes(self.data)
+        if (
+            model_id is None
+            or address is None
+            or data is None
+            or len(model_id) != 4
+            or len(address) != 4
+            or not (model_id.isascii() and address.isascii() and data.isascii())
+            or safe_int(self.manufacturer_id) != 0x41
+            or safe_int(self.device_id) not in _VALID_DEVICE_IDS
+            or not 0 <= self.command <= 0x7F
+        ):
+            self._validate_fields()
+            return
+        self.model_id = model_id
+        self.address = address
+        self.data = list(data)
+
+    def _validate_fields(self) -> None:
+        """
+        Validate and normalize message components one check at a time.
 
-        # Helper to safely convert to int for validation and formatting
-        def safe_int_for_validation(val):
-            if isinstance(val, int):
-                return val
-            if hasattr(val, "value"):  # Handle enums
-                enum_val = val.value
-                return int(enum_val) if not isinstance(enum_val, int) else enum_val
-            try:
-                return int(float(val))  # Handle floats and strings
-            except (ValueError, TypeError):
-                return 0
-
+        :raises ValueError: If message structure is invalid
+        """
         # Validate manufacturer ID (safely convert for formatting)
-        manufacturer_id_int = safe_int_for_validation(self.manufacturer_id)
+        manufacturer_id_int = safe_int(self.manufacturer_id)
         if manufacturer_id_int != 0x41:
             raise ValueError(
                 f"Roland manufacturer ID must be 0x41, got 0x{manufacturer_id_int:02X}"
             )
 
         # Validate device ID (0x10-0x1F or 0x7F for all devices) - safely convert for comparison and formatting
-        device_id_int = safe_int_for_validation(self.device_id)
-        if not (0x10 <= device_id_int <= 0x1F or device_id_int == 0x7F):
+        device_id_int = safe_int(self.device_id)
+        if device_id_int not in _VALID_DEVICE_IDS:
             raise ValueError(f"Device ID must be 0x10-0x1F or 0x7F, got 0x{device_id_int:02X}")
 
         # Validate model ID (must be 4 bytes)
         if len(self.model_id) != 4:
             raise ValueError(f"Model ID must be exactly 4 bytes, got {len(self.model_id)} bytes")
-
-        # Safely validate and convert model ID bytes
-        def safe_validate_byte(byte):
-            if isinstance(byte, int):
-                return 0 <= byte <= 0x7F
-            try:
-                byte_int = int(float(byte)) if not isinstance(byte, int) else byte
-                return 0 <= byte_int <= 0x7F
-            except (ValueError, TypeError):
-                return False
-
-        if any(not safe_validate_byte(byte) for byte in self.model_id):
-            raise ValueError("Model ID bytes must be 0-127 (7-bit safe)")
-
-        # Convert model ID bytes to integers if they aren't already
-        self.model_id = [int(float(b)) if not isinstance(b, int) else b for b in self.model_id]
+        self.model_id = _to_7bit_bytes(self.model_id, "Model ID")
 
         # Validate address (must be 4 bytes)
         if len(self.address) != 4:
             raise ValueError(f"Address must be exactly 4 bytes, got {len(self.address)} bytes")
-
-        # Safely validate and convert address bytes
-        def safe_validate_byte(byte):
-            if isinstance(byte, int):
-                return 0 <= byte <= 0x7F
-            try:
-                byte_int = int(float(byte)) if not isinstance(byte, int) else byte
-                return 0 <= byte_int <= 0x7F
-            except (ValueError, TypeError):
-                return False
-
-        if any(not safe_validate_byte(byte) for byte in self.address):
-            raise ValueError("Address bytes must be 0-127 (7-bit safe)")
-
-        # Convert address bytes to integers if they aren't already
-        self.address = [int(float(b)) if not isinstance(b, int) else b for b in self.address]
+        self.address = _to_7bit_bytes(self.address, "Address")
 
         # Validate data bytes (must be 7-bit safe)
-        # Safely convert and validate each byte
-        def safe_validate_byte(byte):
-            if isinstance(byte, int):
-                return 0 <= byte <= 0x7F
-            # Try to convert to int for validation
-            try:
-                byte_int = int(float(byte)) if not isinstance(byte, int) else byte
-                return 0 <= byte_int <= 0x7F
-            except (ValueError, TypeError):
-                return False
-
-        if any(not safe_validate_byte(byte) for byte in self.data):
-            raise ValueError("Data bytes must be 0-127 (7-bit safe)")
-
-        # Convert data bytes to integers if they aren't already
-        self.data = [int(float(b)) if not isinstance(b, int) else b for b in self.data]
+        self.data = list(_to_7bit_bytes(self.data, "Data"))
 
         # Validate command
         if not (0 <= self.command <= 0x7F):
@@ -158,22 +243,9 @@ class RolandSysExMessage(Message):
 
         :return: Checksum value (0-127)
         """
-
-        # Helper to safely convert to int
-        def safe_int(val):
-            if isinstance(val, int):
-                return val
-            if hasattr(val, "value"):  # Handle enums
-                enum_val = val.value
-                return int(enum_val) if not isinstance(enum_val, int) else enum_val
-            try:
-                return int(float(val))  # Handle floats and strings
-            except (ValueError, TypeError):
-                return 0
-
-        # Ensure all values are integers before calculating checksum
-        checksum_data = [safe_int(b) for b in (self.address + self.data)]
-        return calculate_checksum(checksum_data)
+        # address and data are normalized to 7-bit ints in __post_init__, so sum() runs in C
+        total = sum(self.address) + sum(self.data)
+        return (128 - (total & LOW_7_BITS)) & LOW_7_BITS
 
     def to_list(self) -> List[int]:
         """
@@ -183,41 +255,51 @@ class RolandSysExMessage(Message):
 
         :return: List of byte values (0-255)
         """
-
-        # Helper to safely convert to int
-        def safe_int(val):
-            if isinstance(val, int):
-                return val
-            if hasattr(val, "value"):  # Handle enums
-                enum_val = val.value
-                return int(enum_val) if not isinstance(enum_val, int) else enum_val
-            try:
-                return int(float(val))  # Handle floats and strings
-            except (ValueError, TypeError):
-                return 0
-
-        from picomidi import MidiSysExByte
-
-        msg = [
-            MidiSysExByte.START,  # F0
-            safe_int(self.manufacturer_id),  # 0x41 (Roland)
-            safe_int(self.device_id),
-        ]
-        msg.extend([safe_int(b) for b in self.model_id])  # 4 bytes
-        msg.append(safe_int(self.command))
-        msg.extend([safe_int(b) for b in self.address])  # 4 bytes
-        msg.extend([safe_int(b) for b in self.data])  # Ensure all data bytes are integers
-        msg.append(self.calculate_checksum())
-        msg.append(MidiSysExByte.END)  # F7
-        return msg
+        return list(self.to_bytes())
 
     def to_bytes(self) -> bytes:
         """
         Convert message to bytes for transmission.
 
+        The fixed header is packed in one struct call, cached until a field is
+        assigned, and joined with the data, checksum and end byte.
+
         :return: Bytes representation of the message
         """
-        return bytes(self.to_list())
+        header = self._header
+        if header is None:
+            header = _HEADER.pack(
+                _SYSEX_START,  # F0
+                safe_int(self.manufacturer_id),  # 0x41 (Roland)
+                safe_int(self.device_id),
+                self.model_id,  # 4 bytes
+                safe_int(self.command),
+                self.address,  # 4 bytes
+            )
+            self._header = header
+        return header + bytes(self.data) + bytes((self.calculate_checksum(), _SYSEX_END))
+
+    def write_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Write the encoded message into a caller-provided buffer.
+
+        Lets a sender fill one reusable buffer (e.g. a bulk dump) instead of
+        concatenating a new bytes object per message.
+
+        :param buffer: Writable buffer (bytearray or memoryview)
+        :param offset: Index in buffer at which to write the message
+        :return: Number of bytes written
+        :raises ValueError: If the message does not fit in buffer at offset
+        """
+        encoded = self.to_bytes()
+        end = offset + len(encoded)
+        if offset < 0 or end > len(buffer):
+            raise ValueError(
+                f"Buffer too small: {len(encoded)} bytes needed at offset {offset}, "
+                f"buffer is {len(buffer)} bytes"
+            )
+        buffer[offset:end] = encoded
+        return len(encoded)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "RolandSysExMessage":
@@ -228,27 +310,9 @@ class RolandSysExMessage(Message):
         :return: Parsed RolandSysExMessage instance
         :raises ValueError: If message format is invalid
         """
-        from picomidi import MidiSysExByte
-
-        if len(data) < 13:  # Minimum: F0 + 41 + dev + model(4) + cmd + addr(4) + chk + F7
-            raise ValueError(f"Message too short: expected at least 13 bytes, got {len(data)}")
-
-        if data[0] != MidiSysExByte.START:
-            raise ValueError(f"Invalid start byte: expected 0xF0, got 0x{data[0]:02X}")
-
-        if data[-1] != MidiSysExByte.END:
-            raise ValueError(f"Invalid end byte: expected 0xF7, got 0x{data[-1]:02X}")
-
-        manufacturer_id = data[1]
-        if manufacturer_id != 0x41:
-            raise ValueError(f"Not a Roland message: manufacturer ID 0x{manufacturer_id:02X}")
-
-        device_id = data[2]
-        model_id = list(data[3:7])  # 4 bytes
-        command = data[7]
-        address = list(data[8:12])  # 4 bytes
-        checksum_byte = data[-2]  # Second-to-last byte
-        data_bytes = list(data[12:-2])  # Everything between address and checksum
+        manufacturer_id, device_id, model_id, command, address, data_bytes, checksum_byte = (
+            _split_roland_sysex(data)
+        )
 
         # Create message instance
         message = cls(
@@ -270,6 +334,30 @@ class RolandSysExMessage(Message):
 
         return message
 
+    @classmethod
+    def from_bytes_many(cls, data: bytes) -> List["RolandSysExMessage"]:
+        """
+        Parse a buffer of back-to-back Roland SysEx messages, e.g. a bulk dump.
+
+        Message boundaries are located with bytes.find(), so the scan for each
+        0xF7 runs in C; each message is then parsed as by from_bytes().
+
+        :param data: Raw bytes holding one or more complete SysEx messages
+        :return: List of parsed RolandSysExMessage instances, in order
+        :raises ValueError: If any message is invalid or the buffer ends mid-message
+        """
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        messages = []
+        start = 0
+        while start < len(data):
+            end = data.find(_SYSEX_END, start)
+            if end < 0:
+                raise ValueError(f"Incomplete message at offset {start}: no 0xF7 end byte")
+            messages.append(cls.from_bytes(data[start : end + 1]))
+            start = end + 1
+        return messages
+
     def __repr__(self) -> str:
         """String representation of the message."""
         return (
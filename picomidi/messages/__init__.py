@@ -2,15 +2,24 @@
 MIDI Message Classes
 
 This module provides access to all MIDI message classes.
+Each class is imported from its submodule on first access (PEP 562),
+so importing one message module does not load all the others.
 """
 
-from picomidi.messages.aftertouch import Aftertouch
-from picomidi.messages.control_change import ControlChange
-from picomidi.messages.note import MidiNote
-from picomidi.messages.pitch_bend import PitchBend
-from picomidi.messages.program_change import ProgramChange
-from picomidi.messages.song import Song
-from picomidi.messages.sysex import MidiSysExByte
+from picomidi.utils.lazy import lazy_attributes
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "Aftertouch": "picomidi.messages.aftertouch",
+    "ControlChange": "picomidi.messages.control_change",
+    "MidiNote": "picomidi.messages.note",
+    "PitchBend": "picomidi.messages.pitch_bend",
+    "ProgramChange": "picomidi.messages.program_change",
+    "Song": "picomidi.messages.song",
+    "MidiSysExByte": "picomidi.messages.sysex",
+}
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "Aftertouch",
@@ -0,0 +1,115 @@
+"""
+MIDI Stream Decoder
+
+This module provides a batch decoder that walks a whole buffer of raw
+MIDI bytes and returns the channel voice messages it contains as
+parallel columns, without creating a message object per event.
+"""
+
+from typing import Tuple
+
+# System realtime status bytes, which may be interleaved anywhere in a stream
+_SYSTEM_REALTIME_BYTES = bytes(range(0xF8, 0x100))
+
+# Data bytes following each system common status byte (0xF0-0xF7); SysEx is handled separately
+_SYSTEM_COMMON_DATA_LENGTH = (0, 1, 2, 1, 0, 0, 0, 0)
+
+
+def strip_system_realtime(data: bytes) -> bytes:
+    """
+    Remove system realtime bytes (0xF8-0xFF) from a raw MIDI buffer.
+
+    :param data: Raw MIDI bytes
+    :return: The same bytes without any system realtime bytes
+    """
+    # One C-level pass, so messages can then be read at fixed offsets
+    return bytes(data).translate(None, _SYSTEM_REALTIME_BYTES)
+
+
+def decode_into(
+    data: bytes,
+    msg_types: bytearray,
+    channels: bytearray,
+    data1: bytearray,
+    data2: bytearray,
+    running_status: int = 0,
+) -> Tuple[int, int]:
+    """
+    Decode complete channel voice messages from data, appending them to the columns.
+
+    data must not contain system realtime bytes (see strip_system_realtime()).
+    Decoding stops at the first incomplete message, so the caller can keep
+    the unconsumed tail and resume once more bytes arrive.
+
+    :param data: Raw MIDI bytes without system realtime bytes
+    :param msg_types: Column receiving each message type (status high nibble, e.g. 0x90)
+    :param channels: Column receiving each channel (0-15)
+    :param data1: Column receiving each first data byte
+    :param data2: Column receiving each second data byte (0 for one-data-byte messages)
+    :param running_status: Running status in effect before data (0 = none)
+    :return: Tuple of (number of bytes consumed, running status after them)
+    """
+    i = 0
+    n = len(data)
+    while i < n:
+        byte = data[i]
+        if byte == 0xF0:
+            # SysEx: skip to the terminating 0xF7
+            end = data.find(0xF7, i + 1)
+            if end < 0:
+                break  # Incomplete SysEx
+            i = end + 1
+            running_status = 0
+            continue
+        if byte >= 0xF0:
+            # System common: skip status and its data bytes
+            end = i + 1 + _SYSTEM_COMMON_DATA_LENGTH[byte - 0xF0]
+            if end > n:
+                break  # Need more data
+            i = end
+            running_status = 0
+            continue
+        start = i
+        if byte & 0x80:
+            running_status = byte
+            i += 1
+        elif not running_status:
+            i += 1  # Stray data byte with no status to apply it to
+            continue
+
+        # Program Change (0xC0) and Channel Aftertouch (0xD0) carry one data byte
+        one_data_byte = (running_status & 0xE0) == 0xC0
+        if i + (1 if one_data_byte else 2) > n:
+            i = start
+            break  # Need more data
+        first = data[i]
+        second = 0 if one_data_byte else data[i + 1]
+        if (first | second) & 0x80:
+            # A status byte cut the message short; drop it and resume at that byte
+            i += 0 if first & 0x80 else 1
+            continue
+        msg_types.append(running_status & 0xF0)
+        channels.append(running_status & 0x0F)
+        data1.append(first)
+        data2.append(second)
+        i += 1 if one_data_byte else 2
+
+    return i, running_status
+
+
+def decode_stream(data: bytes) -> Tuple[bytearray, bytearray, bytearray, bytearray]:
+    """
+    Decode channel voice messages from a raw MIDI byte buffer into columns.
+
+    Running status is honoured, system realtime bytes may appear anywhere
+    and are skipped, SysEx and system common messages are skipped (and
+    cancel running status). A trailing incomplete message is ignored.
+
+    :param data: Raw MIDI bytes
+    :return: Tuple of (message types, channels, data1, data2) where the
+             message type is the status high nibble (e.g. 0x90), the channel
+             is 0-15 and data2 is 0 for one-data-byte messages
+    """
+    columns = (bytearray(), bytearray(), bytearray(), bytearray())
+    decode_into(strip_system_realtime(data), *columns)
+    return columns
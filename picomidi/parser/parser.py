@@ -5,7 +5,7 @@ This module provides a parser for converting raw MIDI bytes
 into structured message objects.
 """
 
-from typing import Iterator, List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from mido.messages.specs import SYSEX_END
 from picomidi.core.channel import Channel
@@ -17,7 +17,15 @@ from picomidi.message.channel_voice.note_off import NoteOff
 from picomidi.message.channel_voice.note_on import NoteOn
 from picomidi.message.channel_voice.pitch_bend import PitchBend
 from picomidi.message.channel_voice.program_change import ProgramChange
-from picomidi.utils.conversion import combine_7bit_msb_lsb
+from picomidi.parser.decoder import decode_into, strip_system_realtime
+
+# Shared immutable values for every channel and 7-bit data byte, indexed by value,
+# so decoding a message does not construct (and validate) new value objects
+_CHANNELS = tuple(Channel(channel) for channel in range(16))
+_NOTES = tuple(Note(value) for value in range(128))
+_VELOCITIES = tuple(Velocity(value) for value in range(128))
+_CONTROL_VALUES = tuple(ControlValue(value) for value in range(128))
+_PROGRAM_NUMBERS = tuple(ProgramNumber(value) for value in range(128))
 
 
 class Parser:
@@ -28,10 +36,16 @@ class Parser:
     repeated messages of the same type) and buffers incomplete messages.
     """
 
+    __slots__ = ("buffer", "_pos", "_sysex_scanned", "running_status", "_running_entry")
+
     def __init__(self):
         """Initialize the parser."""
         self.buffer = bytearray()
+        self._pos = 0  # Index of the first unparsed byte in buffer
+        self._sysex_scanned = 0  # Bytes of an incomplete SysEx already searched for its end
         self.running_status: Optional[int] = None
+        # _STATUS_DISPATCH entry of running_status, kept alongside it
+        self._running_entry: Optional[Tuple[int, object, int]] = None
 
     def feed(self, data: bytes) -> Iterator[Message]:
         """
@@ -43,112 +57,146 @@ class Parser:
         self.buffer.extend(data)
         yield from self._parse_buffer()
 
+    def feed_bulk(self, data: bytes) -> Tuple[bytearray, bytearray, bytearray, bytearray]:
+        """
+        Feed raw bytes and return complete channel voice messages as columns.
+
+        The batch counterpart of feed(): no message objects are created.
+        Running status and incomplete trailing messages carry over between
+        calls (and to feed()).
+
+        System Realtime bytes (0xF8-0xFF, e.g. MIDI clock and Start/Stop) are
+        discarded, including any interleaved with the data bytes of a message.
+        feed() does not skip them; it passes each one to the System Realtime
+        parser instead (not implemented yet).
+
+        :param data: Raw MIDI bytes
+        :return: Tuple of (message types, channels, data1, data2), see
+                 picomidi.parser.decoder.decode_stream()
+        """
+        self.buffer.extend(data)
+        stream = strip_system_realtime(self.buffer[self._pos :])
+        columns = (bytearray(), bytearray(), bytearray(), bytearray())
+        consumed, running_status = decode_into(stream, *columns, self.running_status or 0)
+        self.buffer[:] = stream[consumed:]
+        self._pos = 0
+        self._sysex_scanned = 0  # Realtime bytes were stripped, so offsets no longer hold
+        self.running_status = running_status or None
+        self._running_entry = _STATUS_DISPATCH[running_status] if running_status else None
+        return columns
+
     def _parse_buffer(self) -> Iterator[Message]:
         """
         Parse buffer and yield complete messages.
 
+        Consumed bytes are tracked with a cursor and only removed from the
+        buffer once parsing stops, so each byte is copied at most once.
+
         :yield: Complete MIDI message objects
         """
-        while len(self.buffer) > 0:
-            # Check if we have enough data for a message
-            status_byte = self.buffer[0]
-
-            # Determine message length
-            if MidiStatus.is_system_realtime(status_byte):
-                # System realtime messages are 1 byte
+        buffer = self.buffer
+        while self._pos < len(buffer):
+            pos = self._pos
+            status_byte = buffer[pos]
+            # One table lookup classifies the byte and gives its decoder and message length
+            entry = _STATUS_DISPATCH[status_byte]
+            kind, decoder, length = entry
+
+            if kind == _DATA_BYTE:
+                entry = self._running_entry
+                if entry is None:
+                    # Stray data byte with no status to apply it to, skip it
+                    self._pos = pos + 1
+                    continue
+                # Running status: the status byte was omitted, so treat the data as
+                # starting one byte earlier, reusing the already decoded status
+                status_byte = self.running_status
+                kind, decoder, length = entry
+                pos -= 1
+
+            if kind == _CHANNEL_VOICE:
+                if len(buffer) - pos < length:
+                    break  # Need more data
+                # Read the data bytes here once, so decoders work on plain ints
+                data1 = buffer[pos + 1]
+                data2 = buffer[pos + 2] if length == 3 else 0
+                if (data1 | data2) & 0x80:
+                    # A status byte cut the message short; drop it and resume at that byte
+                    self._pos = pos + 1 if data1 & 0x80 else pos + 2
+                    continue
+                yield decoder(self, status_byte & 0x0F, data1, data2)
+                self._pos = pos + length
+                self.running_status = status_byte
+                self._running_entry = entry
+            elif kind == _SYSTEM_REALTIME:
+                # System realtime messages are 1 byte and leave running status intact
                 yield self._parse_system_realtime(status_byte)
-                self.buffer = self.buffer[1:]
-                continue
-
-            if MidiStatus.is_channel_voice(status_byte):
-                msg_type = MidiStatus.get_message_type(status_byte)
-                channel = MidiStatus.get_channel(status_byte)
-
-                # Determine data length based on message type
-                if msg_type in (
-                    MidiStatus.NOTE_ON,
-                    MidiStatus.NOTE_OFF,
-                    MidiStatus.POLY_AFTERTOUCH,
-                ):
-                    if len(self.buffer) < 3:
-                        break  # Need more data
-                    yield self._parse_note_message(msg_type, channel)
-                    self.buffer = self.buffer[3:]
-                    self.running_status = status_byte
-                elif msg_type == MidiStatus.CONTROL_CHANGE:
-                    if len(self.buffer) < 3:
-                        break  # Need more data
-                    yield self._parse_control_change(channel)
-                    self.buffer = self.buffer[3:]
-                    self.running_status = status_byte
-                elif msg_type == MidiStatus.PROGRAM_CHANGE:
-                    if len(self.buffer) < 2:
-                        break  # Need more data
-                    yield self._parse_program_change(channel)
-                    self.buffer = self.buffer[2:]
-                    self.running_status = status_byte
-                elif msg_type == MidiStatus.CHANNEL_AFTERTOUCH:
-                    if len(self.buffer) < 2:
-                        break  # Need more data
-                    yield self._parse_channel_aftertouch(channel)
-                    self.buffer = self.buffer[2:]
-                    self.running_status = status_byte
-                elif msg_type == MidiStatus.PITCH_BEND:
-                    if len(self.buffer) < 3:
-                        break  # Need more data
-                    yield self._parse_pitch_bend(channel)
-                    self.buffer = self.buffer[3:]
-                    self.running_status = status_byte
-                else:
-                    # Unknown message type, skip
-                    self.buffer = self.buffer[1:]
-            elif status_byte == MidiStatus.SYSTEM_EXCLUSIVE:
+                self._pos = pos + 1
+            elif kind == _SYSTEM_EXCLUSIVE:
                 # SysEx messages are variable length, terminated by 0xF7
-                if SYSEX_END not in self.buffer:
+                # Resume the search after the part of the message scanned by earlier
+                # feeds, so a long SysEx arriving in chunks is scanned only once
+                end_index = buffer.find(SYSEX_END, pos + self._sysex_scanned)
+                if end_index < 0:
+                    self._sysex_scanned = len(buffer) - pos
                     break  # Need more data
-                end_index = self.buffer.index(0xF7) + 1
+                self._sysex_scanned = 0
                 # For now, skip SysEx parsing (can be added later)
-                self.buffer = self.buffer[end_index:]
+                self._pos = end_index + 1
+                self.running_status = self._running_entry = None
             else:
-                # Unknown or unsupported message, skip one byte
-                self.buffer = self.buffer[1:]
+                # System common or undefined message, skip one byte
+                self._pos = pos + 1
+                self.running_status = self._running_entry = None
+
+        # Drop the consumed bytes in one step
+        del buffer[: self._pos]
+        self._pos = 0
 
-    def _parse_note_message(self, msg_type: int, channel: int) -> Message:
+    def _parse_note_message(self, msg_type: int, channel: int, data1: int, data2: int) -> Message:
         """Parse Note On or Note Off message."""
-        note = Note(self.buffer[1])
-        velocity = Velocity(self.buffer[2])
-        ch = Channel(channel)
+        note = _NOTES[data1]
+        velocity = _VELOCITIES[data2]
+        ch = _CHANNELS[channel]
 
         if msg_type == MidiStatus.NOTE_ON:
             return NoteOn(ch, note, velocity)
         else:  # NOTE_OFF
             return NoteOff(ch, note, velocity)
 
-    def _parse_control_change(self, channel: int) -> Message:
+    def _parse_note_on(self, channel: int, data1: int, data2: int) -> Message:
+        """Parse Note On message."""
+        return self._parse_note_message(MidiStatus.NOTE_ON, channel, data1, data2)
+
+    def _parse_note_off(self, channel: int, data1: int, data2: int) -> Message:
+        """Parse Note Off message."""
+        return self._parse_note_message(MidiStatus.NOTE_OFF, channel, data1, data2)
+
+    def _parse_poly_aftertouch(self, channel: int, data1: int, data2: int) -> Message:
+        """Parse Poly Aftertouch message."""
+        return self._parse_note_message(MidiStatus.POLY_AFTERTOUCH, channel, data1, data2)
+
+    def _parse_control_change(self, channel: int, data1: int, data2: int) -> Message:
         """Parse Control Change message."""
-        controller = self.buffer[1]
-        value = ControlValue(self.buffer[2])
-        ch = Channel(channel)
+        controller = data1
+        value = _CONTROL_VALUES[data2]
+        ch = _CHANNELS[channel]
         return ControlChange(ch, controller, value)
 
-    def _parse_program_change(self, channel: int) -> Message:
-        """Parse Program Change message."""
-        program = ProgramNumber(self.buffer[1])
-        ch = Channel(channel)
+    def _parse_program_change(self, channel: int, data1: int, data2: int) -> Message:
+        """Parse Program Change message (data2 is unused)."""
+        program = _PROGRAM_NUMBERS[data1]
+        ch = _CHANNELS[channel]
         return ProgramChange(ch, program)
 
-    def _parse_pitch_bend(self, channel: int) -> Message:
+    def _parse_pitch_bend(self, channel: int, data1: int, data2: int) -> Message:
         """Parse Pitch Bend message."""
         # MIDI sends LSB first, then MSB
-        lsb = self.buffer[1]
-        msb = self.buffer[2]
-        # Combine: MSB is high bits, LSB is low bits
-        unsigned_14bit = combine_7bit_msb_lsb(msb, lsb)
-        value = PitchBendValue.from_14bit(unsigned_14bit)
-        ch = Channel(channel)
+        value = PitchBendValue.from_msb_lsb(data2, data1)
+        ch = _CHANNELS[channel]
         return PitchBend(ch, value)
 
-    def _parse_channel_aftertouch(self, channel: int) -> Message:
+    def _parse_channel_aftertouch(self, channel: int, data1: int, data2: int) -> Message:
         """Parse Channel Aftertouch message (placeholder)."""
         # TODO: Implement ChannelAftertouch message class
         raise NotImplementedError("Channel Aftertouch parsing not yet implemented")
@@ -161,4 +209,47 @@ class Parser:
     def reset(self):
         """Reset parser state (clear buffer and running status)."""
         self.buffer.clear()
-        self.running_status = None
+        self._pos = 0
+        self._sysex_scanned = 0
+        self.running_status = self._running_entry = None
+
+
+# Kinds of byte in a MIDI stream, as classified by _STATUS_DISPATCH
+_DATA_BYTE = 0
+_CHANNEL_VOICE = 1
+_SYSTEM_EXCLUSIVE = 2
+_SYSTEM_REALTIME = 3
+_OTHER = 4
+
+
+def _build_status_dispatch() -> tuple:
+    """
+    Build the 256-entry (kind, decoder, message length) table indexed by byte value.
+
+    decoder is only set for channel voice status bytes (0x80-0xEF).
+    """
+    by_type = {
+        MidiStatus.NOTE_OFF: (Parser._parse_note_off, 3),
+        MidiStatus.NOTE_ON: (Parser._parse_note_on, 3),
+        MidiStatus.POLY_AFTERTOUCH: (Parser._parse_poly_aftertouch, 3),
+        MidiStatus.CONTROL_CHANGE: (Parser._parse_control_change, 3),
+        MidiStatus.PROGRAM_CHANGE: (Parser._parse_program_change, 2),
+        MidiStatus.CHANNEL_AFTERTOUCH: (Parser._parse_channel_aftertouch, 2),
+        MidiStatus.PITCH_BEND: (Parser._parse_pitch_bend, 3),
+    }
+    table = []
+    for byte in range(256):
+        if byte < 0x80:
+            table.append((_DATA_BYTE, None, 1))
+        elif MidiStatus.is_channel_voice(byte):
+            table.append((_CHANNEL_VOICE, *by_type[byte & 0xF0]))
+        elif byte == MidiStatus.SYSTEM_EXCLUSIVE:
+            table.append((_SYSTEM_EXCLUSIVE, None, 0))
+        elif MidiStatus.is_system_realtime(byte):
+            table.append((_SYSTEM_REALTIME, None, 1))
+        else:
+            table.append((_OTHER, None, 1))
+    return tuple(table)
+
+
+_STATUS_DISPATCH = _build_status_dispatch()
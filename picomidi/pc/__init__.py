@@ -2,16 +2,19 @@
 Backward compatibility shim for picomidi.pc
 
 This module is deprecated. Use picomidi.messages.program_change instead.
-"""
 
-import warnings
+The import, and the deprecation warning, happen on first access to
+ProgramChange, so importing this package costs nothing by itself.
+"""
 
-from picomidi.messages.program_change import ProgramChange
+from picomidi.utils.lazy import lazy_attributes
 
-warnings.warn(
-    "picomidi.pc.program_change is deprecated; " "use picomidi.messages.program_change instead.",
-    DeprecationWarning,
-    stacklevel=2,
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {"ProgramChange": "picomidi.messages.program_change"},
+    deprecation=(
+        "picomidi.pc.program_change is deprecated; use picomidi.messages.program_change instead."
+    ),
 )
 
 __all__ = ["ProgramChange"]
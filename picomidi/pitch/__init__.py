@@ -2,16 +2,17 @@
 Backward compatibility shim for picomidi.pitch
 
 This module is deprecated. Use picomidi.messages.pitch_bend instead.
-"""
 
-import warnings
+The import, and the deprecation warning, happen on first access to
+PitchBend, so importing this package costs nothing by itself.
+"""
 
-from picomidi.messages.pitch_bend import PitchBend
+from picomidi.utils.lazy import lazy_attributes
 
-warnings.warn(
-    "picomidi.pitch.bend is deprecated; use picomidi.messages.pitch_bend instead.",
-    DeprecationWarning,
-    stacklevel=2,
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {"PitchBend": "picomidi.messages.pitch_bend"},
+    deprecation="picomidi.pitch.bend is deprecated; use picomidi.messages.pitch_bend instead.",
 )
 
 __all__ = ["PitchBend"]
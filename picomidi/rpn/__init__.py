@@ -5,10 +5,11 @@ Provides base classes and utilities for working with Registered Parameter Number
 and Non-Registered Parameter Numbers (NRPN).
 """
 
-from picomidi.rpn.parameter_map import NRPNMap, ParameterMap, RPNMap
+from picomidi.rpn.parameter_map import DenseParameterMap, NRPNMap, ParameterMap, RPNMap
 
 __all__ = [
     "ParameterMap",
+    "DenseParameterMap",
     "RPNMap",
     "NRPNMap",
 ]
@@ -4,8 +4,16 @@ Parameter Map for RPN/NRPN
 Provides a generic mapping utility for RPN/NRPN parameters.
 """
 
+from array import array
+from itertools import compress
 from typing import Any, Dict, ItemsView, Optional, Tuple
 
+# Number of 14-bit RPN/NRPN parameter numbers
+_PARAMETER_COUNT = 1 << 14
+
+# Positions of the set bits in every byte value, indexed by byte
+_SET_BITS = tuple(tuple(bit for bit in range(8) if (byte >> bit) & 1) for byte in range(256))
+
 
 class ParameterMap:
     """
@@ -14,6 +22,8 @@ class ParameterMap:
     Used for mapping parameter numbers to their MSB/LSB controller values.
     """
 
+    __slots__ = ("_map",)
+
     def __init__(self, mapping: Optional[Dict[int, Tuple[int, int]]] = None) -> None:
         """
         Initialize the parameter map.
@@ -39,10 +49,10 @@ class ParameterMap:
         :param default: Default value if not found
         :return: LSB value or default
         """
-        result = self._map.get(key, default)
-        if isinstance(result, tuple):
-            return result[1]  # return LSB
-        return result
+        pair = self._map.get(key)
+        if pair is None:
+            return default
+        return pair[1]  # Values are always (MSB, LSB) pairs
 
     def get_lsb(self, key: int) -> Optional[int]:
         """
@@ -51,7 +61,8 @@ class ParameterMap:
         :param key: Parameter number
         :return: LSB value or None
         """
-        return self._map.get(key, (None, None))[1]
+        pair = self._map.get(key)
+        return None if pair is None else pair[1]
 
     def get_msb(self, key: int) -> Optional[int]:
         """
@@ -60,7 +71,8 @@ class ParameterMap:
         :param key: Parameter number
         :return: MSB value or None
         """
-        return self._map.get(key, (None, None))[0]
+        pair = self._map.get(key)
+        return None if pair is None else pair[0]
 
     def get_msb_lsb(self, key: int) -> Optional[Tuple[int, int]]:
         """
@@ -91,6 +103,128 @@ class ParameterMap:
         return f"{self.__class__.__name__}({self._map})"
 
 
+class DenseParameterMap(ParameterMap):
+    """
+    Parameter map stored as flat arrays indexed by the 14-bit parameter number.
+
+    MSB and LSB values live in two array('B') of 16384 entries with a
+    presence bitmap beside them, so the footprint is a fixed ~34 KB however
+    many parameters are mapped and a lookup is a couple of array indexes.
+    Suited to large, densely populated maps; keys must be 0-16383 and
+    MSB/LSB values 0-255.
+    """
+
+    __slots__ = ("_msb", "_lsb", "_present", "_count")
+
+    def __init__(self, mapping: Optional[Dict[int, Tuple[int, int]]] = None) -> None:
+        """
+        Initialize the parameter map.
+
+        :param mapping: Optional dictionary mapping parameter numbers to (MSB, LSB) tuples
+        """
+        self._msb = array("B", bytes(_PARAMETER_COUNT))
+        self._lsb = array("B", bytes(_PARAMETER_COUNT))
+        self._present = bytearray(_PARAMETER_COUNT >> 3)
+        self._count = 0  # Number of mapped parameters
+        if mapping:
+            for key, msb_lsb_pair in mapping.items():
+                self.add_mapping(key, msb_lsb_pair)
+
+    def _has(self, key: int) -> bool:
+        """Check the presence bit for a parameter number."""
+        return 0 <= key < _PARAMETER_COUNT and (self._present[key >> 3] >> (key & 7)) & 1 == 1
+
+    def add_mapping(self, key: int, msb_lsb_pair: Tuple[int, int]) -> None:
+        """
+        Add a mapping from parameter number to MSB/LSB pair.
+
+        :param key: Parameter number (0-16383)
+        :param msb_lsb_pair: Tuple of (MSB, LSB) values
+        :raises ValueError: If the parameter number or either value is out of range
+        """
+        if not 0 <= key < _PARAMETER_COUNT:
+            raise ValueError(f"Parameter number must be 0-{_PARAMETER_COUNT - 1}, got {key}")
+        msb, lsb = msb_lsb_pair
+        # Check both values before writing, so a bad pair leaves the entry untouched
+        if not (0 <= msb <= 255 and 0 <= lsb <= 255):
+            raise ValueError(f"MSB and LSB must be 0-255, got ({msb}, {lsb})")
+        self._msb[key] = msb
+        self._lsb[key] = lsb
+        bit = 1 << (key & 7)
+        present = self._present[key >> 3]
+        if not present & bit:
+            self._present[key >> 3] = present | bit
+            self._count += 1
+
+    def get(self, key: int, default: Any = None) -> Any:
+        """
+        Get the LSB value for a parameter (for backward compatibility).
+
+        :param key: Parameter number
+        :param default: Default value if not found
+        :return: LSB value or default
+        """
+        return self._lsb[key] if self._has(key) else default
+
+    def get_lsb(self, key: int) -> Optional[int]:
+        """
+        Get the LSB value for a parameter.
+
+        :param key: Parameter number
+        :return: LSB value or None
+        """
+        return self._lsb[key] if self._has(key) else None
+
+    def get_msb(self, key: int) -> Optional[int]:
+        """
+        Get the MSB value for a parameter.
+
+        :param key: Parameter number
+        :return: MSB value or None
+        """
+        return self._msb[key] if self._has(key) else None
+
+    def get_msb_lsb(self, key: int) -> Optional[Tuple[int, int]]:
+        """
+        Get both MSB and LSB values for a parameter.
+
+        :param key: Parameter number
+        :return: Tuple of (MSB, LSB) or None
+        """
+        return (self._msb[key], self._lsb[key]) if self._has(key) else None
+
+    def __getitem__(self, key: int) -> Tuple[int, int]:
+        """Get MSB/LSB pair for a parameter."""
+        if not self._has(key):
+            raise KeyError(key)
+        return self._msb[key], self._lsb[key]
+
+    def __contains__(self, key: int) -> bool:
+        """Check if parameter exists in map."""
+        return self._has(key)
+
+    def items(self) -> ItemsView[int, Tuple[int, int]]:
+        """Get all parameter mappings."""
+        return self._to_dict().items()
+
+    def _to_dict(self) -> Dict[int, Tuple[int, int]]:
+        """Collect the mapped parameters into a dict, in parameter number order."""
+        if not self._count:
+            return {}
+        msb, lsb, present = self._msb, self._lsb, self._present
+        mapped = {}
+        # compress() skips the all-zero bytes of the presence bitmap at C speed
+        for index in compress(range(len(present)), present):
+            base = index << 3
+            for bit in _SET_BITS[present[index]]:
+                key = base | bit
+                mapped[key] = (msb[key], lsb[key])
+        return mapped
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._to_dict()})"
+
+
 class RPNMap(ParameterMap):
     """
     Map for Registered Parameter Numbers (RPN).
@@ -98,7 +232,7 @@ class RPNMap(ParameterMap):
     Maps RPN parameter numbers to their MSB/LSB controller values.
     """
 
-    pass
+    __slots__ = ()
 
 
 class NRPNMap(ParameterMap):
@@ -108,4 +242,4 @@ class NRPNMap(ParameterMap):
     Maps NRPN parameter numbers to their MSB/LSB controller values.
     """
 
-    pass
+    __slots__ = ()
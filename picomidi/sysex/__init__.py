@@ -2,16 +2,17 @@
 Backward compatibility shim for picomidi.sysex
 
 This module is deprecated. Use picomidi.messages.sysex instead.
-"""
 
-import warnings
+The import, and the deprecation warning, happen on first access to
+MidiSysExByte, so importing this package costs nothing by itself.
+"""
 
-from picomidi.messages.sysex import MidiSysExByte
+from picomidi.utils.lazy import lazy_attributes
 
-warnings.warn(
-    "picomidi.sysex.byte is deprecated; use picomidi.messages.sysex instead.",
-    DeprecationWarning,
-    stacklevel=2,
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {"MidiSysExByte": "picomidi.messages.sysex"},
+    deprecation="picomidi.sysex.byte is deprecated; use picomidi.messages.sysex instead.",
 )
 
 __all__ = ["MidiSysExByte"]
@@ -5,66 +5,50 @@ This module provides functions for handling System Exclusive (SysEx) messages,
 including checksum calculation and byte formatting.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from picomidi.core.bitmask import BitMask
+from picomidi.core.bitmask import LOW_7_BITS
+from picomidi.utils.conversion import safe_int
+from picomidi.utils.formatting import _HEX
+from picomidi.utils.formatting import int_to_hex  # Re-exported; defined once in utils.formatting
 
 
-def calculate_checksum(data: List[int]) -> int:
+def calculate_checksum(data: Union[List[int], bytes, bytearray, memoryview]) -> int:
     """
     Calculate Roland-style checksum for SysEx parameter messages.
 
     The Roland checksum formula is: (128 - (sum of data bytes & 0x7F)) & 0x7F
     This ensures the checksum is always a valid 7-bit MIDI value (0-127).
+    Bytes-like input is summed directly, without converting it to a list first.
 
-    :param data: List of integers (bytes) to calculate checksum for
+    :param data: List of integers or bytes-like object to calculate checksum for
     :return: Checksum value (0-127)
     """
-    return (128 - (sum(data) & BitMask.LOW_7_BITS)) & BitMask.LOW_7_BITS
+    return (128 - (sum(data) & LOW_7_BITS)) & LOW_7_BITS
 
 
-def bytes_to_hex(byte_list: List[int], prefix: str = "F0") -> str:
+def bytes_to_hex(
+    byte_list: Union[List[int], bytes, bytearray, memoryview], prefix: str = "F0"
+) -> str:
     """
     Convert a list of byte values to a space-separated hex string.
 
-    :param byte_list: List of integers (bytes)
+    Bytes-like input, and lists of plain ints in the 0-255 range, are
+    formatted in one bytes.hex() call; anything else (enums, floats,
+    strings) is converted value by value, through a lookup table.
+
+    :param byte_list: List of integers (bytes) or bytes-like object
     :param prefix: Optional prefix (default is "F0" for SysEx messages)
     :return: Formatted hex string
     """
-
-    # Safely convert to int for formatting (handles strings, enums, floats, etc.)
-    def safe_int(val):
-        # Check for enums FIRST (IntEnum inherits from int, so isinstance check must come after)
-        if hasattr(val, "value") and not isinstance(
-            val, type
-        ):  # Handle enums (but not enum classes)
-            enum_val = val.value
-            # Ensure we get the actual integer value, not the enum
-            if isinstance(enum_val, int) and not hasattr(enum_val, "value"):
-                return enum_val
-            # If enum_val is still an enum, recurse
-            if hasattr(enum_val, "value"):
-                return safe_int(enum_val)
-            try:
-                return int(float(enum_val))  # Handle string enum values
-            except (ValueError, TypeError):
-                return 0
-        if isinstance(val, int):
-            return val
+    if isinstance(byte_list, (bytes, bytearray, memoryview)):
+        hex_bytes = byte_list.hex(" ").upper()
+    else:
         try:
-            return int(float(val))  # Handle floats and strings
-        except (ValueError, TypeError):
-            return 0
-
-    hex_bytes = " ".join(f"{safe_int(byte):02X}" for byte in byte_list)
+            hex_bytes = bytes(byte_list).hex(" ").upper()
+        except (TypeError, ValueError):
+            hex_bytes = " ".join(
+                _HEX[value] if 0 <= value <= 0xFF else f"{value:02X}"
+                for value in map(safe_int, byte_list)
+            )
     return f"{prefix} {hex_bytes}" if prefix else hex_bytes
-
-
-def int_to_hex(value: int) -> str:
-    """
-    Converts an integer value to a hexadecimal string representation.
-    The result is formatted in uppercase and without the '0x' prefix.
-    :param value: int The integer value to be converted to hex.
-    :return: str The hexadecimal string representation.
-    """
-    return hex(value)[2:].upper()
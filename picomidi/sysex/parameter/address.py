@@ -18,9 +18,9 @@ Methods:
                              the enum name with spaces and title casing.
     validate_value(value: int): Validates the provided value against the parameter's valid
                                 range and returns the value if it is valid.
-    get_name_by_address(address: int): Static method that returns the name of the parameter
+    get_name_by_address(address: int): Class method that returns the name of the parameter
                                        corresponding to address given address.
-    get_by_name(param_name: str): Static method that returns the `SynthParameter` member
+    get_by_name(param_name: str): Class method that returns the `SynthParameter` member
                                   corresponding to address given name.
 
 Example
@@ -35,26 +35,34 @@ Example
 """
 
 from enum import Enum
-from typing import Dict, Optional, T, Tuple, Type
+from functools import lru_cache
+from typing import Dict, Optional, T, Tuple, Type, Union
 
 from picomidi.constant import Midi
-from picomidi.core.bitmask import BitMask
+from picomidi.core.bitmask import FULL_BYTE
 from picomidi.sysex.parameter.map import map_range
 
 
 class AddressParameter(Enum):
     """
     Base class for synthesizer parameters with associated addresses and valid value ranges.
+
+    CONVERSION_OFFSETS, switches and bipolar_parameters are shared by all
+    members of a class. Names assigned in an enum body become members, so
+    subclasses set them on the class after its definition (and before any
+    value conversion, which binds each member's converter on first use):
+
+    >>> class MySynth(AddressParameter):
+    ...     LEVEL = (0x10, 0, 127)
+    >>> MySynth.CONVERSION_OFFSETS = {"LEVEL": 64}
+    >>> MySynth.switches = (MySynth.LEVEL,)
     """
 
     def __init__(self, address: int, min_val: int, max_val: int):
         self._display_name: str | None = None
-        self.CONVERSION_OFFSETS: Dict[str, int] = {}
         self.address = address
         self.min_val = min_val
         self.max_val = max_val
-        self.switches = []  # override in subclasses
-        self.bipolar_parameters = []
 
     def __str__(self) -> str:
         """
@@ -89,7 +97,7 @@ class AddressParameter(Enum):
         :param address: int
         :return: parameter member or None
         """
-        return next((parameter for parameter in cls if parameter.address == address), None)
+        return _address_index(cls).get(address)
 
     @property
     def is_switch(self) -> bool:
@@ -138,21 +146,19 @@ class AddressParameter(Enum):
 
         return value
 
-    @staticmethod
-    def get_name_by_address(address: int) -> Optional[str]:
+    @classmethod
+    def get_name_by_address(cls, address: int) -> Optional[str]:
         """
         Get the parameter name by address.
 
         :param address: int address of the parameter
         :return: str name of the parameter or None
         """
-        for param in AddressParameter:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
+        param = _address_index(cls).get(address)
+        return param.name if param is not None else None
 
-    @staticmethod
-    def get_by_name(param_name: str) -> Optional[T]:
+    @classmethod
+    def get_by_name(cls: Type[T], param_name: str) -> Optional[T]:
         """
         Get the parameter member by name.
 
@@ -160,7 +166,7 @@ class AddressParameter(Enum):
         :return: parameter member or None
         """
         # Return the parameter member by name, or None if not found
-        return AddressParameter.__members__.get(param_name, None)
+        return cls.__members__.get(param_name, None)
 
     def get_address_for_partial(self, partial_number: int = 0) -> Tuple[int, int]:
         """
@@ -181,19 +187,7 @@ class AddressParameter(Enum):
         """
         if value is None:
             return
-        conversion = self.CONVERSION_OFFSETS.get(self.name)
-
-        if conversion == "map_range":
-            return (
-                map_range(value, 54, 74, -100, 100)
-                if reverse
-                else map_range(value, -100, 100, 54, 74)
-            )
-
-        if isinstance(conversion, int):
-            return value - conversion if reverse else value + conversion
-
-        return value  # Default case: return as is
+        return self._from_midi(value) if reverse else self._to_midi(value)
 
     def convert_to_midi(self, slider_value: int) -> int:
         """
@@ -202,7 +196,7 @@ class AddressParameter(Enum):
         :param slider_value: int The digital value
         :return: int The MIDI value
         """
-        return self.convert_value(slider_value)
+        return None if slider_value is None else self._to_midi(slider_value)
 
     def convert_from_midi(self, midi_value: int) -> int:
         """
@@ -211,7 +205,36 @@ class AddressParameter(Enum):
         :param midi_value: int The MIDI value
         :return: int The digital value
         """
-        return self.convert_value(midi_value, reverse=True)
+        return None if midi_value is None else self._from_midi(midi_value)
+
+    def _bind_converters(self) -> None:
+        """
+        Store this member's conversion functions as instance attributes.
+
+        The conversion for a member is fixed, so CONVERSION_OFFSETS is looked up
+        once, on the first conversion, instead of on every value. The instance
+        attributes then shadow the _to_midi/_from_midi methods below.
+        """
+        conversion = self.CONVERSION_OFFSETS.get(self.name)
+
+        if conversion == "map_range":
+            self._to_midi = lambda value: map_range(value, -100, 100, 54, 74)
+            self._from_midi = lambda value: map_range(value, 54, 74, -100, 100)
+        elif isinstance(conversion, int):
+            self._to_midi = lambda value: value + conversion
+            self._from_midi = lambda value: value - conversion
+        else:  # Default case: return as is
+            self._to_midi = self._from_midi = lambda value: value
+
+    def _to_midi(self, value: int) -> int:
+        """Convert a digital value to MIDI, binding the member's converters first."""
+        self._bind_converters()
+        return self._to_midi(value)
+
+    def _from_midi(self, value: int) -> int:
+        """Convert a MIDI value to digital, binding the member's converters first."""
+        self._bind_converters()
+        return self._from_midi(value)
 
     def get_switch_text(self, value: int) -> str:
         """
@@ -244,8 +267,8 @@ class AddressParameter(Enum):
         """
         value = self.address
         umb = Midi.value.ZERO  # Default Upper Middle Byte
-        lmb = (value >> 8) & BitMask.FULL_BYTE  # Extract LMB
-        lsb = value & BitMask.FULL_BYTE  # Extract LSB
+        lmb = (value >> 8) & FULL_BYTE  # Extract LMB
+        lsb = value & FULL_BYTE  # Extract LSB
         return umb, lmb, lsb
 
     def get_tooltip(self) -> str:
@@ -263,3 +286,28 @@ class AddressParameter(Enum):
 
     def get_envelope_param_type(self):
         raise NotImplementedError("should be over-ridden by a subclass")
+
+
+# Class-level defaults, shared by every member; assigned outside the class body so
+# Enum does not turn them into members
+AddressParameter.CONVERSION_OFFSETS: Dict[str, Union[int, str]] = {}
+AddressParameter.switches: Tuple[AddressParameter, ...] = ()  # override in subclasses
+AddressParameter.bipolar_parameters: Tuple[str, ...] = ()  # override in subclasses
+
+
+@lru_cache(maxsize=None)
+def _address_index(cls: Type[AddressParameter]) -> Dict[int, AddressParameter]:
+    """
+    Build the address -> member lookup for a parameter enum, once per class.
+
+    Enum members are fixed at class creation, so the index never goes stale.
+    Where several members share an address the first one wins, as with a
+    linear scan.
+
+    :param cls: AddressParameter subclass
+    :return: dict mapping address to parameter member
+    """
+    index: Dict[int, AddressParameter] = {}
+    for parameter in cls:
+        index.setdefault(parameter.address, parameter)
+    return index
@@ -10,9 +10,12 @@ Roland-specific encodings:
 - Signed/unsigned conversion for parameter values
 """
 
-from typing import List
+from typing import List, Sequence
 
-from picomidi.core.bitmask import BitMask
+from picomidi.core.bitmask import LOW_7_BITS
+
+# Sign bit of a 28-bit value; (v ^ bit) - bit sign-extends an unsigned 28-bit v
+_SIGN_BIT_28 = 1 << 27
 
 
 def encode_roland_7bit(value: int) -> List[int]:
@@ -26,10 +29,10 @@ def encode_roland_7bit(value: int) -> List[int]:
     :return: List of 4 bytes [MSB, ..., LSB] where each is 0-127
     """
     return [
-        (value >> 21) & BitMask.LOW_7_BITS,
-        (value >> 14) & BitMask.LOW_7_BITS,
-        (value >> 7) & BitMask.LOW_7_BITS,
-        value & BitMask.LOW_7_BITS,
+        (value >> 21) & LOW_7_BITS,
+        (value >> 14) & LOW_7_BITS,
+        (value >> 7) & LOW_7_BITS,
+        value & LOW_7_BITS,
     ]
 
 
@@ -48,15 +51,13 @@ def decode_roland_4byte(data_bytes: List[int]) -> int:
         raise ValueError("Exactly 4 bytes are required for Roland 4-byte decoding")
 
     value = (
-        (data_bytes[0] & BitMask.LOW_7_BITS) << 21
-        | (data_bytes[1] & BitMask.LOW_7_BITS) << 14
-        | (data_bytes[2] & BitMask.LOW_7_BITS) << 7
-        | (data_bytes[3] & BitMask.LOW_7_BITS)
+        (data_bytes[0] & LOW_7_BITS) << 21
+        | (data_bytes[1] & LOW_7_BITS) << 14
+        | (data_bytes[2] & LOW_7_BITS) << 7
+        | (data_bytes[3] & LOW_7_BITS)
     )
-    # Convert from unsigned to signed if needed
-    if value >= (1 << 27):
-        value -= 1 << 28
-    return value
+    # Sign-extend from bit 27 without a branch
+    return (value ^ _SIGN_BIT_28) - _SIGN_BIT_28
 
 
 def encode_roland_4byte(value: int) -> List[int]:
@@ -74,12 +75,60 @@ def encode_roland_4byte(value: int) -> List[int]:
     :param value: Signed 28-bit integer (-134217728 to 134217727)
     :return: List of 4 bytes [MSB, ..., LSB] where each is 0-127
     """
-    # Convert negative values to unsigned representation
-    if value < 0:
-        value += 1 << 28
+    # No sign fix-up is needed: masking a negative int yields the 7-bit groups of
+    # its two's complement, which is the unsigned 28-bit representation
+    return [
+        (value >> 21) & LOW_7_BITS,
+        (value >> 14) & LOW_7_BITS,
+        (value >> 7) & LOW_7_BITS,
+        value & LOW_7_BITS,
+    ]
+
+
+def encode_roland_4byte_many(values: Sequence[int]) -> bytes:
+    """
+    Encode many signed 28-bit integers into Roland 7-bit bytes in one pass.
+
+    The bulk counterpart of `encode_roland_4byte()` for parameter dumps: each
+    of the four byte positions is computed as a column and written with one
+    extended-slice assignment, instead of building a list per value.
+
+    :param values: Sequence of signed 28-bit integers
+    :return: Bytes of length 4 * len(values), 4 bytes [MSB, ..., LSB] per value
+    """
+    out = bytearray(4 * len(values))
+    out[0::4] = bytes([(value >> 21) & LOW_7_BITS for value in values])
+    out[1::4] = bytes([(value >> 14) & LOW_7_BITS for value in values])
+    out[2::4] = bytes([(value >> 7) & LOW_7_BITS for value in values])
+    out[3::4] = bytes([value & LOW_7_BITS for value in values])
+    return bytes(out)
+
+
+def decode_roland_4byte_many(data: bytes) -> List[int]:
+    """
+    Decode consecutive groups of 4 Roland 7-bit bytes into signed 28-bit integers.
+
+    The bulk counterpart of `decode_roland_4byte()` and the inverse of
+    `encode_roland_4byte_many()`: the byte positions are read as four columns
+    with extended slices and combined pairwise, with no per-value slicing,
+    length check or sign branch.
+
+    :param data: Bytes-like object whose length is a multiple of 4
+    :return: List of decoded signed 28-bit integers, one per 4-byte group
+    :raises ValueError: If the length of data is not a multiple of 4
+    """
+    if len(data) % 4:
+        raise ValueError("Data length must be a multiple of 4 for Roland 4-byte decoding")
     return [
-        (value >> 21) & BitMask.LOW_7_BITS,
-        (value >> 14) & BitMask.LOW_7_BITS,
-        (value >> 7) & BitMask.LOW_7_BITS,
-        value & BitMask.LOW_7_BITS,
+        (
+            (
+                (b0 & LOW_7_BITS) << 21
+                | (b1 & LOW_7_BITS) << 14
+                | (b2 & LOW_7_BITS) << 7
+                | (b3 & LOW_7_BITS)
+            )
+            ^ _SIGN_BIT_28
+        )
+        - _SIGN_BIT_28
+        for b0, b1, b2, b3 in zip(data[0::4], data[1::4], data[2::4], data[3::4])
     ]
@@ -0,0 +1,151 @@
+"""
+Unit tests for channel voice message classes.
+
+Tests cover:
+- Immutability of channel voice messages
+- Shared Note On instances
+- Batch encoding of Note On messages
+- Pitch Bend data byte order
+- NRPN/RPN per-message bytes
+"""
+
+import unittest
+from dataclasses import FrozenInstanceError
+
+from picomidi.core.channel import Channel
+from picomidi.core.types import ControlValue, Note, PitchBendValue, ProgramNumber, Velocity
+from picomidi.message.channel_voice import (
+    NRPN,
+    RPN,
+    ControlChange,
+    NoteOff,
+    NoteOn,
+    PitchBend,
+    ProgramChange,
+)
+from picomidi.parser.parser import Parser
+
+
+class TestImmutability(unittest.TestCase):
+    """Test channel voice messages reject assignment after construction."""
+
+    def test_fields_are_read_only(self):
+        """Test assigning or deleting any field raises FrozenInstanceError."""
+        cases = [
+            (NoteOn(Channel(0), Note(60), Velocity(100)), "velocity", Velocity(10)),
+            (NoteOff(Channel(0), Note(60)), "note", Note(61)),
+            (ControlChange(Channel(0), 7, ControlValue(100)), "controller", 10),
+            (ProgramChange(Channel(0), ProgramNumber(5)), "program", ProgramNumber(6)),
+            (PitchBend(Channel(0), PitchBendValue(0)), "value", PitchBendValue(100)),
+        ]
+        for message, field, value in cases:
+            with self.subTest(message=message.__class__.__name__):
+                with self.assertRaises(FrozenInstanceError):
+                    setattr(message, field, value)
+                with self.assertRaises(FrozenInstanceError):
+                    delattr(message, field)
+                with self.assertRaises(FrozenInstanceError):
+                    message.channel = Channel(1)
+
+    def test_serialize_after_mutation_attempt(self):
+        """Test cached bytes still match the fields after a rejected assignment."""
+        message = NoteOn(Channel(0), Note(60), Velocity(100))
+        self.assertEqual(message.to_bytes(), bytes([0x90, 60, 100]))
+        with self.assertRaises(FrozenInstanceError):
+            message.velocity = Velocity(10)
+        self.assertEqual(message.velocity.value, 100)
+        self.assertEqual(message.to_bytes(), bytes([0x90, 60, 100]))
+        self.assertListEqual(message.to_list(), [0x90, 60, 100])
+
+
+class TestNoteOn(unittest.TestCase):
+    """Test cases for NoteOn."""
+
+    def test_get_returns_shared_instance(self):
+        """Test repeated lookups reuse one pre-encoded message."""
+        first = NoteOn.get(Channel(1), Note(60), Velocity(100))
+        second = NoteOn.get(Channel(1), Note(60), Velocity(100))
+        self.assertIs(first, second)
+        self.assertEqual(first.to_bytes(), bytes([0x91, 60, 100]))
+        self.assertIsNot(first, NoteOn.get(Channel(1), Note(60), Velocity(101)))
+
+    def test_shared_instance_cannot_be_changed(self):
+        """Test a shared message cannot be mutated."""
+        shared = NoteOn.get(Channel(2), Note(60), Velocity(100))
+        with self.assertRaises(FrozenInstanceError):
+            shared.velocity = Velocity(1)
+        again = NoteOn.get(Channel(2), Note(60), Velocity(100))
+        self.assertIs(again, shared)
+        self.assertEqual(again.velocity.value, 100)
+        self.assertEqual(again.to_bytes(), bytes([0x92, 60, 100]))
+
+    def test_many_to_bytes_matches_single_messages(self):
+        """Test batch encoding equals concatenating individual messages."""
+        notes = [60, 64, 67]
+        velocities = bytes([100, 90, 80])
+        expected = b"".join(
+            NoteOn(Channel(2), Note(n), Velocity(v)).to_bytes() for n, v in zip(notes, velocities)
+        )
+        self.assertEqual(NoteOn.many_to_bytes(Channel(2), notes, velocities), expected)
+
+    def test_many_to_bytes_empty(self):
+        """Test an empty batch encodes to empty bytes."""
+        self.assertEqual(NoteOn.many_to_bytes(Channel(0), [], []), b"")
+
+    def test_many_to_bytes_validation(self):
+        """Test mismatched lengths and out-of-range values are rejected."""
+        with self.assertRaises(ValueError):
+            NoteOn.many_to_bytes(Channel(0), [60, 61], [100])
+        with self.assertRaises(ValueError):
+            NoteOn.many_to_bytes(Channel(0), [128], [100])
+
+
+class TestPitchBend(unittest.TestCase):
+    """Test cases for PitchBend."""
+
+    def test_data_bytes_round_trip(self):
+        """Test the LSB is sent before the MSB and parses back to the same value."""
+        value = PitchBendValue.from_msb_lsb(0x50, 0x05)
+        self.assertEqual(value.value, ((0x50 << 7) | 0x05) - 0x2000)
+        self.assertTupleEqual(value.to_msb_lsb(), (0x50, 0x05))
+        message = PitchBend(Channel(3), value)
+        self.assertEqual(message.to_bytes(), bytes([0xE3, 0x05, 0x50]))
+        (parsed,) = Parser().feed(message.to_bytes())
+        self.assertEqual(parsed.value, value)
+
+
+class TestParameterNumbers(unittest.TestCase):
+    """Test cases for NRPN and RPN."""
+
+    def test_to_message_bytes_matches_to_messages(self):
+        """Test per-message bytes mirror to_messages() for every layout."""
+        messages = [
+            NRPN(Channel(3), 1234, 9000),
+            NRPN(Channel(3), 1234, 100, use_14bit=False, null_after=False),
+            RPN(Channel(0), 0, 200),
+            RPN(Channel(0), 0, 2, use_14bit=False),
+        ]
+        for message in messages:
+            with self.subTest(message=message):
+                self.assertEqual(
+                    message.to_message_bytes(),
+                    tuple(bytes(cc) for cc in message.to_messages()),
+                )
+
+    def test_nrpn_bytes(self):
+        """Test the encoded NRPN sequence including the trailing null."""
+        self.assertEqual(
+            NRPN(Channel(0), 0x81, 0x102).to_message_bytes(),
+            (
+                bytes([0xB0, 99, 0x01]),
+                bytes([0xB0, 98, 0x01]),
+                bytes([0xB0, 6, 0x02]),
+                bytes([0xB0, 38, 0x02]),
+                bytes([0xB0, 99, 127]),
+                bytes([0xB0, 98, 127]),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for picomidi.parser.parser module.
+
+Tests cover:
+- Parsing channel voice messages
+- Messages split across feed() calls
+- Running status
+- Skipping SysEx
+- Columnar bulk feeding, which drops System Realtime bytes
+"""
+
+import unittest
+
+from picomidi.message.channel_voice import NoteOn, PitchBend, ProgramChange
+from picomidi.parser.parser import Parser
+
+
+class TestParser(unittest.TestCase):
+    """Test cases for Parser."""
+
+    def test_parse_messages(self):
+        """Test a buffer of complete messages is fully consumed."""
+        parser = Parser()
+        messages = list(parser.feed(bytes([0x90, 60, 100, 0xC1, 5, 0xE0, 0x00, 0x40])))
+        self.assertEqual([type(m) for m in messages], [NoteOn, ProgramChange, PitchBend])
+        self.assertEqual(messages[0].to_bytes(), bytes([0x90, 60, 100]))
+        self.assertEqual(messages[2].value.value, 0)
+        self.assertEqual(len(parser.buffer), 0)
+
+    def test_message_split_across_feeds(self):
+        """Test an incomplete message is kept until the rest arrives."""
+        parser = Parser()
+        self.assertEqual(list(parser.feed(bytes([0x90, 60]))), [])
+        messages = list(parser.feed(bytes([100, 0x80])))
+        self.assertEqual([m.to_bytes() for m in messages], [bytes([0x90, 60, 100])])
+        self.assertEqual(bytes(parser.buffer), bytes([0x80]))
+
+    def test_running_status(self):
+        """Test data bytes without a status reuse the previous status."""
+        parser = Parser()
+        messages = list(parser.feed(bytes([0x92, 60, 100, 62, 90, 0xC0, 1, 2])))
+        self.assertEqual(
+            [m.to_bytes() for m in messages],
+            [bytes([0x92, 60, 100]), bytes([0x92, 62, 90]), bytes([0xC0, 1]), bytes([0xC0, 2])],
+        )
+
+    def test_sysex_cancels_running_status(self):
+        """Test data bytes after SysEx are not treated as running status."""
+        parser = Parser()
+        messages = list(parser.feed(bytes([0x90, 60, 100, 0xF0, 0x7E, 0xF7, 61, 90])))
+        self.assertEqual([m.to_bytes() for m in messages], [bytes([0x90, 60, 100])])
+
+    def test_sysex_skipped(self):
+        """Test SysEx is skipped once its terminator arrives."""
+        parser = Parser()
+        self.assertEqual(list(parser.feed(bytes([0xF0, 0x41, 0x10]))), [])
+        messages = list(parser.feed(bytes([0x42, 0xF7, 0x91, 64, 90])))
+        self.assertEqual([m.to_bytes() for m in messages], [bytes([0x91, 64, 90])])
+
+    def test_sysex_across_many_feeds(self):
+        """Test a SysEx fed in small chunks, with a bulk feed in between, is still skipped."""
+        parser = Parser()
+        body = bytes([0xF0]) + bytes(range(0x10, 0x40)) + bytes([0xF7, 0x90, 60, 100])
+        for i in range(0, 20, 4):
+            self.assertEqual(list(parser.feed(body[i : i + 4])), [])
+        self.assertEqual(bytes(parser.feed_bulk(bytes([0xF8, 0x40]))[0]), b"")
+        messages = list(parser.feed(body[20:]))
+        self.assertEqual([m.to_bytes() for m in messages], [bytes([0x90, 60, 100])])
+
+    def test_feed_bulk_drops_system_realtime(self):
+        """Test bulk feeding discards realtime bytes, even inside a message."""
+        parser = Parser()
+        msg_types, channels, data1, data2 = parser.feed_bulk(
+            bytes([0xF8, 0x90, 60, 0xFA, 100, 0xFC])
+        )
+        self.assertEqual(list(msg_types), [0x90])
+        self.assertEqual((list(data1), list(data2)), ([60], [100]))
+        self.assertEqual(len(parser.buffer), 0)
+
+    def test_feed_bulk_carries_state(self):
+        """Test bulk feeding keeps running status and incomplete messages between calls."""
+        parser = Parser()
+        msg_types, channels, data1, data2 = parser.feed_bulk(bytes([0x93, 60, 100, 62]))
+        self.assertEqual((list(msg_types), list(channels)), ([0x90], [3]))
+        self.assertEqual(bytes(parser.buffer), bytes([62]))
+
+        msg_types, _, data1, data2 = parser.feed_bulk(bytes([90, 0xF8, 64, 80]))
+        self.assertEqual(list(msg_types), [0x90, 0x90])
+        self.assertEqual(list(data1), [62, 64])
+        self.assertEqual(list(data2), [90, 80])
+        self.assertEqual(len(parser.buffer), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for picomidi.parser.decoder module.
+
+Tests cover:
+- Decoding channel voice messages into columns
+- Running status
+- Skipping realtime, system common and SysEx messages
+- Incomplete trailing messages
+"""
+
+import unittest
+
+from picomidi.parser.decoder import decode_stream
+
+
+class TestDecodeStream(unittest.TestCase):
+    """Test cases for decode_stream."""
+
+    def test_channel_voice_messages(self):
+        """Test decoding two- and one-data-byte messages."""
+        msg_types, channels, data1, data2 = decode_stream(
+            bytes([0x92, 60, 100, 0xC3, 9, 0xE0, 0x00, 0x40])
+        )
+        self.assertEqual(list(msg_types), [0x90, 0xC0, 0xE0])
+        self.assertEqual(list(channels), [2, 3, 0])
+        self.assertEqual(list(data1), [60, 9, 0x00])
+        self.assertEqual(list(data2), [100, 0, 0x40])
+
+    def test_running_status(self):
+        """Test data bytes without a status reuse the previous status."""
+        msg_types, channels, data1, data2 = decode_stream(bytes([0x90, 60, 100, 62, 101, 64, 0]))
+        self.assertEqual(list(msg_types), [0x90, 0x90, 0x90])
+        self.assertEqual(list(data1), [60, 62, 64])
+        self.assertEqual(list(data2), [100, 101, 0])
+
+    def test_skips_realtime_sysex_and_system_common(self):
+        """Test non channel voice messages are skipped."""
+        data = bytes([0x90, 60, 0xF8, 100, 0xF0, 0x41, 0x10, 0xF7, 0xF2, 0x01, 0x02, 0xB0, 7, 5])
+        msg_types, channels, data1, data2 = decode_stream(data)
+        self.assertEqual(list(msg_types), [0x90, 0xB0])
+        self.assertEqual(list(data1), [60, 7])
+        self.assertEqual(list(data2), [100, 5])
+
+    def test_system_common_cancels_running_status(self):
+        """Test data bytes after a system common message are ignored."""
+        msg_types, _, _, _ = decode_stream(bytes([0x90, 60, 100, 0xF6, 62, 101]))
+        self.assertEqual(list(msg_types), [0x90])
+
+    def test_incomplete_message_ignored(self):
+        """Test a trailing incomplete message is not decoded."""
+        msg_types, _, _, _ = decode_stream(bytes([0x90, 60, 100, 0x80, 60]))
+        self.assertEqual(list(msg_types), [0x90])
+
+        msg_types, _, _, _ = decode_stream(bytes([0xF0, 0x41, 0x10]))
+        self.assertEqual(len(msg_types), 0)
+
+    def test_interrupted_message_dropped(self):
+        """Test a message cut short by a new status byte is dropped."""
+        msg_types, _, data1, data2 = decode_stream(bytes([0x90, 60, 0x80, 61, 0]))
+        self.assertEqual(list(msg_types), [0x80])
+        self.assertEqual((list(data1), list(data2)), ([61], [0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,86 +10,109 @@ Tests cover:
 """
 
 import unittest
+from types import MappingProxyType
+from typing import Final
 
 from picomidi.constant import Midi
 from picomidi.message.sysex.roland import RolandSysExMessage
 
+# SysEx framing bytes, bound once for the whole module
+_SYSEX_START: Final[int] = Midi.sysex.START
+_SYSEX_END: Final[int] = Midi.sysex.END
+
 
 class TestRolandSysExMessage(unittest.TestCase):
     """Test cases for generic RolandSysExMessage class."""
 
+    # Constructor arguments of the reference DT1 message
+    _DEFAULT_KW = MappingProxyType(
+        {
+            "device_id": 0x10,
+            "model_id": [0x00, 0x00, 0x00, 0x0E],
+            "command": 0x12,  # DT1
+            "address": [0x18, 0x00, 0x00, 0x10],
+            "data": [0x7F],
+        }
+    )
+
+    @classmethod
+    def _make(cls, **overrides) -> RolandSysExMessage:
+        """Build a message from the reference arguments with some replaced."""
+        return RolandSysExMessage(**{**cls._DEFAULT_KW, **overrides})
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the reference DT1 message and its encodings once for the whole class."""
+        cls.REF_MSG = cls._make()
+        cls.REF_LIST = tuple(cls.REF_MSG.to_list())
+        cls.REF_BYTES = cls.REF_MSG.to_bytes()
+
     def test_basic_message_creation(self):
         """Test creating a basic Roland SysEx message."""
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,  # DT1
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
+        msg = self._make()
 
         self.assertEqual(msg.manufacturer_id, 0x41)
         self.assertEqual(msg.device_id, 0x10)
-        self.assertEqual(msg.model_id, [0x00, 0x00, 0x00, 0x0E])
+        self.assertEqual(msg.model_id, bytes([0x00, 0x00, 0x00, 0x0E]))
         self.assertEqual(msg.command, 0x12)
-        self.assertEqual(msg.address, [0x18, 0x00, 0x00, 0x10])
-        self.assertEqual(msg.data, [0x7F])
+        self.assertEqual(msg.address, bytes([0x18, 0x00, 0x00, 0x10]))
+        self.assertListEqual(msg.data, [0x7F])
 
     def test_to_list_conversion(self):
         """Test converting message to list of integers."""
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
-
-        result = msg.to_list()
+        result = self.REF_LIST
 
         # Should start with F0 (SysEx start)
-        self.assertEqual(result[0], Midi.sysex.START)
+        self.assertEqual(result[0], _SYSEX_START)
         # Should have manufacturer ID 0x41
         self.assertEqual(result[1], 0x41)
         # Should have device ID
         self.assertEqual(result[2], 0x10)
         # Should end with F7 (SysEx end)
-        self.assertEqual(result[-1], Midi.sysex.END)
+        self.assertEqual(result[-1], _SYSEX_END)
         # Should have checksum before end
         self.assertIsInstance(result[-2], int)
         self.assertTrue(0 <= result[-2] <= 0x7F)
 
     def test_to_bytes_conversion(self):
         """Test converting message to bytes."""
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
-
-        result = msg.to_bytes()
+        result = self.REF_BYTES
 
         self.assertIsInstance(result, bytes)
-        self.assertEqual(result[0], Midi.sysex.START)
+        self.assertEqual(result[0], _SYSEX_START)
         self.assertEqual(result[1], 0x41)
-        self.assertEqual(result[-1], Midi.sysex.END)
+        self.assertEqual(result[-1], _SYSEX_END)
+
+    def test_to_bytes_cache_follows_changes(self):
+        """Test the cached header is rebuilt after a field is changed."""
+        msg = self._make(data=[0x01])
+        self.assertEqual(msg.to_bytes(), msg.to_bytes())
+
+        msg.device_id = 0x11
+        self.assertEqual(msg.to_bytes()[2], 0x11)
+
+        msg.data.append(0x02)  # In-place edit
+        self.assertListEqual(list(msg.to_bytes()[12:14]), [0x01, 0x02])
+        self.assertEqual(msg.to_bytes(), RolandSysExMessage.from_bytes(msg.to_bytes()).to_bytes())
+
+    def test_write_into(self):
+        """Test writing the message into a caller-provided buffer."""
+        buffer = bytearray(4 + len(self.REF_BYTES))
+        written = self.REF_MSG.write_into(buffer, offset=2)
+
+        self.assertEqual(written, len(self.REF_BYTES))
+        self.assertEqual(bytes(buffer[2 : 2 + written]), self.REF_BYTES)
+        self.assertEqual(bytes(buffer[:2] + buffer[2 + written :]), bytes(4))
+
+        with self.assertRaises(ValueError):
+            self.REF_MSG.write_into(bytearray(len(self.REF_BYTES) - 1))
 
     def test_from_bytes_parsing(self):
         """Test parsing a message from bytes."""
-        # Create a valid message first
-        original_msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
-
-        # Convert to bytes and parse back
-        msg_bytes = original_msg.to_bytes()
-        parsed_msg = RolandSysExMessage.from_bytes(msg_bytes)
+        original_msg = self.REF_MSG
+
+        # Parse the reference message's bytes back
+        parsed_msg = RolandSysExMessage.from_bytes(self.REF_BYTES)
 
         self.assertEqual(parsed_msg.device_id, original_msg.device_id)
         self.assertEqual(parsed_msg.model_id, original_msg.model_id)
@@ -97,36 +120,31 @@ class TestRolandSysExMessage(unittest.TestCase):
         self.assertEqual(parsed_msg.address, original_msg.address)
         self.assertEqual(parsed_msg.data, original_msg.data)
 
+    def test_from_bytes_many(self):
+        """Test parsing several concatenated messages."""
+        second = self._make(address=[0x18, 0x00, 0x00, 0x11], data=[0x01, 0x02])
+        messages = RolandSysExMessage.from_bytes_many(self.REF_BYTES + second.to_bytes())
+
+        self.assertListEqual(messages, [self.REF_MSG, second])
+        self.assertListEqual(RolandSysExMessage.from_bytes_many(b""), [])
+
+        with self.assertRaises(ValueError):
+            RolandSysExMessage.from_bytes_many(self.REF_BYTES + self.REF_BYTES[:-1])
+
     def test_checksum_calculation(self):
         """Test checksum calculation."""
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
-
-        checksum = msg.calculate_checksum()
+        checksum = self.REF_MSG.calculate_checksum()
 
         # Checksum should be 7-bit safe (0-127)
         self.assertTrue(0 <= checksum <= 0x7F)
 
         # Verify checksum is included in message list
-        msg_list = msg.to_list()
-        self.assertEqual(msg_list[-2], checksum)
+        self.assertEqual(self.REF_LIST[-2], checksum)
 
     def test_validation_manufacturer_id(self):
         """Test manufacturer ID validation."""
         with self.assertRaises(ValueError) as context:
-            RolandSysExMessage(
-                manufacturer_id=0x42,  # Wrong manufacturer ID
-                device_id=0x10,
-                model_id=[0x00, 0x00, 0x00, 0x0E],
-                command=0x12,
-                address=[0x18, 0x00, 0x00, 0x10],
-                data=[0x7F],
-            )
+            self._make(manufacturer_id=0x42)  # Wrong manufacturer ID
 
         self.assertIn("manufacturer ID must be 0x41", str(context.exception))
 
@@ -135,74 +153,45 @@ class TestRolandSysExMessage(unittest.TestCase):
         # Valid device IDs: 0x10-0x1F or 0x7F
         valid_ids = [0x10, 0x1F, 0x7F]
         for device_id in valid_ids:
-            msg = RolandSysExMessage(
-                device_id=device_id,
-                model_id=[0x00, 0x00, 0x00, 0x0E],
-                command=0x12,
-                address=[0x18, 0x00, 0x00, 0x10],
-                data=[0x7F],
-            )
-            self.assertEqual(msg.device_id, device_id)
+            with self.subTest(device_id=device_id):
+                msg = self._make(device_id=device_id)
+                self.assertEqual(msg.device_id, device_id)
 
         # Invalid device ID
         with self.assertRaises(ValueError) as context:
-            RolandSysExMessage(
-                device_id=0x20,  # Out of range
-                model_id=[0x00, 0x00, 0x00, 0x0E],
-                command=0x12,
-                address=[0x18, 0x00, 0x00, 0x10],
-                data=[0x7F],
-            )
+            self._make(device_id=0x20)  # Out of range
 
         self.assertIn("Device ID must be 0x10-0x1F or 0x7F", str(context.exception))
 
     def test_validation_model_id_length(self):
         """Test model ID length validation."""
         with self.assertRaises(ValueError) as context:
-            RolandSysExMessage(
-                device_id=0x10,
-                model_id=[0x00, 0x00, 0x0E],  # Only 3 bytes
-                command=0x12,
-                address=[0x18, 0x00, 0x00, 0x10],
-                data=[0x7F],
-            )
+            self._make(model_id=[0x00, 0x00, 0x0E])  # Only 3 bytes
 
         self.assertIn("Model ID must be exactly 4 bytes", str(context.exception))
 
     def test_validation_address_length(self):
         """Test address length validation."""
         with self.assertRaises(ValueError) as context:
-            RolandSysExMessage(
-                device_id=0x10,
-                model_id=[0x00, 0x00, 0x00, 0x0E],
-                command=0x12,
-                address=[0x18, 0x00, 0x10],  # Only 3 bytes
-                data=[0x7F],
-            )
+            self._make(address=[0x18, 0x00, 0x10])  # Only 3 bytes
 
         self.assertIn("Address must be exactly 4 bytes", str(context.exception))
 
     def test_validation_data_bytes_range(self):
         """Test data bytes must be 7-bit safe (0-127)."""
         # Valid data bytes
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x00, 0x7F],  # Valid range
-        )
-        self.assertEqual(msg.data, [0x00, 0x7F])
+        msg = self._make(data=[0x00, 0x7F])  # Valid range
+        self.assertListEqual(msg.data, [0x00, 0x7F])
+
+        # A byte with the high bit set anywhere in the payload is rejected
+        with self.assertRaises(ValueError) as context:
+            self._make(data=[0x00] * 20 + [0x80])
+
+        self.assertIn("Data bytes must be 0-127", str(context.exception))
 
     def test_multiple_data_bytes(self):
         """Test message with multiple data bytes."""
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x01, 0x02, 0x03, 0x04],
-        )
+        msg = self._make(data=[0x01, 0x02, 0x03, 0x04])
 
         result = msg.to_list()
         # Message structure: [F0, 41, device, model(4), command, address(4), data..., checksum, F7]
@@ -210,7 +199,7 @@ class TestRolandSysExMessage(unittest.TestCase):
         data_start = 1 + 1 + 1 + 4 + 1 + 4  # = 12
         data_end = data_start + len(msg.data)
         # Should have all data bytes before checksum
-        self.assertEqual(result[data_start:data_end], [0x01, 0x02, 0x03, 0x04])
+        self.assertListEqual(result[data_start:data_end], [0x01, 0x02, 0x03, 0x04])
 
     def test_from_bytes_invalid_start(self):
         """Test parsing invalid message (wrong start byte)."""
@@ -232,21 +221,12 @@ class TestRolandSysExMessage(unittest.TestCase):
 
     def test_from_bytes_checksum_mismatch(self):
         """Test parsing message with incorrect checksum."""
-        # Create a valid message
-        msg = RolandSysExMessage(
-            device_id=0x10,
-            model_id=[0x00, 0x00, 0x00, 0x0E],
-            command=0x12,
-            address=[0x18, 0x00, 0x00, 0x10],
-            data=[0x7F],
-        )
-
-        # Corrupt the checksum
-        msg_bytes = bytearray(msg.to_bytes())
+        # Corrupt the checksum of a copy of the reference bytes
+        msg_bytes = bytearray(self.REF_BYTES)
         msg_bytes[-2] = (msg_bytes[-2] + 1) % 128  # Change checksum
 
         with self.assertRaises(ValueError) as context:
-            RolandSysExMessage.from_bytes(bytes(msg_bytes))
+            RolandSysExMessage.from_bytes(msg_bytes)  # bytearray is accepted as is
 
         self.assertIn("Checksum mismatch", str(context.exception))
 
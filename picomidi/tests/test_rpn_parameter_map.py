@@ -0,0 +1,70 @@
+"""
+Unit tests for picomidi.rpn.parameter_map module.
+
+Tests cover:
+- Lookups on the dict-backed ParameterMap
+- DenseParameterMap matching ParameterMap behaviour
+- DenseParameterMap iteration order and the empty map
+"""
+
+import unittest
+
+from picomidi.rpn.parameter_map import DenseParameterMap, ParameterMap
+
+
+class TestParameterMaps(unittest.TestCase):
+    """Test cases for ParameterMap and DenseParameterMap."""
+
+    MAPPING = {0: (0, 0), 5: (0, 5), 16383: (127, 127)}
+
+    def test_lookups_match(self):
+        """Test both map types answer hits and misses identically."""
+        sparse = ParameterMap(dict(self.MAPPING))
+        dense = DenseParameterMap(self.MAPPING)
+        for key in (0, 5, 6, 16383):
+            with self.subTest(key=key):
+                self.assertEqual(dense.get_msb_lsb(key), sparse.get_msb_lsb(key))
+                self.assertEqual(dense.get_msb(key), sparse.get_msb(key))
+                self.assertEqual(dense.get_lsb(key), sparse.get_lsb(key))
+                self.assertEqual(dense.get(key, -1), sparse.get(key, -1))
+                self.assertEqual(key in dense, key in sparse)
+        self.assertEqual(dict(dense.items()), dict(sparse.items()))
+
+    def test_dense_item_access(self):
+        """Test item assignment, missing keys and out-of-range keys."""
+        dense = DenseParameterMap()
+        dense[100] = (1, 2)
+        self.assertEqual(dense[100], (1, 2))
+        with self.assertRaises(KeyError):
+            dense[101]
+        with self.assertRaises(ValueError):
+            dense.add_mapping(16384, (0, 0))
+
+    def test_dense_invalid_pair_keeps_entry(self):
+        """Test an out-of-range MSB/LSB pair is rejected without changing the entry."""
+        dense = DenseParameterMap({5: (1, 2)})
+        for pair in ((9, 300), (-1, 0), (256, 0)):
+            with self.subTest(pair=pair):
+                with self.assertRaises(ValueError):
+                    dense.add_mapping(5, pair)
+                self.assertEqual(dense.get_msb_lsb(5), (1, 2))
+        with self.assertRaises(ValueError):
+            dense.add_mapping(6, (0, 256))
+        self.assertNotIn(6, dense)
+
+    def test_dense_items_and_repr(self):
+        """Test items() and repr() list mapped parameters in order, including when empty."""
+        dense = DenseParameterMap()
+        self.assertEqual(dict(dense.items()), {})
+        self.assertEqual(repr(dense), "DenseParameterMap({})")
+        for key in (16383, 9, 8, 0, 7):
+            dense[key] = (key >> 7, key & 0x7F)
+        dense[8] = (0, 1)  # Overwriting keeps a single entry
+        self.assertListEqual(
+            list(dense.items()),
+            [(0, (0, 0)), (7, (0, 7)), (8, (0, 1)), (9, (0, 9)), (16383, (127, 127))],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for picomidi.sysex.parameter.address module.
+
+Tests cover:
+- Lookups by address and by name on a subclass
+- Class-level switches and bipolar parameters
+- Value conversion to and from MIDI
+"""
+
+import unittest
+
+from picomidi.sysex.parameter.address import AddressParameter
+
+
+class SampleParameter(AddressParameter):
+    """Small parameter set used by the tests."""
+
+    LEVEL = (0x10, 0, 127)
+    PAN = (0x11, 0, 127)
+    PAN_ALIAS_ADDRESS = (0x11, 0, 64)
+    TIME = (0x0120, 0, 2000)
+
+
+SampleParameter.switches = (SampleParameter.LEVEL,)
+SampleParameter.bipolar_parameters = ("PAN",)
+SampleParameter.CONVERSION_OFFSETS = {"PAN": 64, "LEVEL": "map_range"}
+
+
+class TestAddressParameterLookups(unittest.TestCase):
+    """Test cases for AddressParameter lookup methods."""
+
+    def test_get_parameter_by_address(self):
+        """Test lookup by address, first member winning on a shared address."""
+        self.assertIs(SampleParameter.get_parameter_by_address(0x10), SampleParameter.LEVEL)
+        self.assertIs(SampleParameter.get_parameter_by_address(0x11), SampleParameter.PAN)
+        self.assertIsNone(SampleParameter.get_parameter_by_address(0x7F))
+
+    def test_get_name_by_address(self):
+        """Test name lookup searches the calling subclass."""
+        self.assertEqual(SampleParameter.get_name_by_address(0x0120), "TIME")
+        self.assertIsNone(SampleParameter.get_name_by_address(0x7F))
+
+    def test_get_by_name(self):
+        """Test lookup by member name."""
+        self.assertIs(SampleParameter.get_by_name("PAN"), SampleParameter.PAN)
+        self.assertIsNone(SampleParameter.get_by_name("MISSING"))
+
+    def test_class_level_flags(self):
+        """Test switches and bipolar_parameters set on the class apply to members."""
+        self.assertTrue(SampleParameter.LEVEL.is_switch)
+        self.assertFalse(SampleParameter.PAN.is_switch)
+        self.assertTrue(SampleParameter.PAN.is_bipolar)
+        self.assertFalse(SampleParameter.TIME.is_bipolar)
+        self.assertEqual(SampleParameter.LEVEL.get_switch_text(1), "ON")
+
+    def test_conversion(self):
+        """Test offset, map_range and pass-through conversions in both directions."""
+        pan = SampleParameter.PAN
+        self.assertEqual(pan.convert_to_midi(-10), 54)
+        self.assertEqual(pan.convert_from_midi(54), -10)
+        self.assertEqual(pan.convert_value(54, reverse=True), -10)
+        level = SampleParameter.LEVEL
+        self.assertEqual(level.convert_to_midi(0), 64)
+        self.assertEqual(level.convert_from_midi(74), 100)
+        self.assertEqual(SampleParameter.TIME.convert_to_midi(500), 500)
+        self.assertIsNone(pan.convert_to_midi(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
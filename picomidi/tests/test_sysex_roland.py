@@ -0,0 +1,53 @@
+"""
+Unit tests for picomidi.sysex.roland module.
+
+Tests cover:
+- Roland 4-byte (4x7-bit) encoding of single values and bulk sequences
+- Decoding back to signed values, singly and in bulk
+"""
+
+import unittest
+
+from picomidi.sysex.roland import (
+    decode_roland_4byte,
+    decode_roland_4byte_many,
+    encode_roland_4byte,
+    encode_roland_4byte_many,
+)
+
+
+class TestRolandEncoding(unittest.TestCase):
+    """Test cases for Roland 7-bit value encoding."""
+
+    VALUES = (0, 1, 127, 128, 1048576, -1, -134217728, 134217727)
+
+    def test_encode_roland_4byte(self):
+        """Test encoding of positive and negative values."""
+        self.assertListEqual(encode_roland_4byte(1048576), [0x00, 0x40, 0x00, 0x00])
+        self.assertListEqual(encode_roland_4byte(-1), [0x7F, 0x7F, 0x7F, 0x7F])
+        self.assertListEqual(encode_roland_4byte(-134217728), [0x40, 0x00, 0x00, 0x00])
+
+    def test_encode_roland_4byte_many(self):
+        """Test bulk encoding matches encoding each value."""
+        expected = bytes(b for value in self.VALUES for b in encode_roland_4byte(value))
+        self.assertEqual(encode_roland_4byte_many(self.VALUES), expected)
+        self.assertEqual(encode_roland_4byte_many([]), b"")
+
+    def test_decode_round_trip(self):
+        """Test decoding restores signed values, singly and in bulk."""
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                self.assertEqual(decode_roland_4byte(encode_roland_4byte(value)), value)
+        encoded = encode_roland_4byte_many(self.VALUES)
+        self.assertEqual(decode_roland_4byte_many(encoded), list(self.VALUES))
+
+    def test_decode_invalid_length(self):
+        """Test decoding rejects input that is not whole 4-byte groups."""
+        with self.assertRaises(ValueError):
+            decode_roland_4byte([0, 0, 0])
+        with self.assertRaises(ValueError):
+            decode_roland_4byte_many(bytes(6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ Tests cover:
 - Signed/unsigned conversions
 - Time and fraction conversions
 - Byte and nibble manipulations
+- Lenient int conversion for formatting
 - Edge cases and error handling
 - Round-trip conversions
 """
@@ -14,24 +15,39 @@ Tests cover:
 import unittest
 
 from picomidi.core.bitmask import BitMask
+from picomidi.core.channel import Channel
+from picomidi.core.types import Note
 from picomidi.utils.conversion import (
     clamp_14bit_value,
     clamp_midi_value,
     combine_7bit_msb_lsb,
+    combine_7bit_msb_lsb_many,
     encode_14bit_to_7bit_midi_bytes,
+    encode_14bit_to_7bit_midi_bytes_many,
+    encode_nbit_stream,
     fraction_to_midi_value,
+    fraction_to_midi_value_many,
     join_nibbles_to_16bit,
     join_nibbles_to_32bit,
+    make_fraction_to_midi_value,
+    make_midi_value_to_fraction,
+    make_midi_value_to_ms,
+    make_ms_to_midi_value,
     midi_value_to_fraction,
     midi_value_to_ms,
+    midi_value_to_ms_many,
     ms_to_midi_value,
+    safe_int,
     signed_to_unsigned_14bit,
+    signed_to_unsigned_14bit_many,
     split_8bit_value_to_nibbles,
     split_14bit_to_7bit,
+    split_14bit_to_7bit_many,
     split_16bit_value_to_bytes,
     split_16bit_value_to_nibbles,
     split_32bit_value_to_nibbles,
     unsigned_to_signed_14bit,
+    unsigned_to_signed_14bit_many,
 )
 
 
@@ -111,26 +127,40 @@ class Test7Bit14BitConversions(unittest.TestCase):
             self.assertEqual(result_msb, msb, f"MSB mismatch for {msb}, {lsb}")
             self.assertEqual(result_lsb, lsb, f"LSB mismatch for {msb}, {lsb}")
 
+    def test_split_combine_many(self):
+        """Test the bulk 14-bit split and combine against the scalar functions."""
+        values = [0x0000, 0x2020, 0x3FFF, 0x3F80, 0x007F, 0xFFFF]
+        encoded = split_14bit_to_7bit_many(values)
+        expected = bytes(byte for value in values for byte in split_14bit_to_7bit(value))
+        self.assertEqual(encoded, expected)
+        self.assertListEqual(
+            combine_7bit_msb_lsb_many(encoded), [value & 0x3FFF for value in values]
+        )
+        self.assertEqual(split_14bit_to_7bit_many([]), b"")
+
+        with self.assertRaises(ValueError):
+            combine_7bit_msb_lsb_many(bytes(3))
+
     def test_encode_14bit_to_7bit_midi_bytes(self):
         """Test encoding 14-bit value to 7-bit MIDI bytes."""
         # Normal case - use valid 14-bit value
         result = encode_14bit_to_7bit_midi_bytes(0x2020)  # 8224
-        self.assertEqual(result, [0x40, 0x20])
+        self.assertEqual(result, bytes([0x40, 0x20]))
 
         # Maximum value
         result = encode_14bit_to_7bit_midi_bytes(0x3FFF)
-        self.assertEqual(result, [0x7F, 0x7F])
+        self.assertEqual(result, bytes([0x7F, 0x7F]))
 
         # Minimum value
         result = encode_14bit_to_7bit_midi_bytes(0x0000)
-        self.assertEqual(result, [0x00, 0x00])
+        self.assertEqual(result, bytes([0x00, 0x00]))
 
         # Edge cases
         result = encode_14bit_to_7bit_midi_bytes(0x3F80)  # 16256
-        self.assertEqual(result, [0x7F, 0x00])
+        self.assertEqual(result, bytes([0x7F, 0x00]))
 
         result = encode_14bit_to_7bit_midi_bytes(0x007F)  # 127
-        self.assertEqual(result, [0x00, 0x7F])
+        self.assertEqual(result, bytes([0x00, 0x7F]))
 
         # Error cases
         with self.assertRaises(ValueError) as context:
@@ -141,6 +171,37 @@ class Test7Bit14BitConversions(unittest.TestCase):
             encode_14bit_to_7bit_midi_bytes(-1)  # Negative
         self.assertIn("14-bit", str(context.exception))
 
+    def test_encode_14bit_to_7bit_midi_bytes_many(self):
+        """Test bulk encoding of 14-bit values to 7-bit MIDI bytes."""
+        values = [0x2020, 0x3FFF, 0x0000, 0x3F80, 0x007F]
+        expected = bytes(
+            byte for value in values for byte in encode_14bit_to_7bit_midi_bytes(value)
+        )
+        self.assertEqual(encode_14bit_to_7bit_midi_bytes_many(values), expected)
+        self.assertEqual(encode_14bit_to_7bit_midi_bytes_many([]), b"")
+
+        # Error cases
+        for bad in ([0x4000], [0, -1]):
+            with self.assertRaises(ValueError):
+                encode_14bit_to_7bit_midi_bytes_many(bad)
+
+    def test_encode_nbit_stream(self):
+        """Test packing n-bit values into 7-bit MIDI bytes."""
+        # 8-bit values 0xFF, 0x01: bits 11111111 00000001 -> 1111111 1000000 01(00000)
+        self.assertEqual(encode_nbit_stream([0xFF, 0x01], 8), bytes([0x7F, 0x40, 0x20]))
+        self.assertEqual(encode_nbit_stream([0x12, 0x7F], 7), bytes([0x12, 0x7F]))
+        self.assertEqual(
+            encode_nbit_stream([0x2020, 0x3FFF], 14),
+            encode_14bit_to_7bit_midi_bytes_many([0x2020, 0x3FFF]),
+        )
+        self.assertEqual(encode_nbit_stream([], 12), b"")
+
+        # Error cases
+        for values, bits in (([0x100], 8), ([-1], 8), ([0], 0)):
+            with self.subTest(values=values, bits=bits):
+                with self.assertRaises(ValueError):
+                    encode_nbit_stream(values, bits)
+
 
 class TestClamping(unittest.TestCase):
     """Test value clamping functions."""
@@ -178,6 +239,21 @@ class TestClamping(unittest.TestCase):
         self.assertEqual(clamp_14bit_value(100000), 0x3FFF)
 
 
+class TestSafeInt(unittest.TestCase):
+    """Test cases for safe_int."""
+
+    def test_safe_int(self):
+        """Test ints, enums, value objects, floats and strings all convert, others give 0."""
+        self.assertEqual(safe_int(0x41), 0x41)
+        self.assertEqual(safe_int(Channel(3)), 3)
+        self.assertEqual(safe_int(Note(60)), 60)
+        self.assertEqual(safe_int(12.7), 12)
+        self.assertEqual(safe_int("16"), 16)
+        self.assertEqual(safe_int("F7"), 0)
+        self.assertEqual(safe_int(None), 0)
+        self.assertEqual(safe_int(Channel), 0)
+
+
 class TestSignedUnsignedConversions(unittest.TestCase):
     """Test signed/unsigned 14-bit conversions."""
 
@@ -223,6 +299,19 @@ class TestSignedUnsignedConversions(unittest.TestCase):
         # It would return 0x7FFF - 0x4000 = 16383, but let's test with valid 14-bit
         self.assertEqual(unsigned_to_signed_14bit(0x7FFF), 16383)  # 32767 - 16384 = 16383
 
+    def test_signed_unsigned_14bit_many(self):
+        """Test bulk conversions match the single-value functions."""
+        values = [-8192, -4096, -1, 0, 1, 8191, 0x3FFF, 0x4000, 0x4001, 0x7FFF]
+        self.assertListEqual(
+            signed_to_unsigned_14bit_many(values),
+            [signed_to_unsigned_14bit(value) for value in values],
+        )
+        self.assertListEqual(
+            unsigned_to_signed_14bit_many(values),
+            [unsigned_to_signed_14bit(value) for value in values],
+        )
+        self.assertListEqual(signed_to_unsigned_14bit_many([]), [])
+
     def test_round_trip_signed_unsigned(self):
         """Test round-trip conversion: signed -> unsigned -> signed."""
         # Note: The conversion functions don't perfectly round-trip for all values
@@ -289,6 +378,16 @@ class TestTimeConversions(unittest.TestCase):
             midi_value_to_ms(64, 1000, 10)  # min >= max
         self.assertIn("min_time must be less than max_time", str(context.exception))
 
+    def test_midi_value_to_ms_many(self):
+        """Test bulk MIDI value to milliseconds conversion against the scalar function."""
+        values = [0, 1, 64, 127, -5, 200, 63.5]
+        self.assertListEqual(
+            midi_value_to_ms_many(values, 10, 1000),
+            [midi_value_to_ms(value, 10, 1000) for value in values],
+        )
+        with self.assertRaises(ValueError):
+            midi_value_to_ms_many(values, 1000, 10)
+
     def test_ms_to_midi_value(self):
         """Test converting milliseconds to MIDI value."""
         # Default range (10-1000 ms)
@@ -360,6 +459,15 @@ class TestFractionConversions(unittest.TestCase):
         # Zero range
         self.assertEqual(fraction_to_midi_value(0.5, 0.5, 0.5), 0)
 
+    def test_fraction_to_midi_value_many(self):
+        """Test bulk fraction to MIDI value conversion against the scalar function."""
+        values = [0.0, 0.25, 0.5, 1.0, -0.5, 1.5]
+        self.assertListEqual(
+            fraction_to_midi_value_many(values),
+            [fraction_to_midi_value(value) for value in values],
+        )
+        self.assertListEqual(fraction_to_midi_value_many(values, 0.5, 0.5), [0] * len(values))
+
     def test_midi_value_to_fraction(self):
         """Test converting MIDI value to fraction."""
         # Default range (0.0-1.0)
@@ -414,6 +522,32 @@ class TestFractionConversions(unittest.TestCase):
             )
 
 
+class TestRangeMapperFactories(unittest.TestCase):
+    """Test range-specialized conversion factories."""
+
+    def test_specialized_functions_match(self):
+        """Test each specialized function matches its general counterpart."""
+        values = [-5, 0, 0.5, 1, 63, 64, 126.5, 127, 200]
+        cases = [
+            (make_midi_value_to_ms, midi_value_to_ms, (10, 1000)),
+            (make_ms_to_midi_value, ms_to_midi_value, (100, 200)),
+            (make_ms_to_midi_value, ms_to_midi_value, (50, 50)),
+            (make_fraction_to_midi_value, fraction_to_midi_value, (-1.0, 1.0)),
+            (make_fraction_to_midi_value, fraction_to_midi_value, (0.5, 0.5)),
+            (make_midi_value_to_fraction, midi_value_to_fraction, (0.25, 0.75)),
+        ]
+        for factory, function, bounds in cases:
+            specialized = factory(*bounds)
+            for value in values:
+                with self.subTest(function=function.__name__, bounds=bounds, value=value):
+                    self.assertEqual(specialized(value), function(value, *bounds))
+
+    def test_make_midi_value_to_ms_invalid_range(self):
+        """Test an empty or inverted time range is rejected up front."""
+        with self.assertRaises(ValueError):
+            make_midi_value_to_ms(1000, 10)
+
+
 class TestByteManipulations(unittest.TestCase):
     """Test byte manipulation functions."""
 
@@ -421,22 +555,22 @@ class TestByteManipulations(unittest.TestCase):
         """Test splitting 16-bit value into two bytes."""
         # Normal case
         result = split_16bit_value_to_bytes(0x1234)
-        self.assertEqual(result, [0x12, 0x34])
+        self.assertEqual(result, bytes([0x12, 0x34]))
 
         # Maximum value
         result = split_16bit_value_to_bytes(0xFFFF)
-        self.assertEqual(result, [0xFF, 0xFF])
+        self.assertEqual(result, bytes([0xFF, 0xFF]))
 
         # Minimum value
         result = split_16bit_value_to_bytes(0x0000)
-        self.assertEqual(result, [0x00, 0x00])
+        self.assertEqual(result, bytes([0x00, 0x00]))
 
         # Edge cases
         result = split_16bit_value_to_bytes(0xFF00)
-        self.assertEqual(result, [0xFF, 0x00])
+        self.assertEqual(result, bytes([0xFF, 0x00]))
 
         result = split_16bit_value_to_bytes(0x00FF)
-        self.assertEqual(result, [0x00, 0xFF])
+        self.assertEqual(result, bytes([0x00, 0xFF]))
 
         # Error cases
         with self.assertRaises(ValueError) as context:
@@ -451,22 +585,22 @@ class TestByteManipulations(unittest.TestCase):
         """Test splitting 8-bit value into two nibbles."""
         # Normal case
         result = split_8bit_value_to_nibbles(0xAB)
-        self.assertEqual(result, [0xA, 0xB])
+        self.assertTupleEqual(result, (0xA, 0xB))
 
         # Maximum value
         result = split_8bit_value_to_nibbles(0xFF)
-        self.assertEqual(result, [0xF, 0xF])
+        self.assertTupleEqual(result, (0xF, 0xF))
 
         # Minimum value
         result = split_8bit_value_to_nibbles(0x00)
-        self.assertEqual(result, [0x0, 0x0])
+        self.assertTupleEqual(result, (0x0, 0x0))
 
         # Edge cases
         result = split_8bit_value_to_nibbles(0xF0)
-        self.assertEqual(result, [0xF, 0x0])
+        self.assertTupleEqual(result, (0xF, 0x0))
 
         result = split_8bit_value_to_nibbles(0x0F)
-        self.assertEqual(result, [0x0, 0xF])
+        self.assertTupleEqual(result, (0x0, 0xF))
 
         # Error cases
         with self.assertRaises(ValueError) as context:
@@ -481,22 +615,22 @@ class TestByteManipulations(unittest.TestCase):
         """Test splitting 16-bit value into 4 nibbles."""
         # Normal case
         result = split_16bit_value_to_nibbles(0x1234)
-        self.assertEqual(result, [0x1, 0x2, 0x3, 0x4])
+        self.assertTupleEqual(result, (0x1, 0x2, 0x3, 0x4))
 
         # Maximum value
         result = split_16bit_value_to_nibbles(0xFFFF)
-        self.assertEqual(result, [0xF, 0xF, 0xF, 0xF])
+        self.assertTupleEqual(result, (0xF, 0xF, 0xF, 0xF))
 
         # Minimum value
         result = split_16bit_value_to_nibbles(0x0000)
-        self.assertEqual(result, [0x0, 0x0, 0x0, 0x0])
+        self.assertTupleEqual(result, (0x0, 0x0, 0x0, 0x0))
 
         # Edge cases
         result = split_16bit_value_to_nibbles(0xF000)
-        self.assertEqual(result, [0xF, 0x0, 0x0, 0x0])
+        self.assertTupleEqual(result, (0xF, 0x0, 0x0, 0x0))
 
         result = split_16bit_value_to_nibbles(0x000F)
-        self.assertEqual(result, [0x0, 0x0, 0x0, 0xF])
+        self.assertTupleEqual(result, (0x0, 0x0, 0x0, 0xF))
 
         # Error case
         with self.assertRaises(ValueError) as context:
@@ -507,24 +641,24 @@ class TestByteManipulations(unittest.TestCase):
         """Test splitting 32-bit value into 8 nibbles."""
         # Normal case
         result = split_32bit_value_to_nibbles(0x12345678)
-        self.assertEqual(result, [0x1, 0x2, 0x3, 0x4, 0x5, 0x6, 0x7, 0x8])
+        self.assertTupleEqual(result, (0x1, 0x2, 0x3, 0x4, 0x5, 0x6, 0x7, 0x8))
 
         # Maximum value
         result = split_32bit_value_to_nibbles(0xFFFFFFFF)
-        self.assertEqual(result, [0xF] * 8)
+        self.assertTupleEqual(result, (0xF,) * 8)
 
         # Minimum value
         result = split_32bit_value_to_nibbles(0x00000000)
-        self.assertEqual(result, [0x0] * 8)
+        self.assertTupleEqual(result, (0x0,) * 8)
 
         # Edge cases
         result = split_32bit_value_to_nibbles(0xF0000000)
-        expected = [0xF] + [0x0] * 7
-        self.assertEqual(result, expected)
+        expected = (0xF,) + (0x0,) * 7
+        self.assertTupleEqual(result, expected)
 
         result = split_32bit_value_to_nibbles(0x0000000F)
-        expected = [0x0] * 7 + [0xF]
-        self.assertEqual(result, expected)
+        expected = (0x0,) * 7 + (0xF,)
+        self.assertTupleEqual(result, expected)
 
         # Error cases
         with self.assertRaises(ValueError) as context:
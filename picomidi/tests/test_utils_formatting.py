@@ -0,0 +1,31 @@
+"""
+Unit tests for picomidi.utils.formatting module.
+
+Tests cover:
+- Formatting bytes with empty, single-character and longer separators
+"""
+
+import unittest
+
+from picomidi.utils.formatting import format_bytes
+
+
+class TestFormatBytes(unittest.TestCase):
+    """Test format_bytes"""
+
+    def test_separators(self):
+        """Test every kind of separator gives the same digits"""
+        data = b"\x01\xab"
+        for separator, expected in (
+            ("", "01AB"),
+            (" ", "01 AB"),
+            ("·", "01·AB"),
+            (", ", "01, AB"),
+        ):
+            with self.subTest(separator=separator):
+                self.assertEqual(format_bytes(data, separator), expected)
+                self.assertEqual(format_bytes(list(data), separator), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
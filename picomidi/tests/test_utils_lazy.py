@@ -0,0 +1,37 @@
+"""
+Unit tests for picomidi.utils.lazy module.
+
+Tests cover:
+- Deprecated shims warning on first access only
+- Unknown names raising AttributeError
+"""
+
+import importlib
+import unittest
+import warnings
+
+from picomidi.messages.program_change import ProgramChange
+
+
+class TestLazyAttributes(unittest.TestCase):
+    """Test lazy_attributes through the deprecated shim packages"""
+
+    def test_shim_warns_once(self):
+        """Test the first access warns and later lookups find the cached name"""
+        pc = importlib.reload(importlib.import_module("picomidi.pc"))
+        self.assertIn("ProgramChange", dir(pc))
+        with self.assertWarns(DeprecationWarning):
+            self.assertIs(pc.ProgramChange, ProgramChange)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertIs(pc.ProgramChange, ProgramChange)
+
+    def test_unknown_name(self):
+        """Test names outside the lazy imports raise AttributeError"""
+        messages = importlib.import_module("picomidi.messages")
+        with self.assertRaises(AttributeError):
+            messages.NotAMessage
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for picomidi.utils.timing module.
+
+Tests cover:
+- TempoContext conversions against the standalone functions
+- TempoContext validation
+- Bulk and tempo-map tick conversions
+"""
+
+import unittest
+
+from picomidi.utils.timing import (
+    TempoContext,
+    apply_tempo_map,
+    seconds_to_ticks,
+    ticks_to_seconds,
+    ticks_to_seconds_with_tempo,
+    ticks_to_seconds_with_tempo_many,
+)
+
+
+class TestTempoContext(unittest.TestCase):
+    """Test TempoContext"""
+
+    def test_ticks_to_seconds_matches_functions(self):
+        """Test conversion to seconds agrees with ticks_to_seconds"""
+        context = TempoContext(120, 480)
+        for ticks in (0, 1, 240, 480, 1920, 123457):
+            with self.subTest(ticks=ticks):
+                self.assertAlmostEqual(
+                    context.ticks_to_seconds(ticks), ticks_to_seconds(ticks, 480, 120)
+                )
+
+    def test_seconds_to_ticks(self):
+        """Test conversion to ticks"""
+        context = TempoContext(120, 480)
+        self.assertEqual(context.seconds_to_ticks(0.5), seconds_to_ticks(0.5, 480, 120))
+        self.assertEqual(context.seconds_to_ticks(2.0), 1920)
+
+    def test_from_tempo(self):
+        """Test construction from microseconds per quarter note"""
+        context = TempoContext.from_tempo(500000, 96)
+        self.assertAlmostEqual(
+            context.ticks_to_seconds(96), ticks_to_seconds_with_tempo(96, 500000, 96)
+        )
+
+    def test_invalid_arguments(self):
+        """Test non-positive tempo or resolution is rejected"""
+        for args in ((0, 480), (-1, 480), (120, 0)):
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    TempoContext(*args)
+        with self.assertRaises(ValueError):
+            TempoContext.from_tempo(0, 480)
+
+
+class TestBulkTickConversion(unittest.TestCase):
+    """Test bulk and tempo-map tick conversions"""
+
+    def test_ticks_to_seconds_with_tempo_many(self):
+        """Test bulk conversion matches the single-value function exactly"""
+        ticks = [0, 1, 240, 480, 12345]
+        self.assertListEqual(
+            ticks_to_seconds_with_tempo_many(ticks, 600000, 480),
+            [ticks_to_seconds_with_tempo(tick, 600000, 480) for tick in ticks],
+        )
+
+    def test_apply_tempo_map(self):
+        """Test events are timed by the tempo active at their tick"""
+        # 120 BPM (default) for the first beat, then one second per beat
+        seconds = apply_tempo_map([0, 480, 960, 240], [480], [1000000], 480)
+        self.assertListEqual(seconds, [0.0, 0.5, 1.5, 0.25])
+
+    def test_apply_tempo_map_change_at_zero(self):
+        """Test a tempo change at tick 0 replaces the default tempo"""
+        self.assertListEqual(apply_tempo_map([480], [0], [250000], 480), [0.25])
+
+    def test_apply_tempo_map_length_mismatch(self):
+        """Test mismatched tempo map columns are rejected"""
+        with self.assertRaises(ValueError):
+            apply_tempo_map([0], [0, 480], [500000], 480)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,12 @@
 MIDI Utility Functions
 """
 
-from picomidi.utils import conversion, formatting, timing, validation
+from picomidi.utils import conversion, formatting, lazy, timing, validation
 
 __all__ = [
     "conversion",
     "validation",
     "formatting",
     "timing",
+    "lazy",
 ]
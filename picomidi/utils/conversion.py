@@ -4,11 +4,26 @@ MIDI Value Conversion Utilities
 This module provides functions for converting between different
 MIDI value representations (7-bit, 14-bit, etc.) and various
 byte manipulation operations.
+
+For many values at once, prefer the ``*_many`` bulk functions. When a
+scalar helper must be called in a tight loop, bind it to a local name
+first (e.g. ``combine = combine_7bit_msb_lsb``) so each call skips the
+global lookup.
 """
 
-from typing import List
+import struct
+from typing import Callable, Iterable, List, Sequence
+
+from picomidi.core.bitmask import FULL_BYTE, LOW_4_BITS, LOW_7_BITS, WORD
+from picomidi.values import MaxValues
+
+_FOURTEEN_BIT = MaxValues.FOURTEEN_BIT  # 0x3FFF, also the 14-bit mask
+
+# Big-endian unsigned 16-bit layout (MSB, LSB), bound once so packing skips the lookup
+_PACK_UINT16 = struct.Struct(">H").pack
 
-from picomidi.core.bitmask import BitMask
+# (high nibble, low nibble) of every byte value, indexed by byte
+_NIBBLES = tuple((byte >> 4, byte & LOW_4_BITS) for byte in range(256))
 
 
 def combine_7bit_msb_lsb(msb: int, lsb: int) -> int:
@@ -21,9 +36,7 @@ def combine_7bit_msb_lsb(msb: int, lsb: int) -> int:
     :param lsb: Least significant byte (0-127)
     :return: Combined 14-bit value (0-16383)
     """
-    msb = msb & BitMask.LOW_7_BITS
-    lsb = lsb & BitMask.LOW_7_BITS
-    return (msb << 7) | lsb
+    return ((msb & LOW_7_BITS) << 7) | (lsb & LOW_7_BITS)
 
 
 def split_14bit_to_7bit(value: int) -> tuple[int, int]:
@@ -34,12 +47,69 @@ def split_14bit_to_7bit(value: int) -> tuple[int, int]:
     :return: Tuple of (msb, lsb) where each is 0-127
              MSB contains bits 13-7, LSB contains bits 6-0
     """
-    value = value & 0x3FFF  # Ensure 14-bit max
-    msb = (value >> 7) & BitMask.LOW_7_BITS  # High 7 bits
-    lsb = value & BitMask.LOW_7_BITS  # Low 7 bits
+    value = value & _FOURTEEN_BIT  # Ensure 14-bit max
+    msb = (value >> 7) & LOW_7_BITS  # High 7 bits
+    lsb = value & LOW_7_BITS  # Low 7 bits
     return msb, lsb
 
 
+def split_14bit_to_7bit_many(values: Sequence[int]) -> bytes:
+    """
+    Split many 14-bit values into interleaved 7-bit (MSB, LSB) pairs in one pass.
+
+    The bulk counterpart of `split_14bit_to_7bit()` for pitch bend streams and
+    parameter dumps: the MSB and LSB columns are each built in one
+    comprehension and written with an extended-slice assignment, instead of
+    creating a tuple per value.
+
+    :param values: Sequence of 14-bit values (each masked to 0-16383)
+    :return: Bytes of length 2 * len(values), [MSB, LSB] per value
+    """
+    out = bytearray(2 * len(values))
+    out[0::2] = bytes([(value >> 7) & LOW_7_BITS for value in values])
+    out[1::2] = bytes([value & LOW_7_BITS for value in values])
+    return bytes(out)
+
+
+def combine_7bit_msb_lsb_many(data: bytes) -> List[int]:
+    """
+    Combine consecutive 7-bit (MSB, LSB) pairs into 14-bit values.
+
+    The bulk counterpart of `combine_7bit_msb_lsb()` and the inverse of
+    `split_14bit_to_7bit_many()`: the MSB and LSB columns are read with
+    extended slices and combined pairwise.
+
+    :param data: Bytes-like object whose length is a multiple of 2
+    :return: List of combined 14-bit values (0-16383)
+    :raises ValueError: If the length of data is odd
+    """
+    if len(data) % 2:
+        raise ValueError(f"Data length must be a multiple of 2, got {len(data)}")
+    return [
+        ((msb & LOW_7_BITS) << 7) | (lsb & LOW_7_BITS) for msb, lsb in zip(data[0::2], data[1::2])
+    ]
+
+
+def safe_int(value) -> int:
+    """
+    Convert an int, enum, float or numeric string to int for formatting.
+
+    Enum members (and value objects such as Note) are converted through their
+    value, recursively.
+
+    :param value: Value to convert
+    :return: Integer value, or 0 if it cannot be converted
+    """
+    if isinstance(value, int):
+        return value
+    if hasattr(value, "value") and not isinstance(value, type):  # Enums, but not enum classes
+        return safe_int(value.value)
+    try:
+        return int(float(value))  # Handle floats and strings
+    except (ValueError, TypeError):
+        return 0
+
+
 def clamp_midi_value(value: int) -> int:
     """
     Clamp value to valid MIDI range (0-127).
@@ -47,7 +117,8 @@ def clamp_midi_value(value: int) -> int:
     :param value: Input value
     :return: Clamped value (0-127)
     """
-    return max(0, min(127, value))
+    # Same result as max(0, min(LOW_7_BITS, value)), without the two builtin calls
+    return (value if value > 0 else 0) if value < LOW_7_BITS else LOW_7_BITS
 
 
 def clamp_14bit_value(value: int) -> int:
@@ -57,7 +128,7 @@ def clamp_14bit_value(value: int) -> int:
     :param value: Input value
     :return: Clamped value (0-16383)
     """
-    return max(0, min(0x3FFF, value))
+    return (value if value > 0 else 0) if value < _FOURTEEN_BIT else _FOURTEEN_BIT
 
 
 def signed_to_unsigned_14bit(value: int) -> int:
@@ -86,6 +157,31 @@ def unsigned_to_signed_14bit(value: int) -> int:
     return value
 
 
+def signed_to_unsigned_14bit_many(values: Iterable[int]) -> List[int]:
+    """
+    Convert many signed 14-bit values to unsigned in one pass.
+
+    Same result per element as `signed_to_unsigned_14bit()`, for whole
+    pitch bend tracks.
+
+    :param values: Iterable of signed values (-8192 to 8191)
+    :return: List of unsigned values (0-16383)
+    """
+    return [0x4000 + value if value < 0 else value for value in values]
+
+
+def unsigned_to_signed_14bit_many(values: Iterable[int]) -> List[int]:
+    """
+    Convert many unsigned 14-bit values to signed in one pass.
+
+    Same result per element as `unsigned_to_signed_14bit()`.
+
+    :param values: Iterable of unsigned values (0-16383)
+    :return: List of signed values (-8192 to 8191)
+    """
+    return [value - 0x4000 if value >= 0x4000 else value for value in values]
+
+
 # ============================================================================
 # Value Range Conversions
 # ============================================================================
@@ -113,6 +209,30 @@ def midi_value_to_ms(midi_value: int, min_time: int = 10, max_time: int = 1000)
     return ms_time
 
 
+def midi_value_to_ms_many(
+    midi_values: Iterable[int], min_time: int = 10, max_time: int = 1000
+) -> List[float]:
+    """
+    Convert many MIDI values (0-127) to time values in milliseconds.
+
+    The bulk counterpart of `midi_value_to_ms()` for automation curves: the
+    range is checked once, with results identical to calling
+    `midi_value_to_ms()` per value.
+
+    :param midi_values: Iterable of MIDI CC values (0-127)
+    :param min_time: Minimum time in milliseconds (default: 10 ms)
+    :param max_time: Maximum time in milliseconds (default: 1000 ms)
+    :return: List of time values in milliseconds
+    :raises ValueError: If min_time >= max_time
+    """
+    if min_time >= max_time:
+        raise ValueError("min_time must be less than max_time")
+
+    time_range = max_time - min_time
+    clamp = clamp_midi_value
+    return [min_time + (clamp(v) / 127.0) * time_range for v in midi_values]
+
+
 def ms_to_midi_value(ms_time: float, min_time: int = 10, max_time: int = 1000) -> int:
     """
     Convert a time value in milliseconds to a MIDI value (0-127).
@@ -125,6 +245,9 @@ def ms_to_midi_value(ms_time: float, min_time: int = 10, max_time: int = 1000) -
     time_range = max_time - min_time
     if time_range == 0:
         return 0
+    # Float division is kept on purpose: exact integer math would round some
+    # boundary values up (e.g. 200 ms in 100-200 ms gives 127, not 126), so
+    # integer and float inputs would no longer agree
     conversion_factor = time_range / 127.0
     midi_value = int((ms_time - min_time) / conversion_factor)
     return clamp_midi_value(midi_value)
@@ -151,6 +274,28 @@ def fraction_to_midi_value(
     return clamp_midi_value(midi_value)
 
 
+def fraction_to_midi_value_many(
+    fractional_values: Sequence[float], minimum: float = 0.0, maximum: float = 1.0
+) -> List[int]:
+    """
+    Convert many fractional values to MIDI CC values (0-127).
+
+    The bulk counterpart of `fraction_to_midi_value()`, with results
+    identical to calling it per value.
+
+    :param fractional_values: Sequence of fractional values between minimum and maximum
+    :param minimum: Minimum possible fractional value (default: 0.0)
+    :param maximum: Maximum possible fractional value (default: 1.0)
+    :return: List of corresponding MIDI values (0-127)
+    """
+    value_range = maximum - minimum
+    if value_range == 0:
+        return [0] * len(fractional_values)
+    conversion_factor = value_range / 127.0
+    clamp = clamp_midi_value
+    return [clamp(int((v - minimum) / conversion_factor)) for v in fractional_values]
+
+
 def midi_value_to_fraction(midi_value: int, minimum: float = 0.0, maximum: float = 1.0) -> float:
     """
     Convert a MIDI value (0-127) to a fractional value (0.0-1.0).
@@ -168,130 +313,280 @@ def midi_value_to_fraction(midi_value: int, minimum: float = 0.0, maximum: float
     return float((midi_value * conversion_factor) + minimum)
 
 
+def make_midi_value_to_ms(min_time: int = 10, max_time: int = 1000) -> Callable[[int], float]:
+    """
+    Create a `midi_value_to_ms()` specialized for a fixed time range.
+
+    The range is checked and its width computed once, for parameters that
+    are set per patch but mapped per CC event. The returned function gives
+    results identical to `midi_value_to_ms(midi_value, min_time, max_time)`.
+
+    :param min_time: Minimum time in milliseconds (default: 10 ms)
+    :param max_time: Maximum time in milliseconds (default: 1000 ms)
+    :return: Function mapping a MIDI CC value (0-127) to milliseconds
+    :raises ValueError: If min_time >= max_time
+    """
+    if min_time >= max_time:
+        raise ValueError("min_time must be less than max_time")
+    time_range = max_time - min_time
+    clamp = clamp_midi_value
+
+    def midi_value_to_ms_in_range(midi_value: int) -> float:
+        return min_time + (clamp(midi_value) / 127.0) * time_range
+
+    return midi_value_to_ms_in_range
+
+
+def make_ms_to_midi_value(min_time: int = 10, max_time: int = 1000) -> Callable[[float], int]:
+    """
+    Create a `ms_to_midi_value()` specialized for a fixed time range.
+
+    The returned function gives results identical to
+    `ms_to_midi_value(ms_time, min_time, max_time)`.
+
+    :param min_time: Minimum time in milliseconds (default: 10 ms)
+    :param max_time: Maximum time in milliseconds (default: 1000 ms)
+    :return: Function mapping milliseconds to a MIDI value (0-127)
+    """
+    time_range = max_time - min_time
+    if time_range == 0:
+        return lambda ms_time: 0
+    conversion_factor = time_range / 127.0
+    clamp = clamp_midi_value
+
+    def ms_to_midi_value_in_range(ms_time: float) -> int:
+        return clamp(int((ms_time - min_time) / conversion_factor))
+
+    return ms_to_midi_value_in_range
+
+
+def make_fraction_to_midi_value(
+    minimum: float = 0.0, maximum: float = 1.0
+) -> Callable[[float], int]:
+    """
+    Create a `fraction_to_midi_value()` specialized for a fixed range.
+
+    The returned function gives results identical to
+    `fraction_to_midi_value(fractional_value, minimum, maximum)`.
+
+    :param minimum: Minimum possible fractional value (default: 0.0)
+    :param maximum: Maximum possible fractional value (default: 1.0)
+    :return: Function mapping a fractional value to a MIDI value (0-127)
+    """
+    value_range = maximum - minimum
+    if value_range == 0:
+        return lambda fractional_value: 0
+    conversion_factor = value_range / 127.0
+    clamp = clamp_midi_value
+
+    def fraction_to_midi_value_in_range(fractional_value: float) -> int:
+        return clamp(int((fractional_value - minimum) / conversion_factor))
+
+    return fraction_to_midi_value_in_range
+
+
+def make_midi_value_to_fraction(
+    minimum: float = 0.0, maximum: float = 1.0
+) -> Callable[[int], float]:
+    """
+    Create a `midi_value_to_fraction()` specialized for a fixed range.
+
+    The returned function gives results identical to
+    `midi_value_to_fraction(midi_value, minimum, maximum)`.
+
+    :param minimum: Minimum possible fractional value (default: 0.0)
+    :param maximum: Maximum possible fractional value (default: 1.0)
+    :return: Function mapping a MIDI CC value (0-127) to a fractional value
+    """
+    conversion_factor = (maximum - minimum) / 127.0
+    clamp = clamp_midi_value
+
+    def midi_value_to_fraction_in_range(midi_value: int) -> float:
+        return float((clamp(midi_value) * conversion_factor) + minimum)
+
+    return midi_value_to_fraction_in_range
+
+
 # ============================================================================
 # Byte Manipulation Utilities
 # ============================================================================
 
 
-def split_16bit_value_to_bytes(value: int) -> List[int]:
+def split_16bit_value_to_bytes(value: int) -> bytes:
     """
-    Split a 16-bit integer into two 8-bit bytes: [MSB, LSB].
+    Split a 16-bit integer into two 8-bit bytes: MSB, LSB.
+
+    The result is packed in one struct call and can be appended directly to
+    a MIDI byte stream; it still unpacks as ``msb, lsb = ...``.
 
     :param value: 16-bit integer (0-65535)
-    :return: List of [Most Significant Byte, Least Significant Byte]
+    :return: Bytes of (Most Significant Byte, Least Significant Byte)
     :raises ValueError: If value is not in valid 16-bit range
     """
-    if not (0 <= value <= BitMask.WORD):
+    if not (0 <= value <= WORD):
         raise ValueError("Value must be a 16-bit integer (0-65535)")
-    msb = (value >> 8) & BitMask.FULL_BYTE
-    lsb = value & BitMask.FULL_BYTE
-    return [msb, lsb]
+    return _PACK_UINT16(value)
 
 
-def split_8bit_value_to_nibbles(value: int) -> List[int]:
+def split_8bit_value_to_nibbles(value: int) -> tuple[int, int]:
     """
     Split an 8-bit integer into two 4-bit nibbles.
 
     :param value: 8-bit integer (0-255)
-    :return: List of two 4-bit values [upper_nibble, lower_nibble]
+    :return: Tuple of two 4-bit values (upper_nibble, lower_nibble)
     :raises ValueError: If value is not in valid 8-bit range
     """
-    if not (0 <= value <= BitMask.FULL_BYTE):
+    if not (0 <= value <= FULL_BYTE):
         raise ValueError("Value must be an 8-bit integer (0-255)")
-    return [(value >> 4) & BitMask.LOW_4_BITS, value & BitMask.LOW_4_BITS]
+    return _NIBBLES[value]
 
 
-def split_16bit_value_to_nibbles(value: int) -> List[int]:
+def split_16bit_value_to_nibbles(value: int) -> tuple[int, int, int, int]:
     """
     Split a 16-bit integer into exactly 4 nibbles (4-bit values).
 
     :param value: Non-negative integer (will be treated as 16-bit)
-    :return: List of 4 nibbles [MSB nibble, ..., LSB nibble]
+    :return: Tuple of 4 nibbles (MSB nibble, ..., LSB nibble)
     :raises ValueError: If value is negative
     """
     if value < 0:
         raise ValueError("Value must be a non-negative integer")
 
-    nibbles = []
-    for i in range(4):
-        nibbles.append((value >> (4 * (3 - i))) & BitMask.LOW_4_BITS)
-    return nibbles
+    return _NIBBLES[(value >> 8) & FULL_BYTE] + _NIBBLES[value & FULL_BYTE]
 
 
-def split_32bit_value_to_nibbles(value: int) -> List[int]:
+def split_32bit_value_to_nibbles(value: int) -> tuple[int, ...]:
     """
     Split a 32-bit integer into 8 nibbles (4-bit values).
 
     Useful for Roland SysEx DT1 data encoding.
 
     :param value: 32-bit unsigned integer (0-4294967295)
-    :return: List of 8 nibbles [MSB nibble, ..., LSB nibble]
+    :return: Tuple of 8 nibbles (MSB nibble, ..., LSB nibble)
     :raises ValueError: If value is not in valid 32-bit range
     """
     max_32bit = 0xFFFFFFFF
     if value < 0 or value > max_32bit:
         raise ValueError("Value must be a 32-bit unsigned integer (0-4294967295)")
 
-    return [(value >> (4 * (7 - i))) & BitMask.LOW_4_BITS for i in range(8)]
+    # One table lookup per byte, concatenating the nibble pairs
+    return (
+        _NIBBLES[value >> 24]
+        + _NIBBLES[(value >> 16) & FULL_BYTE]
+        + _NIBBLES[(value >> 8) & FULL_BYTE]
+        + _NIBBLES[value & FULL_BYTE]
+    )
 
 
-def join_nibbles_to_16bit(nibbles: List[int]) -> int:
+def join_nibbles_to_16bit(nibbles: Sequence[int]) -> int:
     """
-    Combine a list of 4 nibbles (4-bit values) into a 16-bit integer.
+    Combine a sequence of 4 nibbles (4-bit values) into a 16-bit integer.
 
-    :param nibbles: List of exactly 4 nibbles (each 0-15)
+    :param nibbles: Sequence (e.g. list or tuple) of exactly 4 nibbles (each 0-15)
     :return: 16-bit integer value
     :raises ValueError: If nibbles list is not length 4 or contains invalid values
     """
     if len(nibbles) != 4:
         raise ValueError("Exactly 4 nibbles are required to form a 16-bit integer")
 
-    if any(n < 0 or n > BitMask.LOW_4_BITS for n in nibbles):
+    a, b, c, d = nibbles
+    # One check for all nibbles: any value above 15, or any negative value (whose
+    # high bits are all set), leaves bits above the low 4 set in the OR of them all
+    if (a | b | c | d) >> 4:
         raise ValueError("Each nibble must be a 4-bit value (0-15)")
 
-    value = 0
-    for nibble in nibbles:
-        value = (value << 4) | nibble
-
-    return value
+    return (a << 12) | (b << 8) | (c << 4) | d
 
 
-def join_nibbles_to_32bit(nibbles: List[int]) -> int:
+def join_nibbles_to_32bit(nibbles: Sequence[int]) -> int:
     """
-    Combine a list of 8 nibbles (4-bit values) into a 32-bit integer.
+    Combine a sequence of 8 nibbles (4-bit values) into a 32-bit integer.
 
-    :param nibbles: List of exactly 8 nibbles (each 0-15)
+    :param nibbles: Sequence (e.g. list or tuple) of exactly 8 nibbles (each 0-15)
     :return: 32-bit integer value
     :raises ValueError: If nibbles list is not length 8 or contains invalid values
     """
     if len(nibbles) != 8:
         raise ValueError("Exactly 8 nibbles are required to form a 32-bit integer")
 
-    if any(n < 0 or n > BitMask.LOW_4_BITS for n in nibbles):
+    a, b, c, d, e, f, g, h = nibbles
+    if (a | b | c | d | e | f | g | h) >> 4:
         raise ValueError("Each nibble must be a 4-bit value (0-15)")
 
-    value = 0
-    for nibble in nibbles:
-        value = (value << 4) | nibble
+    return (a << 28) | (b << 24) | (c << 20) | (d << 16) | (e << 12) | (f << 8) | (g << 4) | h
 
-    return value
 
-
-def encode_14bit_to_7bit_midi_bytes(value: int) -> List[int]:
+def encode_14bit_to_7bit_midi_bytes(value: int) -> bytes:
     """
     Encode a 14-bit integer into two 7-bit MIDI-safe bytes.
 
     MIDI SysEx requires all data bytes to be in the range 0x00-0x7F.
     This function splits a 14-bit value into MSB and LSB, both 7-bit safe.
+    The result can be appended directly to a MIDI byte buffer.
 
     :param value: 14-bit integer (0-16383)
-    :return: List of [MSB, LSB] where each is 0-127
+    :return: Bytes of (MSB, LSB) where each is 0-127
     :raises ValueError: If value is not in valid 14-bit range
     """
-    if not (0 <= value <= 0x3FFF):
+    if not (0 <= value <= _FOURTEEN_BIT):
         raise ValueError("Value must be a 14-bit integer (0-16383)")
 
-    lsb = value & BitMask.LOW_7_BITS  # Lower 7 bits
-    msb = (value >> 7) & BitMask.LOW_7_BITS  # Upper 7 bits
+    # value is known to be 14-bit here, so the upper 7 bits need no mask
+    return bytes((value >> 7, value & LOW_7_BITS))
+
+
+def encode_14bit_to_7bit_midi_bytes_many(values: Sequence[int]) -> bytes:
+    """
+    Encode many 14-bit integers into 7-bit MIDI-safe byte pairs in one pass.
 
-    return [msb, lsb]
+    The bulk counterpart of `encode_14bit_to_7bit_midi_bytes()` for pitch bend
+    and NRPN streams: the range is checked once with min() and max(), then
+    the pairs are built by `split_14bit_to_7bit_many()`.
+
+    :param values: Sequence of 14-bit integers (0-16383)
+    :return: Bytes of length 2 * len(values), [MSB, LSB] per value, each 0-127
+    :raises ValueError: If any value is not in valid 14-bit range
+    """
+    if values and (min(values) < 0 or max(values) > _FOURTEEN_BIT):
+        raise ValueError("Value must be a 14-bit integer (0-16383)")
+    return split_14bit_to_7bit_many(values)
+
+
+def encode_nbit_stream(values: Sequence[int], bits_per_value: int) -> bytes:
+    """
+    Pack unsigned n-bit integers into a stream of 7-bit MIDI-safe bytes.
+
+    The values are laid end to end, most significant bit first, and cut into
+    7-bit bytes; the last byte is padded with zero bits on the right. The
+    output has ceil(len(values) * bits_per_value / 7) bytes. For 14-bit
+    values this gives the same bytes as `encode_14bit_to_7bit_midi_bytes_many()`.
+
+    :param values: Sequence of unsigned integers, each below 2 ** bits_per_value
+    :param bits_per_value: Width of each value in bits (1 or more)
+    :return: Bytes with each value 0-127
+    :raises ValueError: If bits_per_value is not positive or a value does not fit in it
+    """
+    if bits_per_value < 1:
+        raise ValueError(f"Bits per value must be positive, got {bits_per_value}")
+    if values and (min(values) < 0 or max(values) >> bits_per_value):
+        raise ValueError(f"Each value must be an unsigned integer of {bits_per_value} bits")
+    if bits_per_value == 7:
+        return bytes(values)
+    if bits_per_value == 14:
+        return split_14bit_to_7bit_many(values)
+
+    # Shift each value into a bit accumulator, emitting every complete 7 bits
+    out = bytearray()
+    append = out.append
+    accumulator = 0
+    pending_bits = 0
+    for value in values:
+        accumulator = (accumulator << bits_per_value) | value
+        pending_bits += bits_per_value
+        while pending_bits >= 7:
+            pending_bits -= 7
+            append((accumulator >> pending_bits) & LOW_7_BITS)
+        accumulator &= (1 << pending_bits) - 1
+    if pending_bits:
+        append((accumulator << (7 - pending_bits)) & LOW_7_BITS)
+    return bytes(out)
@@ -9,6 +9,12 @@ from typing import Iterable, List
 
 from picomidi.core.midistatus import MidiStatus
 from picomidi.message.base import Message
+from picomidi.utils.conversion import safe_int
+
+# Two-digit uppercase hex string for every byte value, indexed by value
+_HEX = tuple(f"{value:02X}" for value in range(256))
+# Unpadded uppercase hex digits of every byte value, indexed by value
+_HEX_DIGITS = tuple(f"{value:X}" for value in range(256))
 
 
 def format_message(message: Message, include_bytes: bool = True) -> str:
@@ -29,12 +35,30 @@ def format_bytes(data: bytes, separator: str = " ", prefix: str = "") -> str:
     """
     Format raw bytes as hexadecimal string.
 
+    Bytes-like input, and lists or tuples of ints in the 0-255 range, are
+    formatted by bytes.hex() (single ASCII character or empty separator) or
+    through a lookup table; anything else is formatted value by value.
+
     :param data: Bytes to format
     :param separator: String to separate hex bytes
     :param prefix: Optional prefix (e.g., "0x")
     :return: Formatted hex string
     """
-    hex_str = separator.join(f"{b:02X}" for b in data)
+    if isinstance(data, (list, tuple)):
+        try:
+            data = bytes(data)
+        except (TypeError, ValueError):
+            pass  # Not plain byte values, formatted one by one below
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        if len(separator) == 1 and separator.isascii():
+            # bytes.hex() only accepts a single ASCII character separator
+            hex_str = data.hex(separator).upper()
+        elif not separator:
+            hex_str = data.hex().upper()
+        else:
+            hex_str = separator.join(map(_HEX.__getitem__, data))
+    else:
+        hex_str = separator.join(f"{b:02X}" for b in data)
     return f"{prefix}{hex_str}" if prefix else hex_str
 
 
@@ -46,7 +70,8 @@ def format_message_list(messages: List[Message], separator: str = "\n") -> str:
     :param separator: String to separate messages
     :return: Formatted string
     """
-    return separator.join(format_message(msg) for msg in messages)
+    # Same text as format_message(msg) per message, built in one f-string each
+    return separator.join([f"{msg!r} [{msg.to_hex_string()}]" for msg in messages])
 
 
 def get_message_type_name(status: int) -> str:
@@ -56,41 +81,8 @@ def get_message_type_name(status: int) -> str:
     :param status: Status byte value
     :return: Message type name
     """
-    if MidiStatus.is_channel_voice(status):
-        msg_type = MidiStatus.get_message_type(status)
-        type_names = {
-            MidiStatus.NOTE_OFF: "Note Off",
-            MidiStatus.NOTE_ON: "Note On",
-            MidiStatus.POLY_AFTERTOUCH: "Poly Aftertouch",
-            MidiStatus.CONTROL_CHANGE: "Control Change",
-            MidiStatus.PROGRAM_CHANGE: "Program Change",
-            MidiStatus.CHANNEL_AFTERTOUCH: "Channel Aftertouch",
-            MidiStatus.PITCH_BEND: "Pitch Bend",
-        }
-        return type_names.get(msg_type, f"Unknown Channel Voice (0x{msg_type:02X})")
-
-    if MidiStatus.is_system_common(status):
-        type_names = {
-            MidiStatus.SYSTEM_EXCLUSIVE: "System Exclusive",
-            MidiStatus.MIDI_TIME_CODE: "MIDI Time Code",
-            MidiStatus.SONG_POSITION: "Song Position",
-            MidiStatus.SONG_SELECT: "Song Select",
-            MidiStatus.TUNE_REQUEST: "Tune Request",
-            MidiStatus.END_OF_EXCLUSIVE: "End of Exclusive",
-        }
-        return type_names.get(status, f"Unknown System Common (0x{status:02X})")
-
-    if MidiStatus.is_system_realtime(status):
-        type_names = {
-            MidiStatus.TIMING_CLOCK: "Timing Clock",
-            MidiStatus.START: "Start",
-            MidiStatus.CONTINUE: "Continue",
-            MidiStatus.STOP: "Stop",
-            MidiStatus.ACTIVE_SENSING: "Active Sensing",
-            MidiStatus.SYSTEM_RESET: "System Reset",
-        }
-        return type_names.get(status, f"Unknown System Realtime (0x{status:02X})")
-
+    if 0 <= status <= 0xFF:
+        return _MESSAGE_TYPE_NAMES[status]
     return f"Unknown (0x{status:02X})"
 
 
@@ -101,20 +93,15 @@ def format_message_to_hex_string(message: Iterable[int]) -> str:
     :param message: Iterable of integers (byte values)
     :return: Space-separated hex string (e.g., "F0 41 10 00 00 00 0E F7")
     """
-
-    # Safely convert to int for formatting (handles strings, enums, floats, etc.)
-    def safe_int(val):
-        if isinstance(val, int):
-            return val
-        if hasattr(val, "value"):  # Handle enums
-            enum_val = val.value
-            return int(enum_val) if not isinstance(enum_val, int) else enum_val
+    if isinstance(message, (list, tuple, bytes, bytearray, memoryview)):
         try:
-            return int(float(val))  # Handle floats and strings
-        except (ValueError, TypeError):
-            return 0
-
-    return " ".join(f"{safe_int(x):02X}" for x in message)
+            # Plain byte values, the common case, are formatted in one call
+            return bytes(message).hex(" ").upper()
+        except (TypeError, ValueError):
+            pass
+    return " ".join(
+        _HEX[value] if 0 <= value <= 0xFF else f"{value:02X}" for value in map(safe_int, message)
+    )
 
 
 def int_to_hex(value: int) -> str:
@@ -126,4 +113,59 @@ def int_to_hex(value: int) -> str:
     :param value: Integer value to convert
     :return: Hexadecimal string representation (e.g., "FF" for 255)
     """
+    if 0 <= value <= 0xFF:
+        return _HEX_DIGITS[value]
     return hex(value)[2:].upper()
+
+
+# Message type names, keyed by message type (channel voice) or status byte (system)
+_CHANNEL_VOICE_NAMES = {
+    MidiStatus.NOTE_OFF: "Note Off",
+    MidiStatus.NOTE_ON: "Note On",
+    MidiStatus.POLY_AFTERTOUCH: "Poly Aftertouch",
+    MidiStatus.CONTROL_CHANGE: "Control Change",
+    MidiStatus.PROGRAM_CHANGE: "Program Change",
+    MidiStatus.CHANNEL_AFTERTOUCH: "Channel Aftertouch",
+    MidiStatus.PITCH_BEND: "Pitch Bend",
+}
+_SYSTEM_COMMON_NAMES = {
+    MidiStatus.SYSTEM_EXCLUSIVE: "System Exclusive",
+    MidiStatus.MIDI_TIME_CODE: "MIDI Time Code",
+    MidiStatus.SONG_POSITION: "Song Position",
+    MidiStatus.SONG_SELECT: "Song Select",
+    MidiStatus.TUNE_REQUEST: "Tune Request",
+    MidiStatus.END_OF_EXCLUSIVE: "End of Exclusive",
+}
+_SYSTEM_REALTIME_NAMES = {
+    MidiStatus.TIMING_CLOCK: "Timing Clock",
+    MidiStatus.START: "Start",
+    MidiStatus.CONTINUE: "Continue",
+    MidiStatus.STOP: "Stop",
+    MidiStatus.ACTIVE_SENSING: "Active Sensing",
+    MidiStatus.SYSTEM_RESET: "System Reset",
+}
+
+
+def _build_message_type_names() -> tuple:
+    """Build the 256-entry message type name table indexed by status byte."""
+    names = []
+    for status in range(256):
+        if MidiStatus.is_channel_voice(status):
+            msg_type = MidiStatus.get_message_type(status)
+            names.append(
+                _CHANNEL_VOICE_NAMES.get(msg_type, f"Unknown Channel Voice (0x{msg_type:02X})")
+            )
+        elif MidiStatus.is_system_common(status):
+            names.append(
+                _SYSTEM_COMMON_NAMES.get(status, f"Unknown System Common (0x{status:02X})")
+            )
+        elif MidiStatus.is_system_realtime(status):
+            names.append(
+                _SYSTEM_REALTIME_NAMES.get(status, f"Unknown System Realtime (0x{status:02X})")
+            )
+        else:
+            names.append(f"Unknown (0x{status:02X})")
+    return tuple(names)
+
+
+_MESSAGE_TYPE_NAMES = _build_message_type_names()
@@ -0,0 +1,43 @@
+"""
+Lazy Module Attributes
+
+This module provides the module-level __getattr__ and __dir__ (PEP 562)
+used by packages that import their public names on first access.
+"""
+
+import importlib
+import warnings
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def lazy_attributes(
+    namespace: dict, lazy_imports: Dict[str, str], deprecation: Optional[str] = None
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build a module __getattr__ and __dir__ that import names on first access.
+
+    Each name is imported from its submodule once and stored in namespace,
+    so later lookups find it directly.
+
+    :param namespace: globals() of the module being made lazy
+    :param lazy_imports: Public name -> module that defines it
+    :param deprecation: Optional DeprecationWarning message, issued on first access
+    :return: Tuple of (__getattr__, __dir__)
+    """
+    module_name = namespace["__name__"]
+
+    def __getattr__(name: str) -> object:
+        try:
+            source = lazy_imports[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        if deprecation is not None:
+            warnings.warn(deprecation, DeprecationWarning, stacklevel=2)
+        value = getattr(importlib.import_module(source), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(lazy_imports))
+
+    return __getattr__, __dir__
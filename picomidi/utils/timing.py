@@ -4,6 +4,10 @@ MIDI Timing Utilities
 This module provides functions for MIDI timing calculations,
 including tempo, BPM, ticks, and time conversions.
 """
+
+from bisect import bisect_right
+from typing import Iterable, List, Sequence
+
 from picomidi.core.tempo import MidiTempo
 
 
@@ -115,3 +119,126 @@ def seconds_to_ticks_with_tempo(seconds: float, tempo: int, ticks_per_beat: int)
     :return: Number of MIDI ticks
     """
     return int((seconds * float(MidiTempo.MICROSECONDS_PER_SECOND) / tempo) * ticks_per_beat)
+
+
+def ticks_to_seconds_with_tempo_many(
+    ticks: Iterable[int], tempo: int, ticks_per_beat: int
+) -> List[float]:
+    """
+    Convert many tick counts to seconds at one tempo.
+
+    Same result per element as ticks_to_seconds_with_tempo(), with the
+    tempo factor computed once for the whole batch.
+
+    :param ticks: Iterable of MIDI tick counts
+    :param tempo: Tempo in microseconds per quarter note
+    :param ticks_per_beat: Ticks per quarter note (TPQN)
+    :return: List of durations in seconds
+    """
+    seconds_per_beat = tempo / float(MidiTempo.MICROSECONDS_PER_SECOND)
+    return [seconds_per_beat * (tick / ticks_per_beat) for tick in ticks]
+
+
+def apply_tempo_map(
+    event_ticks: Iterable[int],
+    tempo_change_ticks: Sequence[int],
+    tempos: Sequence[int],
+    ticks_per_beat: int,
+) -> List[float]:
+    """
+    Convert absolute event ticks to absolute seconds using a tempo map.
+
+    The seconds elapsed at each tempo change are accumulated once, so each
+    event then costs a binary search and a multiply. Before the first tempo
+    change the MIDI default of 500000 microseconds per quarter note applies.
+
+    :param event_ticks: Iterable of absolute event ticks, in any order
+    :param tempo_change_ticks: Absolute ticks of the tempo changes, ascending
+    :param tempos: Tempo in microseconds per quarter note set at each change
+    :param ticks_per_beat: Ticks per quarter note (TPQN)
+    :return: List of absolute event times in seconds
+    :raises ValueError: If tempo_change_ticks and tempos differ in length
+    """
+    if len(tempo_change_ticks) != len(tempos):
+        raise ValueError(
+            f"Got {len(tempo_change_ticks)} tempo change ticks but {len(tempos)} tempos"
+        )
+    microseconds_per_second = float(MidiTempo.MICROSECONDS_PER_SECOND)
+    starts = [0]
+    start_seconds = [0.0]
+    seconds_per_tick = [MidiTempo.BPM_120_USEC / microseconds_per_second / ticks_per_beat]
+    for change_tick, tempo in zip(tempo_change_ticks, tempos):
+        start_seconds.append(start_seconds[-1] + (change_tick - starts[-1]) * seconds_per_tick[-1])
+        starts.append(change_tick)
+        seconds_per_tick.append(tempo / microseconds_per_second / ticks_per_beat)
+
+    seconds = []
+    for tick in event_ticks:
+        segment = bisect_right(starts, tick) - 1
+        seconds.append(
+            start_seconds[segment] + (tick - starts[segment]) * seconds_per_tick[segment]
+        )
+    return seconds
+
+
+class TempoContext:
+    """
+    Tick/time conversion factors for a region of constant tempo.
+
+    Build one per tempo change; each conversion is then a single multiply
+    instead of the divisions the standalone functions repeat per call.
+    Results may differ from those functions in the last bit of the float.
+    """
+
+    __slots__ = ("seconds_per_tick", "ticks_per_second")
+
+    def __init__(self, bpm: float, ticks_per_beat: int):
+        """
+        Initialize the conversion factors from a BPM.
+
+        :param bpm: Beats per minute
+        :param ticks_per_beat: Ticks per quarter note (TPQN)
+        :raises ValueError: If bpm or ticks_per_beat is not positive
+        """
+        if bpm <= 0:
+            raise ValueError(f"BPM must be positive, got {bpm}")
+        if ticks_per_beat <= 0:
+            raise ValueError(f"Ticks per beat must be positive, got {ticks_per_beat}")
+        ticks_per_minute = bpm * ticks_per_beat
+        self.seconds_per_tick = MidiTempo.SECONDS_PER_MINUTE / ticks_per_minute
+        self.ticks_per_second = ticks_per_minute / MidiTempo.SECONDS_PER_MINUTE
+
+    @classmethod
+    def from_tempo(cls, tempo: int, ticks_per_beat: int) -> "TempoContext":
+        """
+        Create the conversion factors from a tempo in microseconds per quarter note.
+
+        :param tempo: Tempo in microseconds per quarter note (e.g., 500000 for 120 BPM)
+        :param ticks_per_beat: Ticks per quarter note (TPQN)
+        :return: TempoContext for that tempo
+        :raises ValueError: If tempo or ticks_per_beat is not positive
+        """
+        if tempo <= 0:
+            raise ValueError(f"Tempo must be positive, got {tempo}")
+        return cls(microseconds_per_quarter_to_bpm(tempo), ticks_per_beat)
+
+    def ticks_to_seconds(self, ticks: int) -> float:
+        """
+        Convert MIDI ticks to seconds.
+
+        :param ticks: Number of MIDI ticks
+        :return: Time in seconds
+        """
+        return ticks * self.seconds_per_tick
+
+    def seconds_to_ticks(self, seconds: float) -> int:
+        """
+        Convert seconds to MIDI ticks.
+
+        :param seconds: Time in seconds
+        :return: Number of MIDI ticks
+        """
+        return int(seconds * self.ticks_per_second)
+
+    def __repr__(self) -> str:
+        return f"TempoContext(seconds_per_tick={self.seconds_per_tick!r})"
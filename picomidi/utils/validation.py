@@ -7,6 +7,12 @@ and ensure they are within valid ranges.
 
 from picomidi.core.bitmask import BitMask
 
+# Every valid status byte: channel voice (0x80-0xEF), system common except the
+# reserved 0xF4 and 0xF5, and system realtime (0xF8-0xFF)
+_VALID_STATUS_BYTES = frozenset(
+    (*range(0x80, 0xF0), 0xF0, 0xF1, 0xF2, 0xF3, 0xF6, 0xF7, *range(0xF8, 0x100))
+)
+
 
 def validate_note(note: int) -> bool:
     """
@@ -75,13 +81,8 @@ def validate_status_byte(status: int) -> bool:
     :param status: Status byte to validate
     :return: True if valid (0x80-0xFF, excluding reserved 0xF4, 0xF5)
     """
-    if 0x80 <= status <= 0xEF:
-        return True  # Channel voice messages
-    if status in (0xF0, 0xF1, 0xF2, 0xF3, 0xF6, 0xF7):
-        return True  # System common messages
-    if 0xF8 <= status <= 0xFF:
-        return True  # System realtime messages
-    return False
+    # One hashed membership test, whichever range the byte falls in
+    return status in _VALID_STATUS_BYTES
 
 
 def validate_14bit_value(value: int) -> bool: